@@ -0,0 +1,167 @@
+from unittest.mock import patch
+
+from common.auth import CachedTokenAuthentication, LRUCache, token_cache
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+from users.models import User
+
+
+class CachedTokenAuthenticationTest(APITestCase):
+    def setUp(self):
+        token_cache.clear()
+        cache.clear()
+        self.url_user_info = reverse("user_info")
+        self.url_sign_in = reverse("sign_in")
+        self.url_sign_out = reverse("sign_out")
+        self.email = "test@example.com"
+        self.password = "VAL1DP@sSW0Rd"
+        self.user = User.objects.create_user(
+            email=self.email,
+            password=self.password,
+            name="춘식이",
+        )
+        self.token, _ = Token.objects.get_or_create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.token.key}")
+
+    def tearDown(self):
+        token_cache.clear()
+        cache.clear()
+
+    def test_success_cached(self):
+        # Given: 한 번 인증된 token
+        self.client.get(self.url_user_info)
+
+        # When: 같은 token으로 다시 요청할 때
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.url_user_info)
+
+        # Then: 인증 쿼리 없이 사용자 정보를 반환한다.
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["user_id"], self.user.id)
+        self.assertEqual(response.json()["name"], "춘식이")
+        self.assertEqual(len(context.captured_queries), 0)
+
+    def test_success_shared_cache(self):
+        # Given: 다른 process에서 인증되어 공유 cache에만 남아 있는 token
+        self.client.get(self.url_user_info)
+        token_cache.clear()
+
+        # When: 같은 token으로 다시 요청할 때
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.url_user_info)
+
+        # Then: 공유 cache의 snapshot을 사용한다.
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(context.captured_queries), 0)
+
+    def test_invalidate_on_sign_out(self):
+        # Given: 캐시된 token
+        self.client.get(self.url_user_info)
+
+        # When: 로그아웃한 후 같은 token으로 요청할 때
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.get(self.url_sign_out)
+        response = self.client.get(self.url_user_info)
+
+        # Then: 인증에 실패한다.
+        self.assertEqual(response.status_code, 401)
+
+    def test_invalidate_on_sign_in(self):
+        # Given: 캐시된 token
+        self.client.get(self.url_user_info)
+
+        # When: 다시 로그인한 후 이전 token으로 요청할 때
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(
+                self.url_sign_in, {"email": self.email, "password": self.password}
+            )
+        response = self.client.get(self.url_user_info)
+
+        # Then: 인증에 실패한다.
+        self.assertEqual(response.status_code, 401)
+
+    def test_invalidate_on_deactivate(self):
+        # Given: 캐시된 token
+        self.client.get(self.url_user_info)
+
+        # When: 탈퇴한 후 같은 token으로 요청할 때
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.delete(self.url_user_info)
+        response = self.client.get(self.url_user_info)
+
+        # Then: 인증에 실패하고, 탈퇴 외의 사용자 정보는 바뀌지 않는다.
+        self.assertEqual(response.status_code, 401)
+        user = User.objects.get(id=self.user.id)
+        self.assertFalse(user.is_active)
+        self.assertTrue(user.check_password(self.password))
+
+    def test_revoked_in_other_process(self):
+        # Given: 이 process의 LRU cache에 남아 있는 token
+        self.client.get(self.url_user_info)
+
+        # When: 다른 process에서 token을 삭제하여 공유 cache의 generation만 바뀐 후 요청할 때
+        Token.objects.filter(key=self.token.key).delete()
+        cache.set(f"auth:token:{self.token.key}:generation", 0)
+        response = self.client.get(self.url_user_info)
+
+        # Then: LRU cache 항목을 사용하지 않고 인증에 실패한다.
+        self.assertEqual(response.status_code, 401)
+
+    def test_staff_not_cached(self):
+        # Given: 캐시된 token
+        authentication = CachedTokenAuthentication()
+        authentication.authenticate_credentials(self.token.key)
+
+        # When: 다른 곳에서 관리자 권한을 준 뒤 인증할 때
+        User.objects.filter(id=self.user.id).update(is_staff=True)
+        user, _ = authentication.authenticate_credentials(self.token.key)
+
+        # Then: 권한 field는 캐시하지 않고 DB에서 불러온다.
+        self.assertTrue(user.is_staff)
+
+    def test_invalidate_on_commit(self):
+        # Given: 공유 cache에 남아 있는 token
+        self.client.get(self.url_user_info)
+
+        # When: token을 삭제한 transaction이 commit될 때
+        with self.captureOnCommitCallbacks(execute=True):
+            Token.objects.filter(key=self.token.key).delete()
+
+        # Then: 두 cache의 snapshot을 더 이상 사용하지 않는다.
+        self.assertIsNone(token_cache.get(self.token.key))
+        response = self.client.get(self.url_user_info)
+        self.assertEqual(response.status_code, 401)
+
+
+class LRUCacheTest(APITestCase):
+    def test_evict_least_recently_used(self):
+        # Given: 크기가 2인 cache
+        lru_cache = LRUCache(max_size=2, ttl=60)
+        lru_cache.set("a", 1)
+        lru_cache.set("b", 2)
+
+        # When: a를 사용한 뒤 새 값을 넣을 때
+        lru_cache.get("a")
+        lru_cache.set("c", 3)
+
+        # Then: 가장 오래 사용하지 않은 b가 밀려난다.
+        self.assertEqual(lru_cache.get("a"), 1)
+        self.assertIsNone(lru_cache.get("b"))
+        self.assertEqual(lru_cache.get("c"), 3)
+
+    def test_expire(self):
+        # Given: TTL이 60초인 cache
+        lru_cache = LRUCache(max_size=2, ttl=60)
+        with patch("common.auth.time.monotonic", return_value=0):
+            lru_cache.set("a", 1)
+
+        # When: TTL이 지난 뒤 조회할 때
+        with patch("common.auth.time.monotonic", return_value=61):
+            value = lru_cache.get("a")
+
+        # Then: 만료된다.
+        self.assertIsNone(value)
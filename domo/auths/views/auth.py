@@ -15,17 +15,17 @@ from auths.http_model import (
     SocialSignUpRequest,
 )
 from auths.models import PasswordResetToken, SignUpEmailVerifyToken
+from common.auth import CachedTokenAuthentication
 from common.const import ReturnCode
 from common.http_model import SimpleFailResponse, SimpleSuccessResponse
 from common.s3.handler import upload_profile_image
-from common.tasks import update_github_history
+from common.tasks import enqueue_image_variants, update_github_history
 from django.contrib.auth import authenticate
 from django.core.mail import send_mail
 from django.http import JsonResponse
 from django.template.loader import render_to_string
 from external_histories.models import GithubStatus
 from pydantic import ValidationError
-from rest_framework.authentication import TokenAuthentication
 from rest_framework.authtoken.models import Token
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.views import APIView
@@ -107,6 +107,8 @@ class SocialSignUp(APIView):
                 ).model_dump(),
                 status=500,
             )
+        if profile_image_link:
+            enqueue_image_variants("profile", user.id, profile_image_link)
         if request_data.github_link:
             GithubStatus.objects.create(
                 user_id=user.id,
@@ -195,6 +197,8 @@ class SignUp(APIView):
                 ).model_dump(),
                 status=500,
             )
+        if profile_image_link:
+            enqueue_image_variants("profile", user_check.id, profile_image_link)
         if request_data.github_link:
             GithubStatus.objects.create(
                 user_id=user_check.id,
@@ -239,18 +243,18 @@ class SignIn(APIView):
 
 
 class SignOut(APIView):
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
-        Token.objects.filter(key=request.auth).delete()
+        Token.objects.filter(key=request.auth.key).delete()
         return JsonResponse(
             SimpleSuccessResponse(success=True).model_dump(),
         )
 
 
 class PasswordChange(APIView):
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [IsAuthenticated]
 
     def put(self, request):
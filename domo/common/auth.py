@@ -1,6 +1,152 @@
+import time
+from collections import OrderedDict
+from threading import Lock
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
 from rest_framework.permissions import BasePermission
+from users.models import User
 
 
 class IsStaff(BasePermission):
     def has_permission(self, request, view):
         return bool(request.user.is_staff)
+
+
+# 인증 캐시에 남기는 사용자 field. 나머지 field는 처음 접근할 때 DB에서 불러온다.
+# (is_staff 등 권한 field는 캐시하지 않는다. Model.from_db에 넘기기 위해 model의 field 순서를 따른다.)
+SNAPSHOT_FIELDS = [
+    field.attname
+    for field in User._meta.concrete_fields
+    if field.attname
+    in {
+        "id",
+        "email",
+        "name",
+        "profile_image_link",
+        "profile_image_updated_at",
+        "profile_image_variants",
+        "provider",
+        "is_active",
+    }
+]
+
+
+class LRUCache:
+    """
+    크기와 TTL이 제한된 process 내 LRU cache.
+    """
+
+    def __init__(self, max_size, ttl):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.items = OrderedDict()
+        self.lock = Lock()
+
+    def get(self, key):
+        with self.lock:
+            item = self.items.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at < time.monotonic():
+                del self.items[key]
+                return None
+            self.items.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self.lock:
+            self.items[key] = (time.monotonic() + self.ttl, value)
+            self.items.move_to_end(key)
+            while len(self.items) > self.max_size:
+                self.items.popitem(last=False)
+
+    def delete(self, key):
+        with self.lock:
+            self.items.pop(key, None)
+
+    def clear(self):
+        with self.lock:
+            self.items.clear()
+
+
+token_cache = LRUCache(settings.TOKEN_AUTH_CACHE_SIZE, settings.TOKEN_AUTH_CACHE_TTL)
+
+
+def _generation_key(key):
+    return f"auth:token:{key}:generation"
+
+
+def _shared_cache_key(key, generation):
+    return f"auth:token:{key}:{generation}"
+
+
+def _generation_ttl():
+    # LRU cache 항목보다 먼저 만료되지 않도록 두 TTL 중 긴 쪽을 사용한다.
+    return max(settings.TOKEN_AUTH_CACHE_TTL, settings.TOKEN_AUTH_SHARED_CACHE_TTL)
+
+
+def _generation(key):
+    """
+    token의 캐시 generation. 무효화할 때마다 바뀌며, 만료되면 새로 만든다.
+    (만료되어도 캐시된 snapshot을 다시 읽을 뿐이므로 안전하다.)
+    """
+    generation_key = _generation_key(key)
+    generation = cache.get(generation_key)
+    if generation is None:
+        cache.add(generation_key, time.time_ns(), _generation_ttl())
+        generation = cache.get(generation_key)
+    return generation
+
+
+def invalidate_token(key):
+    # generation을 바꾸면 모든 process의 LRU cache 항목과 공유 cache 항목이 무효가 된다.
+    token_cache.delete(key)
+    cache.set(_generation_key(key), time.time_ns(), _generation_ttl())
+
+
+def invalidate_user_tokens(user_id):
+    for key in Token.objects.filter(user_id=user_id).values_list("key", flat=True):
+        invalidate_token(key)
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    token key -> 사용자 snapshot을 process 내 LRU cache와 공유 cache(Redis)에 두어
+    매 요청의 Token JOIN User 쿼리를 생략한다.
+    Token 삭제, User 저장 signal이 commit 이후에 공유 cache의 token generation을 바꾸고,
+    LRU cache 항목은 저장할 때의 generation이 지금과 같을 때만 사용한다.
+    (LRU cache에서 찾으면 DB 쿼리 없이 공유 cache 조회 1번으로 인증한다.)
+    """
+
+    def authenticate_credentials(self, key):
+        # DB보다 generation을 먼저 읽어야,
+        # 읽는 사이 무효화된 snapshot이 새 generation으로 저장되지 않는다.
+        generation = _generation(key)
+        item = token_cache.get(key)
+        snapshot = item[1] if item is not None and item[0] == generation else None
+        if snapshot is None and settings.TOKEN_AUTH_SHARED_CACHE_TTL:
+            snapshot = cache.get(_shared_cache_key(key, generation))
+            if snapshot is not None:
+                token_cache.set(key, (generation, snapshot))
+
+        if snapshot is None:
+            user, token = super().authenticate_credentials(key)
+            snapshot = tuple(getattr(user, field) for field in SNAPSHOT_FIELDS)
+            token_cache.set(key, (generation, snapshot))
+            if settings.TOKEN_AUTH_SHARED_CACHE_TTL:
+                cache.set(
+                    _shared_cache_key(key, generation),
+                    snapshot,
+                    settings.TOKEN_AUTH_SHARED_CACHE_TTL,
+                )
+            return user, token
+
+        # 요청마다 새 instance를 만들어 다른 요청의 변경이 cache에 남지 않도록 한다.
+        # (불러오지 않은 field가 있으므로 save()는 불러오거나 바꾼 field만 저장한다.)
+        user = User.from_db("default", SNAPSHOT_FIELDS, snapshot)
+        token = Token.from_db("default", ["key", "user_id"], [key, user.id])
+        return user, token
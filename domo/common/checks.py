@@ -0,0 +1,25 @@
+from django.conf import settings
+from django.core.checks import Error, Tags, register
+
+PROCESS_LOCAL_CACHE_BACKENDS = {
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+}
+
+
+@register(Tags.caches, deploy=True)
+def check_shared_cache(app_configs, **kwargs):
+    """
+    캐시 무효화(프로젝트 상세 정보, 역할, 인증 token 등)는 다른 process에도 전달되어야 하므로
+    배포 환경에서는 process마다 따로인 cache backend를 허용하지 않는다.
+    """
+    backend = settings.CACHES.get("default", {}).get("BACKEND")
+    if backend in PROCESS_LOCAL_CACHE_BACKENDS:
+        return [
+            Error(
+                f"{backend} is local to each process.",
+                hint="Set CACHES['default'] to a shared backend such as RedisCache.",
+                id="common.E001",
+            )
+        ]
+    return []
@@ -9,6 +9,7 @@ class ReturnCode:
     HISTORY_UPDATE_SUCCESS = "HISTORY_UPDATE_SUCCESS"
     NO_GITHUB_URL = "NO_GITHUB_URL"
     CANNOT_FIND_GITHUB_ACCOUNT = "CANNOT_FIND_GITHUB_ACCOUNT"
+    GITHUB_FETCH_INCOMPLETE = "GITHUB_FETCH_INCOMPLETE"
     GITHUB_STATUS_IN_PROGRESS = "IN_PROGRESS"
     GITHUB_STATUS_COMPLETE = "COMPLETE"
     GITHUB_STATUS_FAILED = "FAILED"
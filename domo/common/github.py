@@ -0,0 +1,174 @@
+import asyncio
+import os
+
+import httpx
+from django.conf import settings
+
+PER_PAGE = 100
+
+
+class GithubAccountNotFound(Exception):
+    pass
+
+
+class GithubFetchIncomplete(Exception):
+    pass
+
+
+class ConditionalCache:
+    """
+    조건부 요청용 응답 캐시. (API 경로 -> etag, last_modified, body)
+    304 응답이면 저장된 body를 재사용하고, 새로 받은 응답은 changed에 모은다.
+    """
+
+    def __init__(self, entries=None):
+        self.entries = entries or {}
+        self.changed = {}
+        self.used = set()
+
+    def headers(self, path):
+        entry = self.entries.get(path)
+        if not entry:
+            return {}
+        headers = {}
+        if entry["etag"]:
+            headers["If-None-Match"] = entry["etag"]
+        if entry["last_modified"]:
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def store(self, path, response, body):
+        etag = response.headers.get("ETag", "")
+        last_modified = response.headers.get("Last-Modified", "")
+        if not etag and not last_modified:
+            return
+        entry = {"etag": etag, "last_modified": last_modified, "body": body}
+        self.entries[path] = entry
+        self.changed[path] = entry
+
+    @property
+    def stale(self):
+        return set(self.entries) - self.used
+
+
+class RequestStats:
+    """
+    rate limit 계산용 요청 통계.
+    (304 응답은 GitHub rate limit에 포함되지 않으므로 세지 않는다.)
+    """
+
+    def __init__(self):
+        self.request_count = 0
+        self.remaining = None
+        self.reset = None
+
+    async def record(self, response):
+        if response.status_code != 304:
+            self.request_count += 1
+        if "X-RateLimit-Remaining" in response.headers:
+            self.remaining = int(response.headers["X-RateLimit-Remaining"])
+            self.reset = int(response.headers.get("X-RateLimit-Reset", 0))
+
+
+def get_account(github_link):
+    return (
+        github_link.split("/")[-1]
+        if not github_link.split("/")[-1] == ""
+        else github_link.split("/")[-2]
+    )
+
+
+def _headers():
+    headers = {"Accept": "application/vnd.github+json"}
+    token = os.environ.get("GITHUB_API_TOKEN")
+    if token:
+        headers["Authorization"] = "Bearer " + token
+    return headers
+
+
+async def _get(client, cache, path):
+    """
+    (status_code, body)를 반환한다. 304 응답이면 캐시된 body를 200으로 취급한다.
+    200이라도 body가 JSON이 아니면(잘리거나 깨진 응답) 실패한 응답(502)으로 취급한다.
+    """
+    cache.used.add(path)
+    response = await client.get(path, headers=cache.headers(path))
+    if response.status_code == 304 and path in cache.entries:
+        return 200, cache.entries[path]["body"]
+    if response.status_code != 200:
+        return response.status_code, None
+
+    try:
+        body = response.json()
+    except ValueError:
+        return 502, None
+    cache.store(path, response, body)
+    return 200, body
+
+
+async def _get_json(client, cache, path, default):
+    status_code, body = await _get(client, cache, path)
+    if status_code != 200:
+        return default
+    return body
+
+
+async def _fetch_repository_names(client, cache, account):
+    # 한 페이지가 가득 차 있으면 다음 페이지가 있다.
+    # (304 응답에는 Link 헤더가 없을 수 있으므로 페이지 크기로 판단한다.)
+    # 목록 일부만 저장하거나 캐시를 정리하지 않도록, 실패한 페이지는 마지막 페이지로 보지 않는다.
+    names = []
+    page = 1
+    while True:
+        path = f"/users/{account}/repos?per_page={PER_PAGE}&page={page}"
+        status_code, user_repos = await _get(client, cache, path)
+        if status_code != 200:
+            raise GithubFetchIncomplete(path)
+        names += [repo.get("name") for repo in user_repos]
+        if len(user_repos) < PER_PAGE:
+            return names
+        page += 1
+
+
+async def _fetch_repository(client, cache, account, repo_name):
+    languages, dependency = await asyncio.gather(
+        _get_json(client, cache, f"/repos/{account}/{repo_name}/languages", {}),
+        _get_json(
+            client, cache, f"/repos/{account}/{repo_name}/dependency-graph/sbom", {}
+        ),
+    )
+    return languages, dependency
+
+
+async def fetch_github_history(account, cache=None, stats=None):
+    """
+    사용자의 모든 repository의 language, SBOM 정보를 동시에 가져온다.
+    (repository별 (languages, dependency) 튜플의 리스트를 반환한다.)
+    cache가 주어지면 조건부 요청을 보내고, 변경된 응답을 cache에 기록한다.
+    stats가 주어지면 요청 수와 rate limit 헤더를 기록한다.
+    """
+    cache = cache if cache is not None else ConditionalCache()
+    event_hooks = {"response": [stats.record]} if stats is not None else {}
+    limits = httpx.Limits(
+        max_connections=settings.GITHUB_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.GITHUB_MAX_CONNECTIONS,
+    )
+    async with httpx.AsyncClient(
+        base_url=settings.GITHUB_API_URL,
+        headers=_headers(),
+        limits=limits,
+        timeout=settings.GITHUB_TIMEOUT,
+        event_hooks=event_hooks,
+    ) as client:
+        status_code, _ = await _get(client, cache, f"/users/{account}")
+        if status_code != 200:
+            raise GithubAccountNotFound(account)
+
+        repo_names = await _fetch_repository_names(client, cache, account)
+
+        return await asyncio.gather(
+            *(
+                _fetch_repository(client, cache, account, repo_name)
+                for repo_name in repo_names
+            )
+        )
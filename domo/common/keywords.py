@@ -0,0 +1,47 @@
+import re
+from collections import Counter
+
+from common.const import ReturnList
+
+KEYWORDS = frozenset(ReturnList.WORD_LIST)
+TOKEN_SEPARATOR = re.compile(r"[ \-:/@.]")
+
+
+def dependency_names(dependencies):
+    """
+    SBOM 문서들에 들어있는 모든 "name" 값을 반환한다.
+    (깊은 문서에서도 재귀 한도에 걸리지 않도록 stack으로 순회한다.)
+    """
+    names = []
+    stack = [dependency for dependency in dependencies if type(dependency) is dict]
+    while stack:
+        node = stack.pop()
+        # list 안의 list 등 dict가 아닌 값은 건너뛴다.
+        if type(node) is not dict:
+            continue
+        for key, value in node.items():
+            if key == "name":
+                if type(value) is str:
+                    names.append(value)
+            else:
+                kind = type(value)
+                if kind is dict:
+                    stack.append(value)
+                elif kind is list:
+                    stack += value
+    return names
+
+
+def count_keywords(dependencies):
+    """
+    SBOM 문서들의 package 이름을 구분자로 나누어, KEYWORDS에 속한 단어의 수를 센다.
+    호출마다 새 Counter를 사용하므로 동시에 실행되어도 안전하다.
+    """
+    # 이름들을 구분자(공백)로 이어 붙여 정규식 split을 한 번만 호출한다.
+    words = TOKEN_SEPARATOR.split(" ".join(dependency_names(dependencies)))
+    return Counter([word for word in words if word in KEYWORDS])
+
+
+def top_keywords(keywords, count):
+    # 같은 횟수는 단어 순으로 정렬하여 순회 순서와 관계없이 결과가 같도록 한다.
+    return dict(sorted(keywords.items(), key=lambda item: (-item[1], item[0]))[:count])
@@ -0,0 +1,51 @@
+import time
+
+from common.s3.handler import GeneralHandler
+from common.stubs.s3 import S3Stub
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+
+BUCKET = "bench-bucket"
+
+
+class Command(BaseCommand):
+    help = "Benchmark GeneralHandler.check_resource_links against a local S3 stub."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--links", type=int, nargs="+", default=[1, 5, 10, 20])
+        parser.add_argument("--latency", type=float, default=0.03)
+
+    def handle(self, *args, **options):
+        for link_count in options["links"]:
+            keys = [f"resources/{i}.png" for i in range(link_count)]
+            links = [
+                f"https://{BUCKET}.s3.ap-northeast-2.amazonaws.com/{key}"
+                for key in keys
+            ]
+            with S3Stub(
+                [f"{BUCKET}/{key}" for key in keys], latency=options["latency"]
+            ) as stub:
+                handler = GeneralHandler("resource")
+                handler.aws_s3_bucket_name = BUCKET
+                handler.s3_client = stub.client()
+
+                serial = self.measure(lambda: self.check_serial(handler, keys))
+                cache.clear()
+                parallel = self.measure(lambda: handler.check_resource_links(links))
+                cached = self.measure(lambda: handler.check_resource_links(links))
+                cache.clear()
+
+            self.stdout.write(
+                f"links={link_count} serial={serial * 1000:.0f}ms "
+                f"parallel={parallel * 1000:.0f}ms cached={cached * 1000:.1f}ms"
+            )
+
+    def measure(self, function):
+        started = time.perf_counter()
+        function()
+        return time.perf_counter() - started
+
+    def check_serial(self, handler, keys):
+        # 기존 방식: link마다 순서대로 HEAD 요청을 보낸다.
+        for key in keys:
+            handler.s3_client.head_object(Bucket=BUCKET, Key=key)
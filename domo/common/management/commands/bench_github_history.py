@@ -0,0 +1,49 @@
+import asyncio
+import time
+
+import httpx
+from common.github import fetch_github_history
+from common.stubs.github import GithubStub
+from django.core.management.base import BaseCommand
+from django.test import override_settings
+
+
+class Command(BaseCommand):
+    help = "Benchmark GitHub history fetching against a local stub server."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--repos", type=int, nargs="+", default=[10, 50, 100])
+        parser.add_argument("--latency", type=float, default=0.05)
+
+    def handle(self, *args, **options):
+        for repo_count in options["repos"]:
+            repositories = {
+                "bench": {
+                    f"repo{i}": ({"Python": i}, {"sbom": {"packages": []}})
+                    for i in range(repo_count)
+                }
+            }
+            with GithubStub(repositories, latency=options["latency"]) as stub:
+                with override_settings(GITHUB_API_URL=stub.url):
+                    serial = self.measure(lambda: self.fetch_serial(stub.url))
+                    concurrent = self.measure(
+                        lambda: asyncio.run(fetch_github_history("bench"))
+                    )
+
+            self.stdout.write(
+                f"repos={repo_count} serial={serial:.2f}s "
+                f"concurrent={concurrent:.2f}s speedup={serial / concurrent:.1f}x"
+            )
+
+    def measure(self, function):
+        started = time.perf_counter()
+        function()
+        return time.perf_counter() - started
+
+    def fetch_serial(self, url):
+        # 기존 방식: repository마다 순서대로 요청한다.
+        with httpx.Client(base_url=url) as client:
+            repos_url = client.get("/users/bench").json()["repos_url"]
+            for repo in client.get(repos_url).json():
+                client.get(f"/repos/bench/{repo['name']}/languages").json()
+                client.get(f"/repos/bench/{repo['name']}/dependency-graph/sbom").json()
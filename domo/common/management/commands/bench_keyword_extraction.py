@@ -0,0 +1,86 @@
+import random
+import time
+from collections import defaultdict
+
+from common.const import ReturnList
+from common.keywords import count_keywords, top_keywords
+from django.core.management.base import BaseCommand
+
+
+def legacy_count_keywords(dependencies):
+    # 기존 방식: 이름마다 str.replace 5번, 재귀 순회, 모든 단어를 센 뒤 list에서 찾는다.
+    words = defaultdict(lambda: 0)
+
+    def insert_user_dependency(dependency):
+        if type(dependency) is not dict:
+            return
+        for key, value in dependency.items():
+            if key == "name":
+                string = (
+                    value.replace(" ", ".")
+                    .replace("-", ".")
+                    .replace(":", ".")
+                    .replace("/", ".")
+                    .replace("@", ".")
+                )
+                for word in string.split("."):
+                    words[word] += 1
+            elif type(value) is dict:
+                insert_user_dependency(value)
+            elif type(value) is list:
+                for item in value:
+                    insert_user_dependency(item)
+
+    for dependency in dependencies:
+        insert_user_dependency(dependency)
+
+    sorted_words = sorted(words.items(), key=lambda x: x[1], reverse=True)
+    return [word for word in sorted_words if word[0] in ReturnList.WORD_LIST][:20]
+
+
+class Command(BaseCommand):
+    help = "Benchmark SBOM keyword extraction on large synthetic SBOM documents."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--repos", type=int, default=100)
+        parser.add_argument("--packages", type=int, default=1000)
+        parser.add_argument("--runs", type=int, default=5)
+
+    def handle(self, *args, **options):
+        words = ReturnList.WORD_LIST + [f"lib{i}" for i in range(500)]
+        dependencies = [
+            {
+                "sbom": {
+                    "name": f"com.github.bench/repo{r}",
+                    "packages": [
+                        {
+                            "name": "npm:"
+                            + "-".join(random.choices(words, k=3))
+                            + f"@{random.randint(0, 9)}.{random.randint(0, 9)}.0",
+                            "versionInfo": "1.0.0",
+                            "externalRefs": [{"referenceLocator": "pkg:npm/x"}],
+                        }
+                        for _ in range(options["packages"])
+                    ],
+                }
+            }
+            for r in range(options["repos"])
+        ]
+
+        legacy = self.measure(lambda: legacy_count_keywords(dependencies), options)
+        current = self.measure(
+            lambda: top_keywords(count_keywords(dependencies), 20), options
+        )
+        self.stdout.write(
+            f"names={options['repos'] * options['packages']} "
+            f"legacy={legacy * 1000:.1f}ms current={current * 1000:.1f}ms "
+            f"speedup={legacy / current:.1f}x"
+        )
+
+    def measure(self, function, options):
+        timings = []
+        for _ in range(options["runs"]):
+            started = time.perf_counter()
+            function()
+            timings.append(time.perf_counter() - started)
+        return sorted(timings)[len(timings) // 2]
@@ -0,0 +1,90 @@
+import base64
+import binascii
+import json
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+
+
+class InvalidPageRequest(Exception):
+    pass
+
+
+def encode_cursor(values):
+    raw = json.dumps(values, default=lambda value: value.isoformat())
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor, length):
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise InvalidPageRequest("Invalid cursor.")
+
+    if not isinstance(values, list) or len(values) != length:
+        raise InvalidPageRequest("Invalid cursor.")
+    for value in values:
+        if not isinstance(value, (str, int, float)) or isinstance(value, bool):
+            raise InvalidPageRequest("Invalid cursor.")
+    return values
+
+
+def get_page_size(request):
+    page_size = request.GET.get("page_size")
+    if page_size is None:
+        return settings.PAGINATION_DEFAULT_PAGE_SIZE
+
+    try:
+        page_size = int(page_size)
+    except ValueError:
+        raise InvalidPageRequest("Invalid page size.")
+    if page_size < 1:
+        raise InvalidPageRequest("Invalid page size.")
+    return min(page_size, settings.PAGINATION_MAX_PAGE_SIZE)
+
+
+def _after(ordering, values):
+    # (a, b) 순서 기준으로 커서 다음 행: a > x OR (a = x AND b > y)
+    condition = Q()
+    equals = {}
+    for field, value in zip(ordering, values):
+        name = field.lstrip("-")
+        lookup = "lt" if field.startswith("-") else "gt"
+        condition |= Q(**equals, **{f"{name}__{lookup}": value})
+        equals[name] = value
+    return condition
+
+
+def _value(item, name):
+    if isinstance(item, dict):
+        return item[name]
+    return getattr(item, name)
+
+
+def paginate(queryset, ordering, cursor=None, page_size=None):
+    """
+    Keyset pagination. ordering은 유일해야 한다. (마지막 키로 보통 id 사용)
+    커서 이후의 page_size 개 항목과 다음 페이지 커서(없으면 None)를 반환한다.
+    """
+    page_size = page_size or settings.PAGINATION_DEFAULT_PAGE_SIZE
+    queryset = queryset.order_by(*ordering)
+
+    if cursor:
+        values = decode_cursor(cursor, len(ordering))
+        try:
+            queryset = queryset.filter(_after(ordering, values))
+        except (ValidationError, TypeError, ValueError):
+            raise InvalidPageRequest("Invalid cursor.")
+
+    items = list(queryset[: page_size + 1])
+
+    next_cursor = None
+    if len(items) > page_size:
+        items = items[:page_size]
+        next_cursor = encode_cursor(
+            [_value(items[-1], field.lstrip("-")) for field in ordering]
+        )
+
+    return items, next_cursor
@@ -0,0 +1,88 @@
+import secrets
+import time
+from contextlib import contextmanager
+
+from django.core.cache import cache
+
+LOCK_TIMEOUT = 5
+
+
+class LockTimeout(Exception):
+    pass
+
+
+class TokenBucket:
+    """
+    Django cache에 상태를 두는 token bucket.
+    시간당 per_hour 개의 token이 채워지고, 최대 burst 개까지 쌓인다.
+    사용량은 요청 후에 기록하므로 token이 음수(빚)가 될 수 있다.
+    """
+
+    def __init__(self, key, per_hour, burst):
+        self.key = key
+        self.rate = per_hour / 3600
+        self.burst = burst
+
+    @contextmanager
+    def _lock(self):
+        """
+        다른 process와 상태를 함께 바꾸지 않도록 잡는 lock.
+        LOCK_TIMEOUT 안에 잡지 못하면 lock 없이 진행하지 않고 LockTimeout을 낸다.
+        """
+        lock_key = self.key + ":lock"
+        token = secrets.token_hex(8)
+        deadline = time.monotonic() + LOCK_TIMEOUT
+        while not cache.add(lock_key, token, LOCK_TIMEOUT):
+            if time.monotonic() > deadline:
+                raise LockTimeout(self.key)
+            time.sleep(0.01)
+        acquired_at = time.monotonic()
+        try:
+            yield
+        finally:
+            # 만료되어 다른 process가 잡은 lock은 지우지 않는다.
+            if (
+                time.monotonic() - acquired_at < LOCK_TIMEOUT
+                and cache.get(lock_key) == token
+            ):
+                cache.delete(lock_key)
+
+    def _load(self, now):
+        state = cache.get(self.key) or {
+            "tokens": self.burst,
+            "updated": now,
+            "reset": 0,
+        }
+        elapsed = max(now - state["updated"], 0)
+        state["tokens"] = min(state["tokens"] + elapsed * self.rate, self.burst)
+        state["updated"] = now
+        return state
+
+    def wait_time(self):
+        """
+        다음 요청을 보낼 수 있을 때까지 기다려야 하는 시간(초). 0이면 바로 보낼 수 있다.
+        """
+        now = time.time()
+        with self._lock():
+            state = self._load(now)
+            cache.set(self.key, state, None)
+
+        if state["reset"] > now:
+            return state["reset"] - now
+        if state["tokens"] > 0:
+            return 0
+        return -state["tokens"] / self.rate
+
+    def record(self, used, remaining=None, reset=None):
+        """
+        사용한 token 수를 기록한다.
+        API가 알려준 남은 요청 수(remaining)와 초기화 시각(reset)이 있으면 함께 반영한다.
+        """
+        now = time.time()
+        with self._lock():
+            state = self._load(now)
+            state["tokens"] -= used
+            if remaining is not None:
+                state["tokens"] = min(state["tokens"], remaining)
+                state["reset"] = reset if remaining == 0 and reset else 0
+            cache.set(self.key, state, None)
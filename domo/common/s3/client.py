@@ -0,0 +1,34 @@
+import threading
+
+import boto3
+from botocore.config import Config
+from django.conf import settings
+
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def get_s3_client():
+    """
+    프로세스마다 하나의 S3 client를 만들어 재사용한다.
+    (boto3 client는 thread-safe하며, 연결 pool을 요청 간에 공유한다.)
+    """
+    endpoint_url = settings.AWS_S3_ENDPOINT_URL
+    client = _clients.get(endpoint_url)
+    if client is not None:
+        return client
+
+    with _clients_lock:
+        client = _clients.get(endpoint_url)
+        if client is None:
+            config = Config(
+                max_pool_connections=settings.S3_MAX_POOL_CONNECTIONS,
+                tcp_keepalive=True,
+                # MinIO 등 로컬 stand-in은 path-style 주소를 사용한다.
+                s3={"addressing_style": "path"} if endpoint_url else None,
+            )
+            client = boto3.session.Session().client(
+                "s3", endpoint_url=endpoint_url, config=config
+            )
+            _clients[endpoint_url] = client
+    return client
@@ -1,29 +1,47 @@
-import io
 import logging
 import os
 import secrets
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 
-import boto3
 from common.const import ReturnCode
 from common.http_model import SimpleFailResponse
+from common.s3.client import get_s3_client
+from common.s3.images import convert_image_to_jpeg
+from django.conf import settings
+from django.core.cache import cache
 from django.http import JsonResponse
-from PIL import Image
+from resources.models import S3DeletionOutbox
+
+_head_executor = None
+_head_executor_lock = threading.Lock()
+
+
+def get_head_executor():
+    global _head_executor
+    if _head_executor is None:
+        with _head_executor_lock:
+            if _head_executor is None:
+                _head_executor = ThreadPoolExecutor(
+                    max_workers=settings.S3_HEAD_MAX_WORKERS,
+                    thread_name_prefix="s3-head",
+                )
+    return _head_executor
+
+
+def s3_link(key):
+    """
+    S3 object key의 공개 link. (업로드할 때 기록하는 link와 같은 형식)
+    """
+    bucket_name = os.environ.get("AWS_S3_BUCKET_NAME")
+    return f"https://{bucket_name}.s3.ap-northeast-2.amazonaws.com/{key}"
 
 
 class ProfileImageUploader:
     def __init__(self):
         self.aws_s3_bucket_name = os.environ.get("AWS_S3_BUCKET_NAME")
-
-        # # For Local Test
-        # self.s3_session = boto3.Session(profile_name="minio")
-        # self.s3_client = self.s3_session.client(
-        #     "s3", endpoint_url="http://127.0.0.1:9000"
-        # )
-        # self.s3_resource = self.s3_session.resource(
-        #     "s3", endpoint_url="http://127.0.0.1:9000"
-        # )
-        self.s3_client = boto3.client("s3")
-        self.s3_resource = boto3.resource("s3")
+        self.s3_client = get_s3_client()
 
     def upload_image(self, user_email, path, image_file):
         s3 = self.s3_client
@@ -64,11 +82,7 @@ class ProfileImageUploader:
 
     @staticmethod
     def _convert_image_to_jpeg(image_file):
-        image = Image.open(image_file)
-        output_image_io = io.BytesIO()
-        image.convert("RGB").save(output_image_io, format="JPEG", quality=90)
-        converted_image_file = io.BytesIO(output_image_io.getvalue())
-        return converted_image_file
+        return convert_image_to_jpeg(image_file)
 
 
 def upload_profile_image(request_data, profile_image):
@@ -96,17 +110,7 @@ def upload_profile_image(request_data, profile_image):
 class GeneralHandler:
     def __init__(self, type, user_email=None):
         self.aws_s3_bucket_name = os.environ.get("AWS_S3_BUCKET_NAME")
-
-        # # For Local Test
-        # self.s3_session = boto3.Session(profile_name="minio")
-        # self.s3_client = self.s3_session.client(
-        #     "s3", endpoint_url="http://127.0.0.1:9000"
-        # )
-        # self.s3_resource = self.s3_session.resource(
-        #     "s3", endpoint_url="http://127.0.0.1:9000"
-        # )
-        self.s3_client = boto3.client("s3")
-        self.s3_resource = boto3.resource("s3")
+        self.s3_client = get_s3_client()
         self.user_email = user_email
         self.type = type
         if type == "resource":
@@ -122,42 +126,61 @@ class GeneralHandler:
             key = "/".join(key)
         if not key:
             return False
-        try:
-            self.s3_client.delete_object(
-                Bucket=self.aws_s3_bucket_name,
-                Key=f"{self.prefix}/{key}",
-            )
-        except:
-            return False
+        # 요청 중에 S3를 기다리지 않도록, 실제 삭제는 outbox에 모아 나중에 한다.
+        S3DeletionOutbox.objects.create(
+            key=f"{self.prefix}/{key}", created_at=datetime.now(tz=timezone.utc)
+        )
         return True
 
-    def check_resource_links(self, resource_links):
+    def resource_keys(self, resource_links):
         if self.type == "resource":
             if isinstance(resource_links, str):
                 resource_links = [resource_links]
-            for resource_link in resource_links:
-                key = resource_link.split("/")[-1]
-                try:
-                    self.s3_client.head_object(
-                        Bucket=self.aws_s3_bucket_name,
-                        Key=f"{self.prefix}/{key}",
-                    )
-                except:
-                    return False
+            keys = [
+                f"{self.prefix}/{resource_link.split('/')[-1]}"
+                for resource_link in resource_links
+            ]
         elif self.type == "profile":
             key = resource_links.split("/")[-4:]
-            key = "/".join(key)
-            try:
-                self.s3_client.head_object(
-                    Bucket=self.aws_s3_bucket_name,
-                    Key=f"{self.prefix}/{key}",
-                )
-            except:
-                return False
+            keys = [f"{self.prefix}/{'/'.join(key)}"]
+        else:
+            return None
+        return list(dict.fromkeys(keys))
+
+    def _verified_cache_key(self, key):
+        return f"s3:verified:{self.aws_s3_bucket_name}/{key}"
 
+    def mark_verified(self, keys):
+        cache.set_many(
+            {self._verified_cache_key(key): True for key in keys},
+            settings.S3_VERIFIED_KEY_TTL,
+        )
+
+    def _exists(self, key):
+        try:
+            self.s3_client.head_object(Bucket=self.aws_s3_bucket_name, Key=key)
+        except:
+            return False
+        return True
+
+    def check_resource_links(self, resource_links):
+        keys = self.resource_keys(resource_links)
+        if keys is None:
+            return False
+
+        # 최근에 확인한 key는 건너뛰고, 나머지는 HEAD 요청을 동시에 보낸다.
+        verified = cache.get_many([self._verified_cache_key(key) for key in keys])
+        unverified = [
+            key for key in keys if self._verified_cache_key(key) not in verified
+        ]
+        if len(unverified) == 1:
+            results = [self._exists(unverified[0])]
         else:
+            results = get_head_executor().map(self._exists, unverified)
+        if not all(results):
             return False
 
+        self.mark_verified(unverified)
         return True
 
     @staticmethod
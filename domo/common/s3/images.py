@@ -0,0 +1,65 @@
+import io
+
+from django.conf import settings
+from PIL import Image
+
+VARIANT_FORMATS = {
+    "webp": ("WEBP", "image/webp"),
+    "jpeg": ("JPEG", "image/jpeg"),
+}
+
+
+def _open(image_file, size):
+    image = Image.open(image_file)
+    # JPEG는 디코딩 단계에서 1/2, 1/4, 1/8로 줄여서 읽을 수 있다.
+    image.draft("RGB", (size, size))
+    image = image.convert("RGB")
+    image.thumbnail((size, size))
+    return image
+
+
+def _encode(image, format):
+    pillow_format, _ = VARIANT_FORMATS[format]
+    quality = (
+        settings.IMAGE_WEBP_QUALITY if format == "webp" else settings.IMAGE_JPEG_QUALITY
+    )
+    buffer = io.BytesIO()
+    image.save(buffer, format=pillow_format, quality=quality)
+    buffer.seek(0)
+    return buffer
+
+
+def convert_image_to_jpeg(image_file):
+    """
+    업로드된 이미지를 IMAGE_MAX_SIZE 이하의 JPEG로 변환한다.
+    """
+    return _encode(_open(image_file, settings.IMAGE_MAX_SIZE), "jpeg")
+
+
+def variant_key(key, token, name, format):
+    # resources/abc.png -> resources/abc-{token}-small.webp
+    # (같은 key에 이미지를 다시 올려도 이전 작은 이미지와 겹치지 않도록 token을 붙인다.)
+    return f"{key.rsplit('.', 1)[0]}-{token}-{name}.{format}"
+
+
+def make_image_variants(image_file):
+    """
+    IMAGE_VARIANT_SIZES의 크기별로 WebP, JPEG 이미지를 만든다.
+    큰 크기부터 차례로 줄여 나가므로 원본은 한 번만 디코딩한다.
+    yield (name, format, content_type, buffer)
+    """
+    sizes = sorted(
+        settings.IMAGE_VARIANT_SIZES.items(), key=lambda item: item[1], reverse=True
+    )
+    image = _open(image_file, sizes[0][1])
+    for name, size in sizes:
+        image.thumbnail((size, size))
+        for format, (_, content_type) in VARIANT_FORMATS.items():
+            yield name, format, content_type, _encode(image, format)
+
+
+def image_variant_links(variants):
+    # {"small": {"webp": link, "jpeg": link}, ...} -> [link, ...]
+    if not variants:
+        return []
+    return [link for links in variants.values() for link in links.values()]
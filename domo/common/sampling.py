@@ -0,0 +1,81 @@
+import random
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Max, Min
+
+# 빈 id(삭제된 행, 조건에 맞지 않는 행)를 고려해 한 번에 필요한 개수의 몇 배를 찍어 볼지
+PROBE_FACTOR = 3
+PROBE_ROUNDS = 3
+
+
+def _pool_key(name):
+    return f"sample_pool:{name}"
+
+
+def sample(queryset, k):
+    """
+    queryset에서 무작위로 최대 k개의 행을 고른다.
+    전체 행을 읽지 않고 pk 범위 안의 무작위 id를 찍어 보므로 DB 작업량은 k에 비례한다.
+    (id가 드문드문하면 뒤에 빈 id가 많은 행이 조금 더 자주 뽑힌다.)
+    TABLESAMPLE SYSTEM_ROWS는 block 단위로 뽑아 같은 block의 행이 함께 나오고,
+    queryset 조건은 뽑은 뒤에 적용되어 k개보다 적게 나올 수 있으므로 사용하지 않는다.
+    """
+    if k <= 0:
+        return []
+    bounds = queryset.model._default_manager.aggregate(low=Min("pk"), high=Max("pk"))
+    low, high = bounds["low"], bounds["high"]
+    if low is None:
+        return []
+
+    found = {}
+    # 1. 무작위 id를 한 번에 찍어 본다. (id가 촘촘하면 대부분 여기서 끝난다.)
+    for _ in range(PROBE_ROUNDS):
+        need = k - len(found)
+        if need <= 0:
+            break
+        probes = {
+            random.randint(low, high) for _ in range(need * PROBE_FACTOR)
+        } - found.keys()
+        for item in queryset.filter(pk__in=probes)[:need]:
+            found[item.pk] = item
+
+    # 2. 남은 개수는 무작위 id 이후의 첫 행으로 채운다. (없으면 처음으로 돌아간다.)
+    while len(found) < k:
+        start = random.randint(low, high)
+        remaining = queryset.exclude(pk__in=found.keys()).order_by("pk")
+        item = remaining.filter(pk__gte=start).first() or remaining.first()
+        if item is None:
+            break
+        found[item.pk] = item
+
+    items = list(found.values())
+    random.shuffle(items)
+    return items
+
+
+def refresh_sample_pool(name, queryset):
+    """
+    미리 뽑아 둔 id 목록을 새로 뽑아 공유 cache(Redis)에 둔다.
+    Celery worker가 주기적으로 교체하고, 모든 uWSGI process가 같은 목록을 읽는다.
+    """
+    ids = [item.pk for item in sample(queryset.only("pk"), settings.SAMPLE_POOL_SIZE)]
+    cache.set(_pool_key(name), ids, settings.SAMPLE_POOL_TTL)
+    return len(ids)
+
+
+def pooled_sample(name, queryset, k):
+    """
+    미리 뽑아 둔 id 목록에서 k개를 고른다.
+    목록이 없거나 queryset 조건으로 걸러져 모자라면 sample로 채운다.
+    """
+    pool = cache.get(_pool_key(name)) or []
+    picked = random.sample(pool, min(len(pool), k * 2))
+    items = list(queryset.filter(pk__in=picked)[:k]) if picked else []
+    random.shuffle(items)
+
+    if len(items) < k:
+        items += sample(
+            queryset.exclude(pk__in=[item.pk for item in items]), k - len(items)
+        )
+    return items
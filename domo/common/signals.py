@@ -0,0 +1,22 @@
+from common.auth import SNAPSHOT_FIELDS, invalidate_token, invalidate_user_tokens
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
+from users.models import User
+
+
+@receiver(post_delete, sender=Token)
+def invalidate_deleted_token(sender, instance, **kwargs):
+    # commit 전에 무효화하면 다른 요청이 삭제되기 전의 token을 다시 캐시할 수 있다.
+    key = instance.key
+    transaction.on_commit(lambda: invalidate_token(key))
+
+
+@receiver(post_save, sender=User)
+def invalidate_user_snapshot(sender, instance, update_fields=None, **kwargs):
+    # 인증 캐시에 남기지 않는 field만 저장한 경우는 건너뛴다.
+    if update_fields and not set(SNAPSHOT_FIELDS) & set(update_fields):
+        return
+    user_id = instance.id
+    transaction.on_commit(lambda: invalidate_user_tokens(user_id))
@@ -0,0 +1,111 @@
+import hashlib
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+
+class GithubStub:
+    """
+    GitHub API를 흉내내는 로컬 HTTP 서버.
+    repositories: {account: {repo_name: (languages, sbom)}}
+    (repository 목록 페이지네이션과 ETag 조건부 요청을 지원한다.)
+    failing_paths에 있는 경로는 500으로, malformed_paths에 있는 경로는 잘린 JSON으로 응답한다.
+    """
+
+    def __init__(self, repositories, latency=0, failing_paths=(), malformed_paths=()):
+        self.repositories = repositories
+        self.latency = latency
+        self.failing_paths = set(failing_paths)
+        self.malformed_paths = set(malformed_paths)
+        self.request_count = 0
+        self.not_modified_count = 0
+        self.paths = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                stub.handle(self)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_port}"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def route(self, path):
+        url = urlsplit(path)
+        query = parse_qs(url.query)
+        parts = url.path.strip("/").split("/")
+        if parts[0] == "users" and parts[1] in self.repositories:
+            if len(parts) == 2:
+                return {"login": parts[1], "repos_url": f"{self.url}{url.path}/repos"}
+            if parts[2:] == ["repos"]:
+                per_page = int(query.get("per_page", ["30"])[0])
+                page = int(query.get("page", ["1"])[0])
+                names = list(self.repositories[parts[1]])
+                return [
+                    {"name": name}
+                    for name in names[(page - 1) * per_page : page * per_page]
+                ]
+        if parts[0] == "repos" and parts[1] in self.repositories:
+            repository = self.repositories[parts[1]].get(parts[2])
+            if repository is None:
+                return None
+            if parts[3:] == ["languages"]:
+                return repository[0]
+            if parts[3:] == ["dependency-graph", "sbom"]:
+                return repository[1]
+        return None
+
+    def handle(self, request):
+        with self.lock:
+            self.request_count += 1
+            self.paths.append(request.path)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.latency)
+            if request.path in self.failing_paths:
+                request.send_response(500)
+                request.end_headers()
+                return
+            body = self.route(request.path)
+            status = 200 if body is not None else 404
+            payload = json.dumps(body if body is not None else {}).encode()
+            if request.path in self.malformed_paths:
+                payload = payload[: len(payload) // 2]
+            etag = '"' + hashlib.md5(payload).hexdigest() + '"'
+
+            if status == 200 and request.headers.get("If-None-Match") == etag:
+                with self.lock:
+                    self.not_modified_count += 1
+                request.send_response(304)
+                request.send_header("ETag", etag)
+                request.end_headers()
+                return
+
+            request.send_response(status)
+            request.send_header("ETag", etag)
+            request.send_header("Content-Type", "application/json")
+            request.send_header("Content-Length", str(len(payload)))
+            request.end_headers()
+            request.wfile.write(payload)
+        finally:
+            with self.lock:
+                self.in_flight -= 1
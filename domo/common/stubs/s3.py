@@ -0,0 +1,176 @@
+import threading
+import time
+import xml.etree.ElementTree as ElementTree
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+from xml.sax.saxutils import escape
+
+import boto3
+from botocore.config import Config
+
+OLD = datetime(2020, 1, 1, tzinfo=timezone.utc)
+
+
+class S3Stub:
+    """
+    HeadObject, GetObject, PutObject, DeleteObjects, ListObjectsV2만 처리하는
+    로컬 S3 stand-in. (path-style 주소)
+    keys: 존재하는 "bucket/key" 집합, 또는 "bucket/key" -> 수정 시각 dict
+    bodies: "bucket/key" -> 내용 (GetObject에 사용, PutObject로 저장)
+    """
+
+    def __init__(self, keys=(), latency=0, page_size=1000, bodies=None):
+        self.keys = dict(keys) if isinstance(keys, dict) else dict.fromkeys(keys, OLD)
+        self.bodies = dict(bodies or {})
+        self.keys.update(dict.fromkeys(set(self.bodies) - set(self.keys), OLD))
+        self.uploads = {}
+        self.latency = latency
+        self.page_size = page_size
+        self.request_count = 0
+        self.delete_request_count = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_HEAD(self):
+                stub.handle(self, stub.head)
+
+            def do_GET(self):
+                if "list-type=" in self.path:
+                    stub.handle(self, stub.list_objects)
+                else:
+                    stub.handle(self, stub.get_object)
+
+            def do_PUT(self):
+                stub.handle(self, stub.put_object)
+
+            def do_POST(self):
+                stub.handle(self, stub.delete_objects)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_port}"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def client(self, max_pool_connections=10):
+        return boto3.client(
+            "s3",
+            endpoint_url=self.url,
+            region_name="ap-northeast-2",
+            aws_access_key_id="test",
+            aws_secret_access_key="test",
+            config=Config(
+                s3={"addressing_style": "path"},
+                max_pool_connections=max_pool_connections,
+                retries={"max_attempts": 1},
+            ),
+        )
+
+    def head(self, path, query, body):
+        return (200 if path in self.keys else 404), b""
+
+    def get_object(self, path, query, body):
+        if path not in self.bodies:
+            return 404, b""
+        return 200, self.bodies[path]
+
+    def put_object(self, path, query, body):
+        with self.lock:
+            self.keys[path] = datetime.now(tz=timezone.utc)
+            self.bodies[path] = body
+            self.uploads[path] = body
+        return 200, b""
+
+    def list_objects(self, path, query, body):
+        bucket = path.split("/")[0]
+        prefix = f"{bucket}/" + query.get("prefix", [""])[0]
+        keys = sorted(key for key in self.keys if key.startswith(prefix))
+        start = int(query.get("continuation-token", ["0"])[0])
+        page = keys[start : start + self.page_size]
+        truncated = start + self.page_size < len(keys)
+
+        contents = "".join(
+            "<Contents>"
+            f"<Key>{escape(key[len(bucket) + 1:])}</Key>"
+            f"<LastModified>{self.keys[key].strftime('%Y-%m-%dT%H:%M:%S.000Z')}"
+            "</LastModified>"
+            '<ETag>"etag"</ETag><Size>1</Size><StorageClass>STANDARD</StorageClass>'
+            "</Contents>"
+            for key in page
+        )
+        next_token = (
+            f"<NextContinuationToken>{start + self.page_size}</NextContinuationToken>"
+            if truncated
+            else ""
+        )
+        return (
+            200,
+            (
+                '<?xml version="1.0" encoding="UTF-8"?>'
+                '<ListBucketResult xmlns="http://s3.amazonaws.com/doc/2006-03-01/">'
+                f"<Name>{bucket}</Name><KeyCount>{len(page)}</KeyCount>"
+                f"<MaxKeys>{self.page_size}</MaxKeys>"
+                f"<IsTruncated>{'true' if truncated else 'false'}</IsTruncated>"
+                f"{contents}{next_token}</ListBucketResult>"
+            ).encode(),
+        )
+
+    def delete_objects(self, path, query, body):
+        bucket = path.split("/")[0]
+        namespace = "{http://s3.amazonaws.com/doc/2006-03-01/}"
+        root = ElementTree.fromstring(body)
+        keys = [element.text for element in root.iter(namespace + "Key")]
+        with self.lock:
+            self.delete_request_count += 1
+            for key in keys:
+                self.keys.pop(f"{bucket}/{key}", None)
+        return (
+            200,
+            (
+                '<?xml version="1.0" encoding="UTF-8"?>'
+                '<DeleteResult xmlns="http://s3.amazonaws.com/doc/2006-03-01/">'
+                "</DeleteResult>"
+            ).encode(),
+        )
+
+    def handle(self, request, operation):
+        with self.lock:
+            self.request_count += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.latency)
+            url = urlsplit(request.path)
+            length = int(request.headers.get("Content-Length", 0))
+            body = request.rfile.read(length) if length else b""
+            status, payload = operation(
+                unquote(url.path).lstrip("/"), parse_qs(url.query), body
+            )
+
+            request.send_response(status)
+            request.send_header("Content-Length", str(len(payload)))
+            if payload:
+                request.send_header("Content-Type", "application/xml")
+            request.end_headers()
+            if request.command != "HEAD":
+                request.wfile.write(payload)
+        finally:
+            with self.lock:
+                self.in_flight -= 1
@@ -1,102 +1,141 @@
 # Create your tasks here
+import asyncio
+import io
+import logging
 import os
+import secrets
 from collections import defaultdict
-from datetime import datetime, timezone
-
-import requests
-from celery import shared_task
-from common.const import ReturnCode, ReturnList
+from datetime import datetime, timedelta, timezone
+
+import httpx
+from botocore.exceptions import BotoCoreError, ClientError
+from celery import chain, group, shared_task
+from common.const import ReturnCode
+from common.github import (
+    ConditionalCache,
+    GithubAccountNotFound,
+    GithubFetchIncomplete,
+    RequestStats,
+    fetch_github_history,
+    get_account,
+)
+from common.keywords import count_keywords, top_keywords
+from common.rate_limit import LOCK_TIMEOUT, LockTimeout, TokenBucket
+from common.s3.client import get_s3_client
+from common.s3.handler import GeneralHandler, s3_link
+from common.s3.images import image_variant_links, make_image_variants, variant_key
+from common.sampling import refresh_sample_pool
+from django.conf import settings
+from django.core.cache import cache as django_cache
+from django.db import transaction
+from django.db.models import Exists, F, OuterRef, Q
 from django.db.transaction import atomic
-from external_histories.models import GithubStatus, UserKeyword, UserStack
+from external_histories.models import (
+    GithubResponseCache,
+    GithubStatus,
+    UserKeyword,
+    UserStack,
+)
+from PIL import UnidentifiedImageError
+from projects.models import Project, ProjectStackProfile
+from resources.models import S3DeletionOutbox, S3ResourceReferenceCheck
 from users.models import User
 
-words = defaultdict(lambda: 0)
-
-
-@shared_task
-@atomic
-def update_github_history(user_id, github_link):
-    token = os.environ.get("GITHUB_API_TOKEN")
+GITHUB_UPDATE_RUN_CACHE_KEY = "github:update_run_started_at"
 
-    headers = {"Authorization": "Bearer " + token}
 
-    global words
-    words = defaultdict(lambda: 0)
+def github_rate_limit():
+    return TokenBucket(
+        "github:rate_limit",
+        settings.GITHUB_RATE_LIMIT_PER_HOUR,
+        settings.GITHUB_RATE_LIMIT_BURST,
+    )
 
-    github_status = GithubStatus.objects.get(user_id=user_id)
 
+@atomic
+def fail_github_history(user_id, return_code):
     UserStack.objects.filter(user_id=user_id).delete()
-
     UserKeyword.objects.filter(user_id=user_id).delete()
 
-    if not github_link:
-        github_status.status = ReturnCode.GITHUB_STATUS_FAILED
-        github_status.last_update = datetime.now(tz=timezone.utc)
-        github_status.save()
-        return ReturnCode.NO_GITHUB_URL
-
-    account = (
-        github_link.split("/")[-1]
-        if not github_link.split("/")[-1] == ""
-        else github_link.split("/")[-2]
-    )
+    github_status = GithubStatus.objects.get(user_id=user_id)
+    github_status.status = ReturnCode.GITHUB_STATUS_FAILED
+    github_status.last_update = datetime.now(tz=timezone.utc)
+    github_status.save()
 
-    try:
-        check_url = "https://api.github.com/users/" + account
-        response = requests.get(url=check_url, headers=headers)
-    except:
-        github_status.status = ReturnCode.GITHUB_STATUS_FAILED
-        github_status.last_update = datetime.now(tz=timezone.utc)
-        github_status.save()
-        return ReturnCode.NO_GITHUB_URL
+    return return_code
 
-    if response.status_code != 200:
-        github_status.status = ReturnCode.GITHUB_STATUS_FAILED
-        github_status.last_update = datetime.now(tz=timezone.utc)
-        github_status.save()
-        return ReturnCode.CANNOT_FIND_GITHUB_ACCOUNT
 
-    user_data = response.json()
+def load_github_cache(account):
+    entries = GithubResponseCache.objects.filter(
+        Q(url=f"/users/{account}")
+        | Q(url__startswith=f"/users/{account}/")
+        | Q(url__startswith=f"/repos/{account}/")
+    ).values("url", "etag", "last_modified", "body")
+    return ConditionalCache({entry.pop("url"): entry for entry in entries})
 
-    repos_url = user_data.get("repos_url")
 
-    user_repos = requests.get(url=repos_url, headers=headers).json()
+def save_github_cache(cache):
+    now = datetime.now(tz=timezone.utc)
+    GithubResponseCache.objects.bulk_create(
+        [
+            GithubResponseCache(url=url, updated_at=now, **entry)
+            for url, entry in cache.changed.items()
+        ],
+        update_conflicts=True,
+        unique_fields=["url"],
+        update_fields=["etag", "last_modified", "body", "updated_at"],
+    )
+    # 삭제된 repository 등 이번에 요청하지 않은 경로는 정리한다.
+    GithubResponseCache.objects.filter(url__in=cache.stale).delete()
+
+
+def save_user_stacks(user_id, stacks):
+    # stacks: {language: code_amount}
+    UserStack.objects.filter(user_id=user_id).exclude(language__in=stacks).delete()
+    UserStack.objects.bulk_create(
+        [
+            UserStack(user_id=user_id, language=language, code_amount=code_amount)
+            for language, code_amount in stacks.items()
+        ],
+        update_conflicts=True,
+        unique_fields=["user", "language"],
+        update_fields=["code_amount"],
+    )
 
-    for repo in user_repos:
-        language_url = (
-            f"https://api.github.com/repos/{account}/" f"{repo.get('name')}/languages"
-        )
 
-        user_language = requests.get(url=language_url, headers=headers).json()
+def save_user_keywords(user_id, keywords):
+    # keywords: {keyword: count}
+    UserKeyword.objects.filter(user_id=user_id).exclude(keyword__in=keywords).delete()
+    UserKeyword.objects.bulk_create(
+        [
+            UserKeyword(user_id=user_id, keyword=keyword, count=count)
+            for keyword, count in keywords.items()
+        ],
+        update_conflicts=True,
+        unique_fields=["user", "keyword"],
+        update_fields=["count"],
+    )
 
-        for language, code_amount in user_language.items():
-            insert_user_stack(
-                user_id=user_id, language=language, code_amount=code_amount
-            )
 
-        dependency_url = (
-            f"https://api.github.com/repos/{account}/"
-            f"{repo.get('name')}/dependency-graph/sbom"
-        )
+@atomic
+def save_github_history(user_id, repositories, cache):
+    github_status = GithubStatus.objects.get(user_id=user_id)
 
-        user_dependency = requests.get(url=dependency_url, headers=headers).json()
+    # 언어별 코드 양은 메모리에서 합산한 뒤 한 번에 저장한다.
+    stacks = defaultdict(lambda: 0)
+    for user_language, _ in repositories:
+        for language, code_amount in user_language.items():
+            stacks[language] += code_amount
 
-        insert_user_dependency(dependency=user_dependency)
+    keywords = count_keywords(dependency for _, dependency in repositories)
 
-    sorted_words = sorted(words.items(), key=lambda x: x[1], reverse=True)
+    save_user_stacks(user_id, stacks)
+    save_user_keywords(user_id, top_keywords(keywords, 20))
 
-    i = 0
-    word_list = ReturnList.WORD_LIST
-    for word in sorted_words:
-        if i == 20:
-            break
-        # word is tuple (word, count)
-        if word[0] not in word_list:
-            continue
+    save_github_cache(cache)
 
-        i += 1
-        user_keyword = UserKeyword(user_id=user_id, keyword=word[0], count=word[1])
-        user_keyword.save()
+    # stack이 바뀌었으므로 사용자가 속한 프로젝트의 추천용 요약을 갱신한다.
+    ProjectStackProfile.objects.refresh_for_user(user_id)
 
     github_status.status = ReturnCode.GITHUB_STATUS_COMPLETE
     github_status.last_update = datetime.now(tz=timezone.utc)
@@ -105,68 +144,130 @@ def update_github_history(user_id, github_link):
     return ReturnCode.HISTORY_UPDATE_SUCCESS
 
 
-@atomic
-def insert_user_stack(user_id, language, code_amount):
+@shared_task
+def update_github_history(user_id, github_link):
+    if not github_link:
+        return fail_github_history(user_id, ReturnCode.NO_GITHUB_URL)
+
+    account = get_account(github_link)
+    cache = load_github_cache(account)
+
+    stats = RequestStats()
+
+    # 네트워크 작업은 트랜잭션 밖에서 동시에 수행하고, DB 쓰기만 짧게 묶는다.
     try:
-        user_stack = UserStack.objects.get(user_id=user_id, language=language)
-        original_value = user_stack.code_amount
-        user_stack.code_amount = original_value + code_amount
-        user_stack.save()
-
-    except UserStack.DoesNotExist:
-        user_stack = UserStack(
-            user_id=user_id, language=language, code_amount=code_amount
+        repositories = asyncio.run(fetch_github_history(account, cache, stats))
+    except GithubAccountNotFound:
+        return fail_github_history(user_id, ReturnCode.CANNOT_FIND_GITHUB_ACCOUNT)
+    except httpx.HTTPError:
+        return fail_github_history(user_id, ReturnCode.NO_GITHUB_URL)
+    except GithubFetchIncomplete:
+        return fail_github_history(user_id, ReturnCode.GITHUB_FETCH_INCOMPLETE)
+    finally:
+        try:
+            github_rate_limit().record(
+                stats.request_count, stats.remaining, stats.reset
+            )
+        except LockTimeout:
+            # lock 없이 기록하면 다른 worker의 기록을 덮어쓸 수 있으므로 건너뛴다.
+            logging.error(f"Failed to record GitHub rate limit: {stats.request_count}")
+
+    return save_github_history(user_id, repositories, cache)
+
+
+def start_github_history(user_id):
+    now = datetime.now(tz=timezone.utc)
+    updated = GithubStatus.objects.filter(user_id=user_id).update(
+        status=ReturnCode.GITHUB_STATUS_IN_PROGRESS, last_update=now
+    )
+    if not updated:
+        GithubStatus.objects.create(
+            user_id=user_id,
+            status=ReturnCode.GITHUB_STATUS_IN_PROGRESS,
+            last_update=now,
         )
-        user_stack.save()
 
 
-@atomic
-def insert_user_dependency(dependency):
-    def word_count(string):
-        string = (
-            string.replace(" ", ".")
-            .replace("-", ".")
-            .replace(":", ".")
-            .replace("/", ".")
-            .replace("@", ".")
+@shared_task(bind=True, acks_late=True, reject_on_worker_lost=True, max_retries=48)
+def update_github_history_shard(self, user_ids, started_at):
+    """
+    user_ids의 github history를 순서대로 업데이트한다.
+    rate limit에 걸리면 남은 사용자만 가지고 다시 시도하고,
+    started_at 이후에 이미 완료된 사용자는 건너뛴다.
+    """
+    run_started_at = datetime.fromisoformat(started_at)
+    completed_user_ids = set(
+        GithubStatus.objects.filter(
+            user_id__in=user_ids,
+            status=ReturnCode.GITHUB_STATUS_COMPLETE,
+            last_update__gte=run_started_at,
+        ).values_list("user_id", flat=True)
+    )
+    github_links = dict(
+        User.objects.filter(id__in=user_ids, github_link__isnull=False).values_list(
+            "id", "github_link"
         )
-        string_set = string.split(".")
+    )
 
-        for word in string_set:
-            words[word] += 1
+    rate_limit = github_rate_limit()
+    for index, user_id in enumerate(user_ids):
+        if user_id in completed_user_ids or user_id not in github_links:
+            continue
 
-    if type(dependency) is not dict:
-        return
-    for key, value in dependency.items():
-        if key == "name":
-            word_count(value)
-        elif type(value) is dict:
-            insert_user_dependency(value)
-        elif type(value) is list:
-            for item in value:
-                insert_user_dependency(item)
+        try:
+            wait_time = rate_limit.wait_time()
+        except LockTimeout as e:
+            raise self.retry(
+                args=(user_ids[index:], started_at), countdown=LOCK_TIMEOUT, exc=e
+            )
+        if wait_time > 0:
+            raise self.retry(
+                args=(user_ids[index:], started_at), countdown=int(wait_time) + 1
+            )
+
+        start_github_history(user_id)
+        update_github_history(user_id, github_links[user_id])
 
 
 @shared_task
 def periodic_update_github_history():
-    users = User.objects.filter(github_link__isnull=False)
-    for user in users:
-        if not GithubStatus.objects.filter(user=user).exists():
-            github_status = GithubStatus(
-                user=user,
-                status=ReturnCode.GITHUB_STATUS_IN_PROGRESS,
-                last_update=datetime.now(tz=timezone.utc),
-            )
-            github_status.save()
-        else:
-            github_status = GithubStatus.objects.get(user=user)
-            if github_status.status == ReturnCode.GITHUB_STATUS_IN_PROGRESS:
-                continue
-            github_status.status = ReturnCode.GITHUB_STATUS_IN_PROGRESS
-            github_status.last_update = datetime.now(tz=timezone.utc)
-            github_status.save()
+    # 중단된 실행을 다시 시작하면 같은 시작 시각을 사용하여 완료된 사용자를 건너뛴다.
+    now = datetime.now(tz=timezone.utc)
+    django_cache.add(
+        GITHUB_UPDATE_RUN_CACHE_KEY,
+        now.isoformat(),
+        settings.GITHUB_UPDATE_RESUME_WINDOW,
+    )
+    started_at = django_cache.get(GITHUB_UPDATE_RUN_CACHE_KEY, now.isoformat())
 
-        update_github_history(user.id, user.github_link)
+    skipped = GithubStatus.objects.filter(user=OuterRef("pk")).filter(
+        Q(status=ReturnCode.GITHUB_STATUS_IN_PROGRESS)
+        | Q(
+            status=ReturnCode.GITHUB_STATUS_COMPLETE,
+            last_update__gte=datetime.fromisoformat(started_at),
+        )
+    )
+    user_ids = list(
+        User.objects.filter(github_link__isnull=False)
+        .exclude(Exists(skipped))
+        .order_by("id")
+        .values_list("id", flat=True)
+    )
+
+    shard_size = settings.GITHUB_UPDATE_SHARD_SIZE
+    shards = [user_ids[i : i + shard_size] for i in range(0, len(user_ids), shard_size)]
+    if not shards:
+        return
+
+    # shard를 CONCURRENCY개의 chain으로 나누어, 동시에 실행되는 shard 수를 제한한다.
+    lanes = [
+        shards[i :: settings.GITHUB_UPDATE_CONCURRENCY]
+        for i in range(min(settings.GITHUB_UPDATE_CONCURRENCY, len(shards)))
+    ]
+    group(
+        chain(update_github_history_shard.si(shard, started_at) for shard in lane)
+        for lane in lanes
+    ).apply_async()
 
 
 @shared_task
@@ -178,3 +279,201 @@ def periodic_fail_check_github_history():
             user.status = ReturnCode.GITHUB_STATUS_FAILED
             user.last_update = datetime.now(tz=timezone.utc)
             user.save()
+
+
+def live_s3_keys(keys):
+    """
+    outbox에 들어간 뒤 다시 참조되기 시작한 key.
+    (같은 key로 다시 올린 프로필 이미지, 다시 등록된 resource link나 썸네일)
+    key로 만든 link와 정확히 같은 값을 index로 찾는다.
+    """
+    links = {s3_link(key): key for key in keys}
+    resource_links = [
+        link for link, key in links.items() if key.startswith("resources/")
+    ]
+    emails = {key.split("/")[1] for key in keys if key.startswith("users/")}
+
+    referenced = []
+    if resource_links:
+        referenced += S3ResourceReferenceCheck.objects.filter(
+            resource_link__in=resource_links
+        ).values_list("resource_link", flat=True)
+        referenced += Project.objects.filter(
+            thumbnail_image__in=resource_links
+        ).values_list("thumbnail_image", flat=True)
+    if emails:
+        referenced += User.objects.filter(
+            email__in=emails, profile_image_link__in=links
+        ).values_list("profile_image_link", flat=True)
+    return {links[link] for link in referenced}
+
+
+@shared_task(bind=True, max_retries=5, default_retry_delay=60)
+def drain_s3_deletion_outbox(self):
+    """
+    outbox에 쌓인 S3 object를 DeleteObjects로 한 번에 최대 1000개씩 삭제한다.
+    삭제 직전에 다시 참조되는 key는 삭제하지 않고 outbox에서 뺀다.
+    삭제에 실패한 key는 S3_DELETION_MAX_ATTEMPTS번까지 다음 실행에서 다시 시도한다.
+    """
+    s3_client = get_s3_client()
+    bucket_name = os.environ.get("AWS_S3_BUCKET_NAME")
+
+    last_id = 0
+    while True:
+        entries = list(
+            S3DeletionOutbox.objects.filter(id__gt=last_id)
+            .order_by("id")
+            .values_list("id", "key")[: settings.S3_DELETION_BATCH_SIZE]
+        )
+        if not entries:
+            return
+        last_id = entries[-1][0]
+
+        live_keys = live_s3_keys({key for _, key in entries})
+        keys = {key for _, key in entries} - live_keys
+        response = {}
+        if keys:
+            try:
+                response = s3_client.delete_objects(
+                    Bucket=bucket_name,
+                    Delete={
+                        "Objects": [{"Key": key} for key in keys],
+                        "Quiet": True,
+                    },
+                )
+            except (BotoCoreError, ClientError) as e:
+                raise self.retry(exc=e)
+
+        failed_keys = {error["Key"] for error in response.get("Errors", [])}
+        S3DeletionOutbox.objects.filter(
+            id__in=[entry_id for entry_id, key in entries if key not in failed_keys]
+        ).delete()
+        if failed_keys:
+            logging.error(f"Failed to delete S3 objects: {sorted(failed_keys)}")
+            failed = S3DeletionOutbox.objects.filter(
+                id__in=[entry_id for entry_id, key in entries if key in failed_keys]
+            )
+            failed.update(attempts=F("attempts") + 1)
+            failed.filter(attempts__gte=settings.S3_DELETION_MAX_ATTEMPTS).delete()
+
+
+def referenced_resource_keys():
+    # S3ResourceReferenceCheck와 프로젝트 썸네일(작은 이미지 포함)이 참조하는 resources/ 아래 key
+    links = list(
+        S3ResourceReferenceCheck.objects.values_list("resource_link", flat=True)
+    )
+    thumbnails = Project.objects.exclude(thumbnail_image__isnull=True).values_list(
+        "thumbnail_image", "thumbnail_image_variants"
+    )
+    for thumbnail_image, variants in thumbnails.iterator():
+        links.append(thumbnail_image)
+        links.extend(image_variant_links(variants))
+    return {"resources/" + link.split("/")[-1] for link in links if link}
+
+
+@shared_task
+def sweep_orphan_s3_resources():
+    """
+    resources/ 아래에서 아무도 참조하지 않는 object를 outbox에 넣는다.
+    업로드 직후 아직 참조가 등록되지 않은 object는 S3_ORPHAN_GRACE_PERIOD 동안 남겨둔다.
+    """
+    s3_client = get_s3_client()
+    bucket_name = os.environ.get("AWS_S3_BUCKET_NAME")
+    now = datetime.now(tz=timezone.utc)
+    created_before = now - timedelta(seconds=settings.S3_ORPHAN_GRACE_PERIOD)
+
+    referenced_keys = referenced_resource_keys()
+    pending_keys = set(S3DeletionOutbox.objects.values_list("key", flat=True))
+
+    paginator = s3_client.get_paginator("list_objects_v2")
+    for page in paginator.paginate(Bucket=bucket_name, Prefix="resources/"):
+        S3DeletionOutbox.objects.bulk_create(
+            S3DeletionOutbox(key=content["Key"], created_at=now)
+            for content in page.get("Contents", [])
+            if content["LastModified"] < created_before
+            and content["Key"] not in referenced_keys
+            and content["Key"] not in pending_keys
+        )
+
+
+IMAGE_VARIANT_TARGETS = {
+    # kind -> (S3 handler type, model, 원본 link 필드, variant 필드)
+    "profile": ("profile", User, "profile_image_link", "profile_image_variants"),
+    "thumbnail": (
+        "resource",
+        Project,
+        "thumbnail_image",
+        "thumbnail_image_variants",
+    ),
+}
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=30)
+def generate_image_variants(self, kind, object_id, image_link):
+    """
+    프로필 이미지, 프로젝트 썸네일의 작은 WebP/JPEG 이미지를 만들어 S3에 올리고 link를 기록한다.
+    그 사이 원본 이미지가 바뀌었다면 만든 이미지는 삭제 대상으로 넘긴다.
+    """
+    handler_type, model, link_field, variants_field = IMAGE_VARIANT_TARGETS[kind]
+    s3_handler = GeneralHandler(handler_type)
+    key = s3_handler.resource_keys(image_link)[0]
+    link_prefix = image_link[: -len(key)]
+    token = secrets.token_hex(4)
+    variants = defaultdict(dict)
+
+    try:
+        response = s3_handler.s3_client.get_object(
+            Bucket=s3_handler.aws_s3_bucket_name, Key=key
+        )
+        image_file = io.BytesIO(response["Body"].read())
+        for name, format, content_type, buffer in make_image_variants(image_file):
+            variant = variant_key(key, token, name, format)
+            s3_handler.s3_client.put_object(
+                Bucket=s3_handler.aws_s3_bucket_name,
+                Key=variant,
+                Body=buffer,
+                ContentType=content_type,
+            )
+            variants[name][format] = link_prefix + variant
+    except (BotoCoreError, ClientError) as e:
+        raise self.retry(exc=e)
+    except (UnidentifiedImageError, OSError):
+        # 이미지로 읽을 수 없는 파일이면 작은 이미지 없이 원본만 사용한다.
+        logging.exception(f"Failed to make image variants: {image_link}")
+        for link in image_variant_links(variants):
+            s3_handler.remove_resource(link)
+        return
+
+    # 저장 signal로 캐시가 무효화되도록 update() 대신 save()를 사용한다.
+    with transaction.atomic():
+        instance = (
+            model.objects.select_for_update()
+            .filter(id=object_id, **{link_field: image_link})
+            .first()
+        )
+        if instance is not None:
+            setattr(instance, variants_field, dict(variants))
+            instance.save(update_fields=[variants_field])
+    if instance is None:
+        for link in image_variant_links(variants):
+            s3_handler.remove_resource(link)
+
+
+def enqueue_image_variants(kind, object_id, image_link):
+    # 원본 link가 commit된 뒤에 실행해야 task가 최신 link와 비교할 수 있다.
+    transaction.on_commit(
+        lambda: generate_image_variants.delay(kind, object_id, image_link)
+    )
+
+
+# 추천 API에서 사용하는 무작위 sample pool
+SAMPLE_POOLS = {
+    "users": lambda: User.objects.filter(is_staff=False),
+    "projects": lambda: Project.objects.all(),
+}
+
+
+@shared_task
+def refresh_sample_pools():
+    for name, queryset in SAMPLE_POOLS.items():
+        refresh_sample_pool(name, queryset())
@@ -0,0 +1,33 @@
+from unittest import TestCase
+
+from common.checks import check_shared_cache
+from django.test import override_settings
+
+
+class SharedCacheCheckTest(TestCase):
+    def test_success_shared_cache(self):
+        # Given: 공유 cache(Redis)를 사용하는 설정
+        caches = {
+            "default": {
+                "BACKEND": "django.core.cache.backends.redis.RedisCache",
+                "LOCATION": "redis://localhost:6379/0",
+            }
+        }
+        with override_settings(CACHES=caches):
+            # When: 배포 check를 실행할 때
+            errors = check_shared_cache(None)
+
+        # Then: 오류가 없다.
+        self.assertEqual(errors, [])
+
+    def test_fail_process_local_cache(self):
+        # Given: process마다 따로인 LocMemCache를 사용하는 설정
+        caches = {
+            "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+        }
+        with override_settings(CACHES=caches):
+            # When: 배포 check를 실행할 때
+            errors = check_shared_cache(None)
+
+        # Then: 공유 cache를 사용하라는 오류를 낸다.
+        self.assertEqual([error.id for error in errors], ["common.E001"])
@@ -0,0 +1,149 @@
+import io
+import os
+from datetime import datetime, timezone
+from unittest import TestCase
+from unittest.mock import patch
+
+from common.s3.images import convert_image_to_jpeg
+from common.stubs.s3 import S3Stub
+from common.tasks import generate_image_variants
+from django.test import override_settings
+from PIL import Image
+from projects.models import Project
+from resources.models import S3DeletionOutbox
+from users.models import User
+
+BUCKET = "test-bucket"
+LINK_PREFIX = f"https://{BUCKET}.s3.ap-northeast-2.amazonaws.com/"
+
+
+def jpeg(width, height):
+    buffer = io.BytesIO()
+    Image.new("RGB", (width, height), "red").save(buffer, format="JPEG")
+    return buffer.getvalue()
+
+
+@patch.dict(
+    os.environ,
+    {
+        "AWS_S3_BUCKET_NAME": BUCKET,
+        "AWS_ACCESS_KEY_ID": "test",
+        "AWS_SECRET_ACCESS_KEY": "test",
+        "AWS_DEFAULT_REGION": "ap-northeast-2",
+    },
+)
+class GenerateImageVariantsTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="test@email.com", password="testpassword", name="test"
+        )
+        self.project = Project.objects.create(
+            owner=self.user,
+            title="test",
+            created_at=datetime.now(tz=timezone.utc),
+            thumbnail_image=LINK_PREFIX + "resources/thumbnail.jpg",
+        )
+
+    def tearDown(self):
+        User.objects.all().delete()
+        S3DeletionOutbox.objects.all().delete()
+
+    def generate(self, stub, kind, object_id, image_link):
+        with override_settings(
+            AWS_S3_ENDPOINT_URL=stub.url,
+            IMAGE_VARIANT_SIZES={"small": 100, "medium": 300},
+        ):
+            generate_image_variants(kind, object_id, image_link)
+
+    def test_success_thumbnail(self):
+        # Given: S3에 올라간 큰 썸네일 이미지
+        bodies = {f"{BUCKET}/resources/thumbnail.jpg": jpeg(2000, 1000)}
+        with S3Stub(bodies=bodies) as stub:
+            # When: 작은 이미지를 만들 때
+            self.generate(
+                stub, "thumbnail", self.project.id, self.project.thumbnail_image
+            )
+
+        # Then: 크기별로 WebP, JPEG 이미지를 올리고 link를 기록한다.
+        self.project.refresh_from_db()
+        variants = self.project.thumbnail_image_variants
+        self.assertEqual(set(variants), {"small", "medium"})
+        self.assertEqual(len(stub.uploads), 4)
+        for name, width in (("small", 100), ("medium", 300)):
+            self.assertEqual(set(variants[name]), {"webp", "jpeg"})
+            for format, link in variants[name].items():
+                self.assertTrue(link.startswith(LINK_PREFIX + "resources/thumbnail-"))
+                self.assertTrue(link.endswith(f"-{name}.{format}"))
+                image = Image.open(
+                    io.BytesIO(stub.uploads[BUCKET + "/" + link[len(LINK_PREFIX) :]])
+                )
+                self.assertEqual(image.format, format.upper())
+                self.assertEqual(image.size, (width, width // 2))
+
+    def test_success_profile(self):
+        # Given: S3에 올라간 프로필 이미지
+        key = "users/test@email.com/profile/image/profile-image.jpeg"
+        self.user.profile_image_link = LINK_PREFIX + key
+        self.user.save()
+        with S3Stub(bodies={f"{BUCKET}/{key}": jpeg(800, 800)}) as stub:
+            # When: 작은 이미지를 만들 때
+            self.generate(stub, "profile", self.user.id, self.user.profile_image_link)
+
+        # Then: 프로필 이미지와 같은 경로에 작은 이미지를 기록한다.
+        self.user.refresh_from_db()
+        link = self.user.profile_image_variants["small"]["webp"]
+        self.assertTrue(
+            link.startswith(
+                LINK_PREFIX + "users/test@email.com/profile/image/profile-image-"
+            )
+        )
+
+    def test_success_discard_stale(self):
+        # Given: 작은 이미지를 만드는 사이 썸네일이 바뀐 프로젝트
+        bodies = {f"{BUCKET}/resources/thumbnail.jpg": jpeg(400, 400)}
+        stale_link = self.project.thumbnail_image
+        self.project.thumbnail_image = LINK_PREFIX + "resources/new.jpg"
+        self.project.save()
+
+        with S3Stub(bodies=bodies) as stub:
+            # When: 이전 썸네일로 작은 이미지를 만들 때
+            self.generate(stub, "thumbnail", self.project.id, stale_link)
+
+        # Then: link를 기록하지 않고, 만든 이미지는 삭제 대상으로 넘긴다.
+        self.project.refresh_from_db()
+        self.assertIsNone(self.project.thumbnail_image_variants)
+        self.assertEqual(
+            set(S3DeletionOutbox.objects.values_list("key", flat=True)),
+            {key[len(BUCKET) + 1 :] for key in stub.uploads},
+        )
+
+    def test_success_skip_invalid_image(self):
+        # Given: 이미지로 읽을 수 없는 썸네일 파일
+        bodies = {f"{BUCKET}/resources/thumbnail.jpg": b"not an image"}
+        with S3Stub(bodies=bodies) as stub:
+            # When: 작은 이미지를 만들 때
+            self.generate(
+                stub, "thumbnail", self.project.id, self.project.thumbnail_image
+            )
+
+        # Then: 아무것도 올리지 않고 link도 기록하지 않는다.
+        self.project.refresh_from_db()
+        self.assertIsNone(self.project.thumbnail_image_variants)
+        self.assertEqual(stub.uploads, {})
+
+
+class ConvertImageToJpegTest(TestCase):
+    def test_success_limit_size(self):
+        # Given: 큰 PNG 이미지
+        buffer = io.BytesIO()
+        Image.new("RGBA", (3000, 1500)).save(buffer, format="PNG")
+        buffer.seek(0)
+
+        # When: JPEG로 변환할 때
+        with override_settings(IMAGE_MAX_SIZE=1024):
+            converted = convert_image_to_jpeg(buffer)
+
+        # Then: 긴 변이 IMAGE_MAX_SIZE 이하인 JPEG로 변환한다.
+        image = Image.open(converted)
+        self.assertEqual(image.format, "JPEG")
+        self.assertEqual(image.size, (1024, 512))
@@ -0,0 +1,73 @@
+from unittest import TestCase
+
+from common.keywords import count_keywords, dependency_names, top_keywords
+
+
+class CountKeywordsTest(TestCase):
+    def test_success(self):
+        # Given: package 이름이 들어있는 SBOM 문서
+        dependency = {
+            "sbom": {
+                "name": "com.github.tester/repo",
+                "packages": [
+                    {"name": "npm:react@18.2.0"},
+                    {"name": "pip:django-rest-framework"},
+                    {"name": "npm:react-dom", "versionInfo": "18.2.0"},
+                    "ignored",
+                ],
+            }
+        }
+
+        # When: keyword를 셀 때
+        keywords = count_keywords([dependency, dependency])
+
+        # Then: keyword 목록에 있는 단어만 센다.
+        self.assertEqual(keywords["react"], 4)
+        self.assertEqual(keywords["django"], 2)
+        self.assertNotIn("npm", keywords)
+        self.assertNotIn("ignored", keywords)
+
+    def test_success_nested_names(self):
+        # Given: 중첩된 SBOM 문서
+        dependency = {
+            "a": {"name": "first"},
+            "name": "second",
+            "b": [{"name": "third", "c": {"name": "fourth"}}, [{"name": "skip"}]],
+        }
+
+        # When: 이름을 모을 때
+        # Then: list 안의 list를 제외한 모든 이름을 반환한다.
+        self.assertEqual(
+            sorted(dependency_names([dependency])),
+            ["first", "fourth", "second", "third"],
+        )
+
+    def test_success_top_keywords(self):
+        # Given: 횟수가 같은 keyword가 섞인 결과
+        keywords = count_keywords(
+            [{"name": "vue"}, {"name": "react"}, {"name": "react-dom"}]
+        )
+
+        # When: 상위 keyword를 고를 때
+        # Then: 횟수, 단어 순으로 고른다.
+        self.assertEqual(top_keywords(keywords, 2), {"react": 2, "vue": 1})
+
+    def test_success_deep_document(self):
+        # Given: 재귀 한도보다 깊은 SBOM 문서
+        dependency = {"name": "react"}
+        for _ in range(5000):
+            dependency = {"child": dependency}
+
+        # When: keyword를 셀 때
+        keywords = count_keywords([dependency])
+
+        # Then: 끝까지 순회한다.
+        self.assertEqual(keywords["react"], 1)
+
+    def test_not_dict(self):
+        # Given: 잘못된 SBOM 응답
+        # When: keyword를 셀 때
+        keywords = count_keywords([[], "react", None])
+
+        # Then: 아무것도 세지 않는다.
+        self.assertEqual(len(keywords), 0)
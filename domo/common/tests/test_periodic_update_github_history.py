@@ -0,0 +1,144 @@
+import time
+from datetime import datetime, timedelta, timezone
+from unittest import TestCase
+from unittest.mock import patch
+
+from celery import current_app
+from celery.exceptions import Retry
+from common.const import ReturnCode
+from common.rate_limit import LockTimeout, TokenBucket
+from common.stubs.github import GithubStub
+from common.tasks import (
+    GITHUB_UPDATE_RUN_CACHE_KEY,
+    github_rate_limit,
+    periodic_update_github_history,
+    update_github_history_shard,
+)
+from django.core.cache import cache
+from django.test import override_settings
+from external_histories.models import GithubResponseCache, GithubStatus, UserStack
+from users.models import User
+
+
+class PeriodicUpdateGithubHistoryTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        current_app.conf.task_always_eager = True
+        self.repositories = {
+            f"tester{i}": {"repo": ({"Python": i + 1}, {})} for i in range(5)
+        }
+        self.users = [
+            User.objects.create_user(
+                email=f"test{i}@email.com",
+                password="testpassword",
+                name=f"test{i}",
+                github_link=f"https://github.com/tester{i}",
+            )
+            for i in range(5)
+        ]
+
+    def tearDown(self):
+        current_app.conf.task_always_eager = False
+        cache.clear()
+        User.objects.all().delete()
+        GithubResponseCache.objects.all().delete()
+
+    def run_periodic(self, stub):
+        with override_settings(
+            GITHUB_API_URL=stub.url,
+            GITHUB_UPDATE_SHARD_SIZE=2,
+            GITHUB_UPDATE_CONCURRENCY=2,
+        ):
+            periodic_update_github_history()
+
+    def test_success_all_users(self):
+        # Given: github 링크가 있는 사용자 5명
+        with GithubStub(self.repositories) as stub:
+            # When: 주기적 업데이트를 실행할 때
+            self.run_periodic(stub)
+
+        # Then: 모든 사용자의 github history가 업데이트된다.
+        statuses = GithubStatus.objects.filter(user__in=self.users)
+        self.assertEqual(statuses.count(), 5)
+        self.assertTrue(
+            all(s.status == ReturnCode.GITHUB_STATUS_COMPLETE for s in statuses)
+        )
+        for i, user in enumerate(self.users):
+            self.assertEqual(
+                UserStack.objects.get(user=user, language="Python").code_amount, i + 1
+            )
+
+    def test_success_resume(self):
+        # Given: 진행 중인 실행에서 이미 완료된 사용자 2명
+        started_at = datetime.now(tz=timezone.utc) - timedelta(hours=1)
+        cache.set(GITHUB_UPDATE_RUN_CACHE_KEY, started_at.isoformat())
+        for user in self.users[:2]:
+            GithubStatus.objects.create(
+                user=user,
+                status=ReturnCode.GITHUB_STATUS_COMPLETE,
+                last_update=started_at + timedelta(minutes=10),
+            )
+
+        with GithubStub(self.repositories) as stub:
+            # When: 주기적 업데이트를 다시 실행할 때
+            self.run_periodic(stub)
+
+        # Then: 완료되지 않은 사용자만 업데이트한다.
+        requested_accounts = {path.split("/")[2] for path in stub.paths}
+        self.assertEqual(requested_accounts, {"tester2", "tester3", "tester4"})
+
+    def test_retry_when_rate_limited(self):
+        # Given: rate limit이 소진된 상태
+        github_rate_limit().record(0, remaining=0, reset=int(time.time()) + 60)
+        user_ids = [user.id for user in self.users]
+        started_at = datetime.now(tz=timezone.utc).isoformat()
+
+        # When: shard를 실행할 때
+        with patch.object(
+            update_github_history_shard, "retry", side_effect=Retry()
+        ) as retry:
+            with self.assertRaises(Retry):
+                update_github_history_shard(user_ids, started_at)
+
+        # Then: 남은 사용자로 rate limit 초기화 이후에 다시 시도한다.
+        self.assertEqual(retry.call_args.kwargs["args"], (user_ids, started_at))
+        self.assertGreater(retry.call_args.kwargs["countdown"], 50)
+        self.assertFalse(GithubStatus.objects.filter(user__in=self.users).exists())
+
+
+class TokenBucketTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.bucket = TokenBucket("test:bucket", per_hour=3600, burst=10)
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_wait_until_refilled(self):
+        # Given: token을 모두 사용한 bucket
+        # When: 대기 시간을 확인할 때
+        self.bucket.record(15)
+
+        # Then: 부족한 token이 다시 채워질 때까지 기다려야 한다.
+        self.assertAlmostEqual(self.bucket.wait_time(), 5, delta=0.5)
+
+    def test_no_wait_with_tokens(self):
+        # Given: token이 남은 bucket
+        # When: 대기 시간을 확인할 때
+        self.bucket.record(5, remaining=100)
+
+        # Then: 바로 요청할 수 있다.
+        self.assertEqual(self.bucket.wait_time(), 0)
+
+    def test_fail_lock_held_by_other(self):
+        # Given: 다른 process가 잡고 있는 lock
+        cache.set("test:bucket:lock", "other", 60)
+
+        # When: lock을 기다리다 시간이 지나면
+        with patch("common.rate_limit.LOCK_TIMEOUT", 0.05):
+            with self.assertRaises(LockTimeout):
+                self.bucket.wait_time()
+
+        # Then: lock 없이 진행하지 않고, 다른 process의 lock도 지우지 않는다.
+        self.assertEqual(cache.get("test:bucket:lock"), "other")
+        self.assertIsNone(cache.get("test:bucket"))
@@ -0,0 +1,130 @@
+import os
+from datetime import datetime, timezone
+from unittest import TestCase
+from unittest.mock import patch
+
+from common.s3.handler import GeneralHandler
+from common.stubs.s3 import S3Stub
+from common.tasks import drain_s3_deletion_outbox, sweep_orphan_s3_resources
+from django.test import override_settings
+from projects.models import Project
+from resources.models import S3DeletionOutbox, S3ResourceReferenceCheck
+from users.models import User
+
+BUCKET = "test-bucket"
+LINK_PREFIX = f"https://{BUCKET}.s3.ap-northeast-2.amazonaws.com/resources/"
+
+
+@patch.dict(
+    os.environ,
+    {
+        "AWS_S3_BUCKET_NAME": BUCKET,
+        "AWS_ACCESS_KEY_ID": "test",
+        "AWS_SECRET_ACCESS_KEY": "test",
+        "AWS_DEFAULT_REGION": "ap-northeast-2",
+    },
+)
+class S3CleanupTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="test@email.com", password="testpassword", name="test"
+        )
+
+    def tearDown(self):
+        User.objects.all().delete()
+        S3DeletionOutbox.objects.all().delete()
+
+    def test_success_remove_resource_deferred(self):
+        # Given: S3에 존재하는 resource
+        with S3Stub([f"{BUCKET}/resources/a.png"]) as stub:
+            with override_settings(AWS_S3_ENDPOINT_URL=stub.url):
+                # When: resource를 삭제할 때
+                result = GeneralHandler("resource").remove_resource("a.png")
+
+        # Then: S3에 요청하지 않고 outbox에만 기록한다.
+        self.assertTrue(result)
+        self.assertEqual(stub.request_count, 0)
+        self.assertEqual(
+            list(S3DeletionOutbox.objects.values_list("key", flat=True)),
+            ["resources/a.png"],
+        )
+
+    def test_success_drain_in_batches(self):
+        # Given: outbox에 쌓인 key 25개
+        keys = [f"resources/{i}.png" for i in range(25)]
+        now = datetime.now(tz=timezone.utc)
+        S3DeletionOutbox.objects.bulk_create(
+            S3DeletionOutbox(key=key, created_at=now) for key in keys
+        )
+
+        with S3Stub([f"{BUCKET}/{key}" for key in keys] + [f"{BUCKET}/keep"]) as stub:
+            with override_settings(
+                AWS_S3_ENDPOINT_URL=stub.url, S3_DELETION_BATCH_SIZE=10
+            ):
+                # When: outbox를 비울 때
+                drain_s3_deletion_outbox()
+
+        # Then: 10개씩 묶어서 삭제하고 outbox를 비운다.
+        self.assertEqual(stub.delete_request_count, 3)
+        self.assertEqual(list(stub.keys), [f"{BUCKET}/keep"])
+        self.assertFalse(S3DeletionOutbox.objects.exists())
+
+    def test_success_skip_live_keys(self):
+        # Given: outbox에 들어간 뒤 다시 등록된 resource, 같은 key로 다시 올린 프로필 이미지
+        profile_key = "users/test@email.com/profile/image/profile-image.jpeg"
+        keys = ["resources/again.png", profile_key, "resources/removed.png"]
+        now = datetime.now(tz=timezone.utc)
+        S3DeletionOutbox.objects.bulk_create(
+            S3DeletionOutbox(key=key, created_at=now) for key in keys
+        )
+        S3ResourceReferenceCheck.objects.create(
+            resource_link=LINK_PREFIX + "again.png", owner=self.user
+        )
+        self.user.profile_image_link = (
+            f"https://{BUCKET}.s3.ap-northeast-2.amazonaws.com/{profile_key}"
+        )
+        self.user.save()
+
+        with S3Stub([f"{BUCKET}/{key}" for key in keys]) as stub:
+            with override_settings(AWS_S3_ENDPOINT_URL=stub.url):
+                # When: outbox를 비울 때
+                drain_s3_deletion_outbox()
+
+        # Then: 다시 참조되는 key는 남기고, outbox는 비운다.
+        self.assertEqual(
+            sorted(stub.keys),
+            [f"{BUCKET}/resources/again.png", f"{BUCKET}/{profile_key}"],
+        )
+        self.assertFalse(S3DeletionOutbox.objects.exists())
+
+    def test_success_sweep_orphans(self):
+        # Given: 참조되는 resource, 썸네일, 최근 업로드된 resource, 고아 resource
+        S3ResourceReferenceCheck.objects.create(
+            resource_link=LINK_PREFIX + "referenced.png", owner=self.user
+        )
+        Project.objects.create(
+            owner=self.user,
+            title="test",
+            created_at=datetime.now(tz=timezone.utc),
+            thumbnail_image=LINK_PREFIX + "thumbnail.png",
+        )
+        S3DeletionOutbox.objects.create(
+            key="resources/pending.png", created_at=datetime.now(tz=timezone.utc)
+        )
+        keys = {
+            f"{BUCKET}/resources/{name}": datetime(2020, 1, 1, tzinfo=timezone.utc)
+            for name in ("referenced.png", "thumbnail.png", "orphan.png", "pending.png")
+        }
+        keys[f"{BUCKET}/resources/recent.png"] = datetime.now(tz=timezone.utc)
+        keys[f"{BUCKET}/users/profile.png"] = datetime(2020, 1, 1, tzinfo=timezone.utc)
+
+        with S3Stub(keys, page_size=2) as stub:
+            with override_settings(AWS_S3_ENDPOINT_URL=stub.url):
+                # When: 고아 resource를 찾을 때
+                sweep_orphan_s3_resources()
+
+        # Then: 오래되고 참조되지 않은 resource만 한 번씩 outbox에 넣는다.
+        self.assertEqual(
+            sorted(S3DeletionOutbox.objects.values_list("key", flat=True)),
+            ["resources/orphan.png", "resources/pending.png"],
+        )
@@ -0,0 +1,114 @@
+import os
+from unittest import TestCase
+from unittest.mock import patch
+
+from common.s3.handler import GeneralHandler, ProfileImageUploader
+from common.stubs.s3 import S3Stub
+from django.core.cache import cache
+from django.test import override_settings
+
+BUCKET = "test-bucket"
+
+
+class CheckResourceLinksTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.links = [
+            f"https://{BUCKET}.s3.ap-northeast-2.amazonaws.com/resources/{i}.png"
+            for i in range(8)
+        ]
+        self.keys = [f"{BUCKET}/resources/{i}.png" for i in range(8)]
+
+    def tearDown(self):
+        cache.clear()
+
+    def handler(self, stub):
+        handler = GeneralHandler("resource")
+        handler.aws_s3_bucket_name = BUCKET
+        handler.s3_client = stub.client()
+        return handler
+
+    def test_success(self):
+        # Given: S3에 존재하는 resource 8개
+        with S3Stub(self.keys, latency=0.05) as stub:
+            # When: resource link를 확인할 때
+            result = self.handler(stub).check_resource_links(self.links)
+
+        # Then: 모두 존재하며, HEAD 요청을 동시에 보낸다.
+        self.assertTrue(result)
+        self.assertEqual(stub.request_count, 8)
+        self.assertGreater(stub.max_in_flight, 1)
+
+    def test_success_verified_cache(self):
+        # Given: 최근에 확인한 resource
+        with S3Stub(self.keys) as stub:
+            self.handler(stub).check_resource_links(self.links[:4])
+
+            # When: 다시 확인할 때
+            result = self.handler(stub).check_resource_links(self.links)
+
+        # Then: 확인하지 않은 resource만 요청한다.
+        self.assertTrue(result)
+        self.assertEqual(stub.request_count, 8)
+
+    def test_fail_not_exist(self):
+        # Given: 일부가 S3에 없는 resource
+        with S3Stub(self.keys[1:]) as stub:
+            # When: resource link를 확인할 때
+            handler = self.handler(stub)
+            result = handler.check_resource_links(self.links)
+
+            # Then: 실패하며, 다시 확인할 때 캐시를 사용하지 않는다.
+            self.assertFalse(result)
+            self.assertFalse(handler.check_resource_links(self.links[0]))
+
+    def test_success_profile(self):
+        # Given: S3에 존재하는 프로필 이미지
+        link = (
+            f"https://{BUCKET}.s3.ap-northeast-2.amazonaws.com/"
+            "users/test@email.com/profile/image/profile-image.jpeg"
+        )
+        key = f"{BUCKET}/users/test@email.com/profile/image/profile-image.jpeg"
+        with S3Stub([key]) as stub:
+            handler = GeneralHandler("profile")
+            handler.aws_s3_bucket_name = BUCKET
+            handler.s3_client = stub.client()
+
+            # When: 프로필 이미지 link를 확인할 때
+            # Then: 존재한다.
+            self.assertTrue(handler.check_resource_links(link))
+
+
+class S3ClientTest(TestCase):
+    def test_success_shared_client(self):
+        # Given: 여러 S3 handler
+        # When: handler를 생성할 때
+        handlers = [GeneralHandler("resource"), GeneralHandler("profile")]
+        uploader = ProfileImageUploader()
+
+        # Then: 같은 client를 재사용한다.
+        self.assertIs(handlers[0].s3_client, handlers[1].s3_client)
+        self.assertIs(handlers[0].s3_client, uploader.s3_client)
+
+    @patch.dict(
+        os.environ,
+        {
+            "AWS_S3_BUCKET_NAME": BUCKET,
+            "AWS_ACCESS_KEY_ID": "test",
+            "AWS_SECRET_ACCESS_KEY": "test",
+            "AWS_DEFAULT_REGION": "ap-northeast-2",
+        },
+    )
+    def test_success_endpoint(self):
+        # Given: 로컬 S3 stand-in endpoint 설정
+        cache.clear()
+        link = f"https://{BUCKET}.s3.ap-northeast-2.amazonaws.com/resources/a.png"
+        with S3Stub([f"{BUCKET}/resources/a.png"]) as stub:
+            with override_settings(AWS_S3_ENDPOINT_URL=stub.url):
+                # When: resource link를 확인할 때
+                result = GeneralHandler("resource").check_resource_links(link)
+
+        # Then: 설정한 endpoint로 요청한다.
+        cache.clear()
+        self.assertTrue(result)
+        self.assertEqual(stub.request_count, 1)
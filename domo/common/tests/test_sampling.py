@@ -0,0 +1,76 @@
+from datetime import datetime, timezone
+from unittest import TestCase
+
+from common.sampling import pooled_sample, sample
+from common.tasks import refresh_sample_pools
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from users.models import User
+
+
+class SamplingTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        created_at = datetime.now(tz=timezone.utc)
+        User.objects.bulk_create(
+            User(
+                email=f"test{i}@email.com",
+                password="testpassword",
+                name=f"test{i}",
+                created_at=created_at,
+                is_staff=i % 10 == 0,
+            )
+            for i in range(200)
+        )
+        self.users = User.objects.filter(is_staff=False)
+
+    def tearDown(self):
+        User.objects.all().delete()
+        cache.clear()
+
+    def test_sample(self):
+        # Given: staff가 섞인 사용자 200명
+        # When: staff가 아닌 사용자 6명을 무작위로 고를 때
+        with CaptureQueriesContext(connection) as context:
+            users = sample(self.users, 6)
+
+        # Then: 조건에 맞는 서로 다른 6명을 적은 쿼리로 고른다.
+        self.assertEqual(len({user.id for user in users}), 6)
+        self.assertTrue(all(not user.is_staff for user in users))
+        self.assertLessEqual(len(context.captured_queries), 10)
+
+    def test_sample_more_than_rows(self):
+        # Given: 조건에 맞는 사용자가 k보다 적을 때
+        users = self.users.filter(name__in=["test1", "test2"])
+
+        # When: 6명을 고를 때
+        sampled = sample(users, 6)
+
+        # Then: 조건에 맞는 사용자를 모두 반환한다.
+        self.assertEqual(sorted(user.name for user in sampled), ["test1", "test2"])
+
+    @override_settings(SAMPLE_POOL_SIZE=20)
+    def test_pooled_sample(self):
+        # Given: 미리 뽑아 둔 sample pool
+        refresh_sample_pools()
+        pool = set(cache.get("sample_pool:users"))
+        self.assertEqual(len(pool), 20)
+
+        # When: pool에서 6명을 고를 때
+        with CaptureQueriesContext(connection) as context:
+            users = pooled_sample("users", self.users, 6)
+
+        # Then: pool 안에서 쿼리 1개로 고른다.
+        self.assertEqual(len(users), 6)
+        self.assertTrue({user.id for user in users} <= pool)
+        self.assertEqual(len(context.captured_queries), 1)
+
+    def test_pooled_sample_without_pool(self):
+        # Given: 아직 pool이 없을 때
+        # When: 6명을 고를 때
+        users = pooled_sample("users", self.users, 6)
+
+        # Then: 직접 무작위로 고른다.
+        self.assertEqual(len({user.id for user in users}), 6)
@@ -0,0 +1,229 @@
+from datetime import datetime, timezone
+from unittest import TestCase
+
+from common.const import ReturnCode
+from common.stubs.github import GithubStub
+from common.tasks import update_github_history
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from external_histories.models import (
+    GithubResponseCache,
+    GithubStatus,
+    UserKeyword,
+    UserStack,
+)
+from users.models import User
+
+
+def sbom(*names):
+    return {"sbom": {"packages": [{"name": name} for name in names]}}
+
+
+class UpdateGithubHistoryTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="test@email.com", password="testpassword", name="test"
+        )
+        self.github_status = GithubStatus.objects.create(
+            user=self.user,
+            status=ReturnCode.GITHUB_STATUS_IN_PROGRESS,
+            last_update=datetime.now(tz=timezone.utc),
+        )
+        self.repositories = {
+            "tester": {
+                "repo1": ({"Python": 100, "Shell": 10}, sbom("npm:react", "django")),
+                "repo2": ({"Python": 50}, sbom("npm:react@18.2.0")),
+                "repo3": ({"TypeScript": 30}, {}),
+            }
+        }
+
+    def tearDown(self):
+        User.objects.all().delete()
+        GithubResponseCache.objects.all().delete()
+
+    def update(self, stub, github_link="https://github.com/tester"):
+        with override_settings(GITHUB_API_URL=stub.url):
+            return update_github_history(self.user.id, github_link)
+
+    def test_success(self):
+        # Given: repository가 3개인 github 계정
+        with GithubStub(self.repositories) as stub:
+            # When: github history를 업데이트할 때
+            result = self.update(stub)
+
+        # Then: 모든 repository의 stack과 keyword를 저장한다.
+        self.assertEqual(result, ReturnCode.HISTORY_UPDATE_SUCCESS)
+        stacks = dict(
+            UserStack.objects.filter(user=self.user).values_list(
+                "language", "code_amount"
+            )
+        )
+        self.assertEqual(stacks, {"Python": 150, "Shell": 10, "TypeScript": 30})
+        keywords = dict(
+            UserKeyword.objects.filter(user=self.user).values_list("keyword", "count")
+        )
+        self.assertEqual(keywords["react"], 2)
+        self.assertEqual(keywords["django"], 1)
+        self.github_status.refresh_from_db()
+        self.assertEqual(self.github_status.status, ReturnCode.GITHUB_STATUS_COMPLETE)
+
+    def test_success_fetch_concurrently(self):
+        # Given: 응답이 느린 github 계정
+        with GithubStub(self.repositories, latency=0.05) as stub:
+            # When: github history를 업데이트할 때
+            self.update(stub)
+
+        # Then: repository 요청을 동시에 보낸다.
+        self.assertEqual(stub.request_count, 2 + 2 * len(self.repositories["tester"]))
+        self.assertGreater(stub.max_in_flight, 1)
+
+    def test_success_replace_previous_history(self):
+        # Given: 이전 stack이 저장된 사용자
+        UserStack.objects.create(user=self.user, language="C++", code_amount=1000)
+        with GithubStub(self.repositories) as stub:
+            # When: github history를 업데이트할 때
+            self.update(stub)
+
+        # Then: 이전 stack은 삭제된다.
+        self.assertFalse(
+            UserStack.objects.filter(user=self.user, language="C++").exists()
+        )
+
+    def test_query_count_does_not_grow(self):
+        # Given: repository 수가 다른 두 github 계정
+        def count_queries(repo_count):
+            self.repositories["tester"] = {
+                f"repo{i}": ({f"Lang{i}": i, "Python": 1}, sbom("django", f"pkg{i}"))
+                for i in range(repo_count)
+            }
+            with GithubStub(self.repositories) as stub:
+                # When: github history를 업데이트할 때
+                with CaptureQueriesContext(connection) as context:
+                    self.update(stub)
+            GithubResponseCache.objects.all().delete()
+            return len(context.captured_queries)
+
+        # Then: 쿼리 수는 repository 수와 관계없이 일정하다.
+        self.assertEqual(count_queries(3), count_queries(30))
+        self.assertEqual(UserStack.objects.filter(user=self.user).count(), 31)
+
+    def test_success_follow_pagination(self):
+        # Given: repository가 150개인 github 계정
+        self.repositories["tester"] = {
+            f"repo{i}": ({"Python": 1}, {}) for i in range(150)
+        }
+        with GithubStub(self.repositories) as stub:
+            # When: github history를 업데이트할 때
+            self.update(stub)
+
+        # Then: 100개씩 두 페이지를 모두 읽는다.
+        repo_pages = [path for path in stub.paths if path.startswith("/users/tester/")]
+        self.assertEqual(len(repo_pages), 2)
+        self.assertTrue(all("per_page=100" in path for path in repo_pages))
+        self.assertEqual(
+            UserStack.objects.get(user=self.user, language="Python").code_amount, 150
+        )
+
+    def test_success_conditional_request(self):
+        # Given: 한 번 업데이트된 github 계정
+        with GithubStub(self.repositories) as stub:
+            self.update(stub)
+            first_stacks = list(
+                UserStack.objects.filter(user=self.user)
+                .order_by("language")
+                .values_list("language", "code_amount")
+            )
+
+            # When: 변경 없이 다시 업데이트할 때
+            result = self.update(stub)
+
+        # Then: 모든 요청이 304로 응답되고, 캐시된 응답으로 같은 결과를 저장한다.
+        self.assertEqual(result, ReturnCode.HISTORY_UPDATE_SUCCESS)
+        self.assertEqual(stub.not_modified_count, stub.request_count // 2)
+        self.assertEqual(
+            list(
+                UserStack.objects.filter(user=self.user)
+                .order_by("language")
+                .values_list("language", "code_amount")
+            ),
+            first_stacks,
+        )
+
+    def test_success_remove_stale_cache(self):
+        # Given: 한 번 업데이트된 github 계정
+        with GithubStub(self.repositories) as stub:
+            self.update(stub)
+
+            # When: repository가 삭제된 후 다시 업데이트할 때
+            del self.repositories["tester"]["repo3"]
+            self.update(stub)
+
+        # Then: 삭제된 repository의 캐시는 지워진다.
+        self.assertFalse(
+            GithubResponseCache.objects.filter(
+                url__startswith="/repos/tester/repo3/"
+            ).exists()
+        )
+        self.assertTrue(
+            GithubResponseCache.objects.filter(
+                url__startswith="/repos/tester/repo1/"
+            ).exists()
+        )
+
+    def test_fail_repository_page_error(self):
+        # Given: 150개 repository 중 두 번째 목록 페이지 요청이 실패하는 github 계정
+        self.repositories["tester"] = {
+            f"repo{i}": ({"Python": 1}, {}) for i in range(150)
+        }
+        with GithubStub(self.repositories) as stub:
+            self.update(stub)
+            stub.failing_paths.add("/users/tester/repos?per_page=100&page=2")
+
+            # When: 다시 github history를 업데이트할 때
+            result = self.update(stub)
+
+        # Then: 일부 목록으로 저장하거나 캐시를 정리하지 않고 실패로 기록한다.
+        self.assertEqual(result, ReturnCode.GITHUB_FETCH_INCOMPLETE)
+        self.assertTrue(
+            GithubResponseCache.objects.filter(
+                url__startswith="/repos/tester/repo149/"
+            ).exists()
+        )
+        self.github_status.refresh_from_db()
+        self.assertEqual(self.github_status.status, ReturnCode.GITHUB_STATUS_FAILED)
+
+    def test_fail_malformed_response(self):
+        # Given: repository 목록이 잘린 JSON으로 응답되는 github 계정
+        path = "/users/tester/repos?per_page=100&page=1"
+        with GithubStub(self.repositories, malformed_paths=[path]) as stub:
+            # When: github history를 업데이트할 때
+            result = self.update(stub)
+
+        # Then: task가 중단되지 않고 실패로 기록한다.
+        self.assertEqual(result, ReturnCode.GITHUB_FETCH_INCOMPLETE)
+        self.github_status.refresh_from_db()
+        self.assertEqual(self.github_status.status, ReturnCode.GITHUB_STATUS_FAILED)
+
+    def test_fail_account_not_found(self):
+        # Given: 존재하지 않는 github 계정
+        UserStack.objects.create(user=self.user, language="C++", code_amount=1000)
+        with GithubStub(self.repositories) as stub:
+            # When: github history를 업데이트할 때
+            result = self.update(stub, "https://github.com/unknown/")
+
+        # Then: 실패 상태로 기록하고 stack을 삭제한다.
+        self.assertEqual(result, ReturnCode.CANNOT_FIND_GITHUB_ACCOUNT)
+        self.assertFalse(UserStack.objects.filter(user=self.user).exists())
+        self.github_status.refresh_from_db()
+        self.assertEqual(self.github_status.status, ReturnCode.GITHUB_STATUS_FAILED)
+
+    def test_fail_no_github_link(self):
+        # Given: github 링크가 없는 사용자
+        # When: github history를 업데이트할 때
+        result = update_github_history(self.user.id, "")
+
+        # Then: 실패 상태로 기록한다.
+        self.assertEqual(result, ReturnCode.NO_GITHUB_URL)
+        self.github_status.refresh_from_db()
+        self.assertEqual(self.github_status.status, ReturnCode.GITHUB_STATUS_FAILED)
@@ -21,6 +21,21 @@ app.conf.update(
             "schedule": crontab(minute=0, hour=15),
             "args": (),
         },
+        "s3-deletion-drain-every-minute": {
+            "task": "common.tasks.drain_s3_deletion_outbox",
+            "schedule": crontab(),
+            "args": (),
+        },
+        "sample-pool-refresh-every-10-minutes": {
+            "task": "common.tasks.refresh_sample_pools",
+            "schedule": crontab(minute="*/10"),
+            "args": (),
+        },
+        "s3-orphan-sweep-every-day": {
+            "task": "common.tasks.sweep_orphan_s3_resources",
+            "schedule": crontab(minute=0, hour=18),
+            "args": (),
+        },
     }
 )
 app.autodiscover_tasks()
@@ -35,6 +35,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     "rest_framework",
     "rest_framework.authtoken",
     "auths",
@@ -99,6 +100,19 @@ DATABASES = {
     }
 }
 
+# Cache
+# 캐시 무효화가 모든 uWSGI process와 Celery worker에 전달되어야 하므로,
+# process마다 따로인 LocMemCache 대신 공유 cache(Redis)를 사용한다.
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": os.getenv("DOMO_REDIS_URL", "redis://localhost:6379/0"),
+    }
+}
+
+# 테스트는 worker process마다 독립된 LocMemCache를 사용한다.
+TEST_RUNNER = "common.test_runner.TestRunner"
+
 AUTH_USER_MODEL = "users.User"
 
 
@@ -122,10 +136,17 @@ AUTH_PASSWORD_VALIDATORS = [
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework.authentication.TokenAuthentication",
+        "common.auth.CachedTokenAuthentication",
     ]
 }
 
+# Pagination
+PAGINATION_DEFAULT_PAGE_SIZE = 20
+PAGINATION_MAX_PAGE_SIZE = 100
+# 사용자 검색 (초대 자동완성)
+USER_SEARCH_MIN_LENGTH = 2
+USER_SEARCH_MAX_PAGE_SIZE = 20
+
 # Internationalization
 # https://docs.djangoproject.com/en/4.2/topics/i18n/
 
@@ -161,6 +182,54 @@ EMAIL_HOST_USER = os.environ.get("EMAIL_HOST_USER")
 EMAIL_HOST_PASSWORD = os.environ.get("EMAIL_HOST_PASSWORD")
 DEFAULT_FROM_EMAIL = EMAIL_HOST_USER
 
+# Github API
+GITHUB_API_URL = os.getenv("GITHUB_API_URL", "https://api.github.com")
+GITHUB_MAX_CONNECTIONS = 10
+GITHUB_TIMEOUT = 10
+GITHUB_RATE_LIMIT_PER_HOUR = 5000
+GITHUB_RATE_LIMIT_BURST = 500
+# 주기적 업데이트는 shard 단위로 나누어 최대 CONCURRENCY개의 shard를 동시에 실행한다.
+GITHUB_UPDATE_SHARD_SIZE = 20
+GITHUB_UPDATE_CONCURRENCY = 4
+# 이 시간 안에 다시 실행하면 이미 완료된 사용자는 건너뛴다.
+GITHUB_UPDATE_RESUME_WINDOW = 60 * 60 * 12
+
+# S3
+# MinIO 등 로컬 stand-in을 사용할 때만 설정한다.
+AWS_S3_ENDPOINT_URL = os.getenv("AWS_S3_ENDPOINT_URL") or None
+S3_MAX_POOL_CONNECTIONS = 20
+S3_HEAD_MAX_WORKERS = 8
+# 존재가 확인된 S3 key는 이 시간 동안 다시 확인하지 않는다.
+S3_VERIFIED_KEY_TTL = 60
+# DeleteObjects는 한 번에 최대 1000개의 key를 삭제할 수 있다.
+S3_DELETION_BATCH_SIZE = 1000
+S3_DELETION_MAX_ATTEMPTS = 5
+# 업로드 후 아직 참조가 등록되지 않은 object는 이 시간 동안 삭제하지 않는다.
+S3_ORPHAN_GRACE_PERIOD = 60 * 60 * 24
+
+# Image
+# 원본 이미지는 긴 변이 IMAGE_MAX_SIZE를 넘지 않도록 줄여서 저장한다.
+IMAGE_MAX_SIZE = 1024
+# 목록 등에서 사용할 작은 이미지. (이름 -> 긴 변의 최대 길이)
+IMAGE_VARIANT_SIZES = {"small": 160, "medium": 480}
+IMAGE_JPEG_QUALITY = 85
+IMAGE_WEBP_QUALITY = 80
+
+# Project
+# 프로젝트 상세 정보 캐시. 관련 model이 바뀌면 signal로 바로 무효화된다.
+PROJECT_PUBLIC_INFO_CACHE_TTL = 60 * 60
+# 프로젝트 역할 캐시. ProjectMember가 바뀌면 signal로 바로 무효화된다.
+PROJECT_ROLE_CACHE_TTL = 60
+# 인증 token 캐시. process 내 캐시 항목은 공유 cache의 token generation이 같을 때만 사용한다.
+TOKEN_AUTH_CACHE_SIZE = 10000
+TOKEN_AUTH_CACHE_TTL = 10
+# 공유 cache(Redis)에 둘 시간. Token 삭제, User 저장 signal로 무효화된다. 0이면 사용하지 않는다.
+TOKEN_AUTH_SHARED_CACHE_TTL = 60 * 5
+
+# 추천 API의 무작위 sample pool. Celery beat가 10분마다 새로 뽑는다.
+SAMPLE_POOL_SIZE = 500
+SAMPLE_POOL_TTL = 60 * 30
+
 # Celery Configuration Options
 CELERY_TIMEZONE = "UTC"
 CELERY_TASK_TRACK_STARTED = True
@@ -1,5 +1,10 @@
 from django.contrib import admin
-from external_histories.models import GithubStatus, UserKeyword, UserStack
+from external_histories.models import (
+    GithubResponseCache,
+    GithubStatus,
+    UserKeyword,
+    UserStack,
+)
 
 
 # Register your models here.
@@ -55,3 +60,10 @@ class GithubStatusAdmin(admin.ModelAdmin):
             },
         ),
     )
+
+
+@admin.register(GithubResponseCache)
+class GithubResponseCacheAdmin(admin.ModelAdmin):
+    list_display = ("id", "url", "etag", "last_modified", "updated_at")
+    search_fields = ("url",)
+    ordering = ("id",)
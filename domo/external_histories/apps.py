@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class ExternalHistoriesConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "external_histories"
+
+    def ready(self):
+        from external_histories.common_stack import load_common_stacks
+
+        # badge 목록은 요청마다 읽지 않도록 시작할 때 색인한다.
+        load_common_stacks()
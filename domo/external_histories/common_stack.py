@@ -0,0 +1,60 @@
+import csv
+from functools import lru_cache
+from pathlib import Path
+
+COMMON_STACK_CSV = Path(__file__).resolve().parent / "raw_data" / "common_stack.csv"
+
+# GitHub 언어 이름, keyword 등 badge 이름과 다르게 불리는 stack
+ALIASES = {
+    "golang": "go",
+    "js": "javascript",
+    "ts": "typescript",
+    "node": "nodejs",
+    "node.js": "nodejs",
+    "express": "express.js",
+    "next": "nextjs",
+    "next.js": "nextjs",
+    "nuxt": "nuxtjs",
+    "vue": "vue.js",
+    "electron": "electron.js",
+    "deno": "denojs",
+    "three": "threejs",
+    "three.js": "threejs",
+    "chartjs": "chart.js",
+    "postgresql": "postgres",
+    "html": "html5",
+    "css": "css3",
+    "scss": "sass",
+    "shell": "shellscript",
+    "dockerfile": "docker",
+    "tex": "latex",
+    "k8s": "kubernetes",
+}
+
+
+def normalize_stack_name(name):
+    # 대소문자와 공백을 무시한다. (c, c#, c++ 처럼 기호는 구분한다.)
+    return "".join(name.lower().split())
+
+
+@lru_cache(maxsize=None)
+def load_common_stacks():
+    """
+    badge 목록을 정규화된 이름 -> {"id", "url"} dict로 한 번만 읽는다.
+    (이름이 중복되면 먼저 나온 행을 사용한다.)
+    """
+    stacks = {}
+    with open(COMMON_STACK_CSV, newline="") as f:
+        for row in csv.DictReader(f):
+            stacks.setdefault(
+                normalize_stack_name(row["name"]),
+                {"id": row["id"], "url": row["url"]},
+            )
+
+    for alias, name in ALIASES.items():
+        stacks.setdefault(alias, stacks[name])
+    return stacks
+
+
+def find_common_stack(name):
+    return load_common_stacks().get(normalize_stack_name(name))
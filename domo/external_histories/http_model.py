@@ -28,3 +28,9 @@ class GetCommonStackResponse(BaseModel):
     success: bool
     id: str
     url: str
+
+
+class GetCommonStacksResponse(BaseModel):
+    success: bool
+    count: int
+    stacks: dict
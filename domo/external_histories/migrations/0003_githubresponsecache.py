@@ -0,0 +1,26 @@
+# Generated by Django 4.2.7 on 2026-10-18 13:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("external_histories", "0002_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="GithubResponseCache",
+            fields=[
+                ("id", models.AutoField(primary_key=True, serialize=False)),
+                ("url", models.CharField(max_length=500, unique=True)),
+                ("etag", models.CharField(blank=True, default="", max_length=255)),
+                (
+                    "last_modified",
+                    models.CharField(blank=True, default="", max_length=64),
+                ),
+                ("body", models.JSONField()),
+                ("updated_at", models.DateTimeField()),
+            ],
+        ),
+    ]
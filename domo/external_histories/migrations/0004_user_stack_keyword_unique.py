@@ -0,0 +1,50 @@
+# Generated by Django 4.2.7 on 2026-10-18 13:39
+
+from django.db import migrations, models
+from django.db.models import Count, Min, Sum
+
+
+def merge_duplicates(model, field, amount):
+    # 같은 (user, field) 행은 가장 작은 id 하나로 합친다.
+    duplicates = (
+        model.objects.values("user_id", field)
+        .annotate(min_id=Min("id"), total=Sum(amount), rows=Count("id"))
+        .filter(rows__gt=1)
+    )
+    for duplicate in duplicates.iterator():
+        rows = model.objects.filter(
+            user_id=duplicate["user_id"], **{field: duplicate[field]}
+        )
+        rows.exclude(id=duplicate["min_id"]).delete()
+        rows.update(**{amount: duplicate["total"]})
+
+
+def merge_user_stacks_and_keywords(apps, schema_editor):
+    merge_duplicates(
+        apps.get_model("external_histories", "UserStack"), "language", "code_amount"
+    )
+    merge_duplicates(
+        apps.get_model("external_histories", "UserKeyword"), "keyword", "count"
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("external_histories", "0003_githubresponsecache"),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_user_stacks_and_keywords, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="userkeyword",
+            constraint=models.UniqueConstraint(
+                fields=("user", "keyword"), name="user_keyword_user_keyword_unique"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="userstack",
+            constraint=models.UniqueConstraint(
+                fields=("user", "language"), name="user_stack_user_language_unique"
+            ),
+        ),
+    ]
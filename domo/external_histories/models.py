@@ -22,6 +22,13 @@ class UserStack(models.Model):
     language = models.CharField(max_length=20)
     code_amount = models.IntegerField()
 
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "language"], name="user_stack_user_language_unique"
+            )
+        ]
+
 
 class UserKeyword(models.Model):
     id = models.AutoField(primary_key=True)
@@ -31,3 +38,20 @@ class UserKeyword(models.Model):
     )
     keyword = models.CharField(max_length=50)
     count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "keyword"], name="user_keyword_user_keyword_unique"
+            )
+        ]
+
+
+class GithubResponseCache(models.Model):
+    # GitHub API 조건부 요청(ETag/Last-Modified)을 위한 응답 캐시
+    id = models.AutoField(primary_key=True)
+    url = models.CharField(max_length=500, unique=True)
+    etag = models.CharField(max_length=255, blank=True, default="")
+    last_modified = models.CharField(max_length=64, blank=True, default="")
+    body = models.JSONField()
+    updated_at = models.DateTimeField()
@@ -0,0 +1,69 @@
+from unittest import TestCase
+from urllib.parse import urlencode
+
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+
+class CommonStackTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+
+    def test_success(self):
+        # Given: badge 목록에 있는 stack
+        # When: stack을 조회할 때
+        response = self.client.get(reverse("common_stack_check", args=["python"]))
+
+        # Then: 응답 코드는 200이고 badge 정보를 반환한다.
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.json()["success"])
+        self.assertIn("python", response.json()["url"])
+
+    def test_success_case_insensitive_and_alias(self):
+        # Given: 대소문자가 다르거나 다른 이름으로 불리는 stack
+        # When: stack을 조회할 때
+        python = self.client.get(reverse("common_stack_check", args=["Python"]))
+        notebook = self.client.get(
+            reverse("common_stack_check", args=["Jupyter Notebook"])
+        )
+        shell = self.client.get(reverse("common_stack_check", args=["Shell"]))
+
+        # Then: 같은 badge를 반환한다.
+        self.assertEqual(python.status_code, 200)
+        self.assertEqual(notebook.status_code, 200)
+        self.assertIn("jupyter", notebook.json()["url"])
+        self.assertEqual(shell.status_code, 200)
+        self.assertIn("shell", shell.json()["url"])
+
+    def test_not_exist_stack(self):
+        # Given: badge 목록에 없는 stack
+        # When: stack을 조회할 때
+        response = self.client.get(reverse("common_stack_check", args=["nothing"]))
+
+        # Then: 응답 코드는 404이다.
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.json()["reason"], "Can't find stack")
+
+    def test_success_batch(self):
+        # Given: 여러 stack
+        params = urlencode({"stacks": "Python,C++,TypeScript,nothing"})
+
+        # When: 한 번에 조회할 때
+        response = self.client.get(f"{reverse('common_stacks_check')}?{params}")
+
+        # Then: 찾은 stack만 요청한 이름으로 반환한다.
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["count"], 3)
+        self.assertEqual(
+            set(response.json()["stacks"]), {"Python", "C++", "TypeScript"}
+        )
+
+    def test_fail_too_many_stacks(self):
+        # Given: 너무 많은 stack
+        params = urlencode({"stacks": ",".join(f"stack{i}" for i in range(101))})
+
+        # When: 한 번에 조회할 때
+        response = self.client.get(f"{reverse('common_stacks_check')}?{params}")
+
+        # Then: 응답 코드는 400이다.
+        self.assertEqual(response.status_code, 400)
@@ -42,4 +42,9 @@ urlpatterns = [
         external_history.CommonStack.as_view(),
         name="common_stack_check",
     ),
+    path(
+        "v1/common/stacks",
+        external_history.CommonStacks.as_view(),
+        name="common_stacks_check",
+    ),
 ]
@@ -1,26 +1,28 @@
-import csv
 import logging
-import os
 from datetime import datetime, timezone
 
 import requests
+from common.auth import CachedTokenAuthentication
 from common.const import ReturnCode
 from common.http_model import SimpleFailResponse, SimpleSuccessResponse
 from common.tasks import update_github_history
 from django.http import JsonResponse
+from external_histories.common_stack import find_common_stack
 from external_histories.http_model import (
     GetAllUserKeywordResponse,
     GetAllUserStackResponse,
     GetCommonStackResponse,
+    GetCommonStacksResponse,
     GetGithubUpdateStatusResponse,
     GithubAccountCheckRequest,
 )
 from external_histories.models import GithubStatus, UserKeyword, UserStack
 from pydantic import ValidationError
-from rest_framework.authentication import TokenAuthentication
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.views import APIView
 
+COMMON_STACK_BATCH_LIMIT = 100
+
 
 class GithubAccountCheck(APIView):
     def get(self, request):
@@ -107,7 +109,7 @@ class GithubUpdateStatus(APIView):
 
 
 class GithubStack(APIView):
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
@@ -194,7 +196,7 @@ class PublicGithubStack(APIView):
 
 
 class GithubKeyword(APIView):
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
@@ -279,7 +281,7 @@ class PublicGithubKeyword(APIView):
 
 
 class GithubManualUpdate(APIView):
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [IsAuthenticated]
 
     def post(self, request):
@@ -334,17 +336,42 @@ class GithubManualUpdate(APIView):
 
 class CommonStack(APIView):
     def get(self, request, stack):
-        f = open(os.getcwd() + "/external_histories/raw_data/common_stack.csv", "r")
-        reader = csv.reader(f)
+        common_stack = find_common_stack(stack)
+        if common_stack is None:
+            return JsonResponse(
+                SimpleFailResponse(
+                    success=False, reason="Can't find stack"
+                ).model_dump(),
+                status=404,
+            )
 
-        data = list(reader)
+        response = GetCommonStackResponse(success=True, **common_stack)
+        return JsonResponse(response.model_dump(), status=200)
 
-        for row in data:
-            if row[2] == stack:
-                response = GetCommonStackResponse(success=True, url=row[1], id=row[0])
-                return JsonResponse(response.model_dump(), status=200)
 
-        return JsonResponse(
-            SimpleFailResponse(success=False, reason="Can't find stack").model_dump(),
-            status=404,
+class CommonStacks(APIView):
+    def get(self, request):
+        # ?stacks=python,react 처럼 여러 stack을 한 번에 조회한다.
+        names = [
+            name.strip()
+            for name in request.GET.get("stacks", "").split(",")
+            if name.strip()
+        ]
+        if len(names) > COMMON_STACK_BATCH_LIMIT:
+            return JsonResponse(
+                SimpleFailResponse(
+                    success=False, reason="Too many stacks."
+                ).model_dump(),
+                status=400,
+            )
+
+        stacks = {}
+        for name in names:
+            common_stack = find_common_stack(name)
+            if common_stack is not None:
+                stacks[name] = common_stack
+
+        response = GetCommonStacksResponse(
+            success=True, count=len(stacks), stacks=stacks
         )
+        return JsonResponse(response.model_dump(), status=200)
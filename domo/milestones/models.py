@@ -1,10 +1,32 @@
 from django.db import models
+from django.db.models import Count, Q
 from projects.models import Project
 from users.models import User
 
+TASK_GROUP_STATUSES = ["READY", "PROGRESSING", "COMPLETED"]
+
+
+def _task_group_count_field(status):
+    return f"{status.lower()}_task_group_count"
+
+
+class MilestoneQuerySet(models.QuerySet):
+    def with_task_group_counts(self):
+        # task group을 가져오지 않고 상태별 개수만 milestone마다 센다. (쿼리 1개)
+        return self.annotate(
+            **{
+                _task_group_count_field(status): Count(
+                    "taskgroup", filter=Q(taskgroup__status=status)
+                )
+                for status in TASK_GROUP_STATUSES
+            }
+        )
+
 
 # Create your models here.
 class Milestone(models.Model):
+    objects = MilestoneQuerySet.as_manager()
+
     id = models.AutoField(primary_key=True)
     project = models.ForeignKey(
         Project,
@@ -26,11 +48,24 @@ class Milestone(models.Model):
     created_at = models.DateTimeField()
     due_date = models.DateTimeField(null=True, blank=True)
 
+    def task_group_counts(self):
+        if hasattr(self, _task_group_count_field(TASK_GROUP_STATUSES[0])):
+            return {
+                status: getattr(self, _task_group_count_field(status))
+                for status in TASK_GROUP_STATUSES
+            }
+        counts = dict.fromkeys(TASK_GROUP_STATUSES, 0)
+        for status in self.taskgroup_set.values_list("status", flat=True):
+            counts[status] = counts.get(status, 0) + 1
+        return counts
+
     def simple_info(self):
-        task_groups = self.taskgroup_set.all()
-        task_group_statuses = []
-        for task_group in task_groups:
-            task_group_statuses.append({"status": task_group.status})
+        # with_task_group_counts()로 가져온 milestone이면 추가 쿼리가 없다.
+        task_group_statuses = [
+            {"status": status}
+            for status, count in self.task_group_counts().items()
+            for _ in range(count)
+        ]
 
         return {
             "id": self.id,
@@ -1,11 +1,15 @@
 from datetime import datetime, timezone
 from unittest import TestCase
 
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from milestones.models import Milestone
 from projects.models import ProjectMember
 from rest_framework.authtoken.models import Token
 from rest_framework.test import APIClient
+from task_groups.models import TaskGroup
+from tasks.models import Task
 from users.models import User
 
 
@@ -75,6 +79,46 @@ class GetMilestoneTest(TestCase):
         # Then: 응답 코드는 200이고 프로젝트 및 마일스톤과 이에 속한 태스크 그룹, 태스크의 정보를 반환한다.
         self.assertEqual(response.status_code, 200)
 
+    def test_success_query_count_does_not_grow(self):
+        # Given: 태스크 그룹 100개, 태스크 그룹마다 태스크 100개인 마일스톤
+        url = self.url_get_milestone
+        self.client.get(url)
+        with CaptureQueriesContext(connection) as context:
+            self.client.get(url)
+        small_query_count = len(context.captured_queries)
+
+        task_groups = TaskGroup.objects.bulk_create(
+            TaskGroup(
+                milestone=self.milestone,
+                title=f"Task Group {i}",
+                created_by=self.user,
+                created_at=self.created_at,
+            )
+            for i in range(100)
+        )
+        Task.objects.bulk_create(
+            Task(
+                task_group=task_group,
+                title=f"Task {i}",
+                description="Test description",
+                owner=self.user,
+                created_at=self.created_at,
+            )
+            for task_group in task_groups
+            for i in range(100)
+        )
+
+        # When: 사용자가 마일스톤 정보를 확인할 때
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+
+        # Then: 쿼리 수는 태스크 그룹, 태스크 수와 관계없이 일정하다.
+        self.assertEqual(len(context.captured_queries), small_query_count)
+        task_group_datas = response.json()["task_groups"]
+        self.assertEqual(len(task_group_datas), 101)
+        self.assertEqual(len(task_group_datas[-1]["tasks"]), 100)
+        self.assertEqual(set(task_group_datas[-1]["tasks"][0]), {"id", "title"})
+
     def test_not_found(self):
         # Given: 프로젝트, 마일스톱, 태스크 그룹
         # When: 사용자가 없는 마일스톤 정보를 요청했을 때
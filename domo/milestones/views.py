@@ -1,7 +1,9 @@
 import json
 import logging
+from collections import defaultdict
 from datetime import datetime, timezone
 
+from common.auth import CachedTokenAuthentication
 from common.http_model import SimpleFailResponse, SimpleSuccessResponse
 from django.db.transaction import atomic
 from django.http import JsonResponse
@@ -12,9 +14,9 @@ from milestones.http_model import (
     ModifyMilestoneRequest,
 )
 from milestones.models import Milestone
-from projects.models import Project, ProjectMember
+from projects.models import Project
+from projects.permissions import MANAGER_ROLES, project_role, project_role_required
 from pydantic import ValidationError
-from rest_framework.authentication import TokenAuthentication
 from rest_framework.views import APIView
 from task_groups.models import TaskGroup
 from tasks.models import Task
@@ -36,8 +38,9 @@ def create_new_milestone(request_user, request_project, request_data):
 
 
 class Info(APIView):
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
 
+    @project_role_required("project", "Project not found", roles=MANAGER_ROLES)
     def post(self, request, request_id):
         project_id = request_id
         subject = request.data.get("subject")
@@ -56,26 +59,6 @@ class Info(APIView):
                 status=404,
             )
 
-        try:
-            member_role = ProjectMember.objects.get(
-                project=project, user=request.user
-            ).role
-        except:
-            return JsonResponse(
-                SimpleFailResponse(
-                    success=False, reason="Permission error"
-                ).model_dump(),
-                status=403,
-            )
-
-        if member_role == "MEMBER":
-            return JsonResponse(
-                SimpleFailResponse(
-                    success=False, reason="User must OWNER or MANAGER"
-                ).model_dump(),
-                status=403,
-            )
-
         try:
             request_data = CreateMilestoneRequest(
                 subject=subject,
@@ -118,9 +101,9 @@ class Info(APIView):
             status=201,
         )
 
+    @project_role_required("milestone", "Milestone not found", roles=MANAGER_ROLES)
     def put(self, request, request_id):
         milestone_id = request_id
-
         try:
             milestone = Milestone.objects.get(id=milestone_id)
         except Milestone.DoesNotExist:
@@ -131,28 +114,6 @@ class Info(APIView):
                 status=404,
             )
 
-        project = milestone.project
-
-        try:
-            member_role = ProjectMember.objects.get(
-                project=project, user=request.user
-            ).role
-        except:
-            return JsonResponse(
-                SimpleFailResponse(
-                    success=False, reason="Permission error"
-                ).model_dump(),
-                status=403,
-            )
-
-        if member_role == "MEMBER":
-            return JsonResponse(
-                SimpleFailResponse(
-                    success=False, reason="User must OWNER or MANAGER"
-                ).model_dump(),
-                status=403,
-            )
-
         subject = request.data.get("subject")
         status = request.data.get("status")
         if not status:
@@ -215,7 +176,9 @@ class Info(APIView):
         milestone_id = request_id
 
         try:
-            milestone = Milestone.objects.get(id=milestone_id)
+            milestone = Milestone.objects.select_related("project", "created_by").get(
+                id=milestone_id
+            )
         except Milestone.DoesNotExist:
             return JsonResponse(
                 SimpleFailResponse(
@@ -225,13 +188,7 @@ class Info(APIView):
             )
 
         project = milestone.project
-
-        try:
-            member_role = ProjectMember.objects.get(
-                project=project, user=request.user
-            ).role
-        except:
-            member_role = "NOTHING"
+        member_role = project_role(request, project.id) or "NOTHING"
 
         created_data = {
             "id": milestone.created_by.id,
@@ -244,33 +201,28 @@ class Info(APIView):
             "thumbnail_image": project.thumbnail_image,
         }
 
-        task_groups = TaskGroup.objects.filter(milestone=milestone)
-
-        task_group_datas = []
-
-        for task_group in task_groups:
-            tasks = Task.objects.filter(task_group=task_group)
-
-            task_datas = []
-
-            for task in tasks:
-                task_data = {
-                    "id": task.id,
-                    "title": task.title,
-                }
-
-                task_datas.append(task_data)
-
-            task_group_data = {
+        # 태스크는 id, title만 필요하므로 모델 대신 값만 한 번에 가져와 태스크 그룹별로 나눈다.
+        task_datas = defaultdict(list)
+        for task in (
+            Task.objects.filter(task_group__milestone=milestone)
+            .order_by("id")
+            .values("id", "title", "task_group_id")
+        ):
+            task_datas[task.pop("task_group_id")].append(task)
+
+        task_group_datas = [
+            {
                 "id": task_group.id,
                 "title": task_group.title,
                 "status": task_group.status,
                 "created_at": task_group.created_at,
                 "due_date": task_group.due_date,
-                "tasks": task_datas,
+                "tasks": task_datas[task_group.id],
             }
-
-            task_group_datas.append(task_group_data)
+            for task_group in TaskGroup.objects.filter(milestone=milestone).order_by(
+                "id"
+            )
+        ]
 
         return JsonResponse(
             GetMilestoneResponse(
@@ -289,9 +241,9 @@ class Info(APIView):
             status=200,
         )
 
+    @project_role_required("milestone", "Milestone not found", roles=MANAGER_ROLES)
     def delete(self, request, request_id):
         milestone_id = request_id
-
         try:
             milestone = Milestone.objects.get(id=milestone_id)
         except Milestone.DoesNotExist:
@@ -302,28 +254,6 @@ class Info(APIView):
                 status=404,
             )
 
-        project = milestone.project
-
-        try:
-            member_role = ProjectMember.objects.get(
-                project=project, user=request.user
-            ).role
-        except:
-            return JsonResponse(
-                SimpleFailResponse(
-                    success=False, reason="Permission error"
-                ).model_dump(),
-                status=403,
-            )
-
-        if member_role == "MEMBER":
-            return JsonResponse(
-                SimpleFailResponse(
-                    success=False, reason="User must OWNER or MANAGER"
-                ).model_dump(),
-                status=403,
-            )
-
         try:
             task_groups = TaskGroup.objects.filter(milestone=milestone)
             for task_group in task_groups:
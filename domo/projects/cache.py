@@ -0,0 +1,98 @@
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Prefetch
+from milestones.models import Milestone
+from projects.models import Project, ProjectMember
+
+
+def _version_key(project_id):
+    return f"project:{project_id}:version"
+
+
+def project_version(project_id):
+    """
+    프로젝트 상세 정보가 바뀔 때마다 달라지는 version.
+    상세 정보와 같은 TTL로 두며, 만료되면 새 version으로 상세 정보를 다시 만든다.
+    (version key가 만료되거나 밀려나도 이전 version과 겹치지 않도록 시각을 사용한다.)
+    """
+    key = _version_key(project_id)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, time.time_ns(), settings.PROJECT_PUBLIC_INFO_CACHE_TTL)
+        version = cache.get(key)
+    return version
+
+
+def invalidate_projects(project_ids):
+    version = time.time_ns()
+    cache.set_many(
+        {_version_key(project_id): version for project_id in set(project_ids)},
+        settings.PROJECT_PUBLIC_INFO_CACHE_TTL,
+    )
+
+
+def _user_info(user):
+    return {
+        "id": user.id,
+        "name": user.name,
+        "email": user.email,
+        "profile_image_link": user.profile_image_link,
+        "profile_image_updated_at": user.profile_image_updated_at,
+        "profile_image_variants": user.profile_image_variants,
+    }
+
+
+def _build_public_info(project_id):
+    project = (
+        Project.objects.select_related("owner")
+        .prefetch_related(
+            Prefetch(
+                "milestone_set",
+                queryset=Milestone.objects.with_task_group_counts().order_by("id"),
+            ),
+            Prefetch(
+                "projectmember_set",
+                queryset=ProjectMember.objects.select_related("user").order_by("id"),
+            ),
+        )
+        .filter(id=project_id)
+        .first()
+    )
+    if project is None:
+        return None
+
+    return {
+        "owner": _user_info(project.owner),
+        "id": project.id,
+        "status": project.status,
+        "title": project.title,
+        "short_description": project.short_description,
+        "description": project.description,
+        "description_resource_links": project.description_resource_links,
+        "created_at": project.created_at,
+        "due_date": project.due_date,
+        "thumbnail_image": project.thumbnail_image,
+        "thumbnail_image_variants": project.thumbnail_image_variants,
+        "milestones": [
+            milestone.simple_info() for milestone in project.milestone_set.all()
+        ],
+        "members": [
+            _user_info(member.user) for member in project.projectmember_set.all()
+        ],
+    }
+
+
+def get_public_info(project_id):
+    """
+    요청한 사용자와 무관한 프로젝트 상세 정보. 프로젝트가 없으면 None.
+    프로젝트 version별로 캐시하며, 관련 model이 바뀌면 signal로 version을 올린다.
+    """
+    key = f"project:{project_id}:public:{project_version(project_id)}"
+    public_info = cache.get(key)
+    if public_info is None:
+        public_info = _build_public_info(project_id)
+        if public_info is not None:
+            cache.set(key, public_info, settings.PROJECT_PUBLIC_INFO_CACHE_TTL)
+    return public_info
@@ -48,6 +48,7 @@ class GetProjectResponse(BaseModel):
     created_at: datetime
     due_date: Optional[datetime] = None
     thumbnail_image: Optional[str] = None
+    thumbnail_image_variants: Optional[dict] = None
     milestones: Optional[list] = None
     members: list
     permission: str
@@ -59,6 +60,13 @@ class GetProjectAllResponse(BaseModel):
     projects: list
 
 
+class GetProjectPageResponse(BaseModel):
+    success: bool
+    count: int
+    projects: list
+    next_cursor: Optional[str] = None
+
+
 class GetAllProjectResponse(BaseModel):
     success: bool
     count: int
@@ -0,0 +1,102 @@
+import random
+import time
+from datetime import datetime, timezone
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from external_histories.models import UserStack
+from projects.models import Project, ProjectMember, ProjectStackProfile
+from projects.views import RecommendProject
+from users.models import User
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = "Benchmark RecommendProject.recommend_project on seeded projects."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--projects", type=int, default=10000)
+        parser.add_argument("--members", type=int, default=3)
+        parser.add_argument("--runs", type=int, default=20)
+
+    def handle(self, *args, **options):
+        # 시드 데이터는 벤치마크 후 rollback 한다.
+        try:
+            with transaction.atomic():
+                self.run(options["projects"], options["members"], options["runs"])
+                raise Rollback
+        except Rollback:
+            pass
+
+    def run(self, project_count, member_count, runs):
+        created_at = datetime.now(tz=timezone.utc)
+        user_count = max(project_count // 2, member_count + 1)
+
+        started = time.perf_counter()
+        users = User.objects.bulk_create(
+            User(
+                email=f"bench{i}@bench.domo",
+                name=f"bench{i}",
+                created_at=created_at,
+            )
+            for i in range(user_count)
+        )
+        UserStack.objects.bulk_create(
+            (
+                UserStack(
+                    user=user,
+                    language=language,
+                    code_amount=random.randint(0, 100000),
+                )
+                for user in users
+                for language in ("Python", "JavaScript")
+            ),
+            batch_size=1000,
+        )
+        projects = Project.objects.bulk_create(
+            (
+                Project(
+                    owner=random.choice(users), title=f"bench{i}", created_at=created_at
+                )
+                for i in range(project_count)
+            ),
+            batch_size=1000,
+        )
+        ProjectMember.objects.bulk_create(
+            (
+                ProjectMember(
+                    project=project,
+                    user=user,
+                    role="MEMBER",
+                    created_at=created_at,
+                )
+                for project in projects
+                for user in random.sample(users, member_count)
+            ),
+            batch_size=1000,
+        )
+        ProjectStackProfile.objects.refresh([project.id for project in projects])
+        self.stdout.write(
+            f"seeded {project_count} projects / {user_count} users "
+            f"in {time.perf_counter() - started:.2f}s"
+        )
+
+        view = RecommendProject()
+        timings = []
+        for _ in range(runs):
+            user = random.choice(users)
+            started = time.perf_counter()
+            view.recommend_project(
+                Project.objects.exclude(projectmember__user=user), user
+            )
+            timings.append(time.perf_counter() - started)
+
+        timings.sort()
+        self.stdout.write(
+            f"recommend_project x{runs}: "
+            f"p50={timings[len(timings) // 2] * 1000:.2f}ms "
+            f"max={timings[-1] * 1000:.2f}ms"
+        )
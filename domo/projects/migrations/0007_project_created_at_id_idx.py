@@ -0,0 +1,18 @@
+# Generated by Django 4.2.7 on 2026-10-18 13:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("projects", "0006_projectmember_project_user_unique"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="project",
+            index=models.Index(
+                fields=["-created_at", "-id"], name="project_created_at_id_idx"
+            ),
+        ),
+    ]
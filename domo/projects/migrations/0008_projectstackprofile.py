@@ -0,0 +1,66 @@
+# Generated by Django 4.2.7 on 2026-10-18 13:29
+
+from django.db import migrations, models
+import django.db.models.deletion
+from django.db.models import Count, Sum
+
+
+def create_project_stack_profiles(apps, schema_editor):
+    Project = apps.get_model("projects", "Project")
+    ProjectMember = apps.get_model("projects", "ProjectMember")
+    ProjectStackProfile = apps.get_model("projects", "ProjectStackProfile")
+    UserStack = apps.get_model("external_histories", "UserStack")
+
+    member_counts = dict(
+        ProjectMember.objects.values("project_id")
+        .annotate(count=Count("id"))
+        .values_list("project_id", "count")
+    )
+    stacks_sums = dict(
+        UserStack.objects.filter(user__projectmember__isnull=False)
+        .values("user__projectmember__project_id")
+        .annotate(total=Sum("code_amount"))
+        .values_list("user__projectmember__project_id", "total")
+    )
+
+    profiles = []
+    for project_id in Project.objects.values_list("id", flat=True).iterator():
+        member_count = member_counts.get(project_id, 0)
+        stacks_sum = stacks_sums.get(project_id) or 0
+        profiles.append(
+            ProjectStackProfile(
+                project_id=project_id,
+                member_count=member_count,
+                stacks_sum=stacks_sum,
+                stacks_avg=stacks_sum / member_count if member_count else 0,
+            )
+        )
+    ProjectStackProfile.objects.bulk_create(profiles, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("external_histories", "0002_initial"),
+        ("projects", "0007_project_created_at_id_idx"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProjectStackProfile",
+            fields=[
+                (
+                    "project",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        serialize=False,
+                        to="projects.project",
+                    ),
+                ),
+                ("member_count", models.IntegerField(default=0)),
+                ("stacks_sum", models.BigIntegerField(default=0)),
+                ("stacks_avg", models.FloatField(db_index=True, default=0)),
+            ],
+        ),
+        migrations.RunPython(create_project_stack_profiles, migrations.RunPython.noop),
+    ]
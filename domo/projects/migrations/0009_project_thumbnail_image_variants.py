@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-18 14:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("projects", "0008_projectstackprofile"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="project",
+            name="thumbnail_image_variants",
+            field=models.JSONField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 4.2.7 on 2026-10-18 16:02
+
+from django.db import migrations, models
+from django.db.models import Count, Min
+
+
+def remove_duplicate_invites(apps, schema_editor):
+    # 같은 초대는 가장 먼저 보낸 하나만 남긴다.
+    ProjectInvite = apps.get_model("projects", "ProjectInvite")
+    duplicates = (
+        ProjectInvite.objects.values("project_id", "inviter_id", "invitee_id")
+        .annotate(min_id=Min("id"), rows=Count("id"))
+        .filter(rows__gt=1)
+    )
+    for duplicate in duplicates.iterator():
+        ProjectInvite.objects.filter(
+            project_id=duplicate["project_id"],
+            inviter_id=duplicate["inviter_id"],
+            invitee_id=duplicate["invitee_id"],
+        ).exclude(id=duplicate["min_id"]).delete()
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("projects", "0009_project_thumbnail_image_variants"),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_invites, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="projectinvite",
+            constraint=models.UniqueConstraint(
+                fields=("project", "inviter", "invitee"),
+                name="project_inviter_invitee_unique",
+            ),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.7 on 2026-10-18 14:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("projects", "0010_projectinvite_project_inviter_invitee_unique"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="project",
+            index=models.Index(
+                fields=["thumbnail_image"], name="project_thumbnail_image_idx"
+            ),
+        ),
+    ]
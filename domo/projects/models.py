@@ -1,9 +1,26 @@
 from django.db import models
+from django.db.models import Count, Sum
 from users.models import User
 
 
+def members_prefetch():
+    # 멤버와 멤버의 유저 정보를 한 번에 가져온다. (프로젝트 수와 무관하게 쿼리 1개)
+    return models.Prefetch(
+        "projectmember_set",
+        queryset=ProjectMember.objects.select_related("user").order_by("id"),
+        to_attr="prefetched_members",
+    )
+
+
+class ProjectQuerySet(models.QuerySet):
+    def with_members(self):
+        return self.prefetch_related(members_prefetch())
+
+
 # Create your models here.
 class Project(models.Model):
+    objects = ProjectQuerySet.as_manager()
+
     id = models.AutoField(primary_key=True)
     owner = models.ForeignKey(
         User,
@@ -19,6 +36,21 @@ class Project(models.Model):
     created_at = models.DateTimeField()
     due_date = models.DateTimeField(null=True, blank=True)
     thumbnail_image = models.CharField(max_length=500, null=True, blank=True)
+    # {"small": {"webp": link, "jpeg": link}, ...} (비동기로 생성된다.)
+    thumbnail_image_variants = models.JSONField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["-created_at", "-id"],
+                name="project_created_at_id_idx",
+            ),
+            # S3 삭제 outbox를 비울 때 key가 썸네일로 다시 쓰이는지 확인한다.
+            models.Index(
+                fields=["thumbnail_image"],
+                name="project_thumbnail_image_idx",
+            ),
+        ]
 
     def detail(self):
         return {
@@ -29,6 +61,7 @@ class Project(models.Model):
                 "email": self.owner.email,
                 "profile_image_link": self.owner.profile_image_link,
                 "profile_image_updated_at": self.owner.profile_image_updated_at,
+                "profile_image_variants": self.owner.profile_image_variants,
             },
             "status": self.status,
             "title": self.title,
@@ -38,6 +71,30 @@ class Project(models.Model):
             "created_at": self.created_at,
             "due_date": self.due_date,
             "thumbnail_image": self.thumbnail_image,
+            "thumbnail_image_variants": self.thumbnail_image_variants,
+        }
+
+    def members(self):
+        if hasattr(self, "prefetched_members"):
+            project_members = self.prefetched_members
+        else:
+            project_members = self.projectmember_set.select_related("user").order_by(
+                "id"
+            )
+
+        return [member.user_info() for member in project_members]
+
+    def summary(self):
+        return {
+            "id": self.id,
+            "title": self.title,
+            "status": self.status,
+            "created_at": self.created_at,
+            "due_date": self.due_date,
+            "thumbnail_image": self.thumbnail_image,
+            "thumbnail_image_variants": self.thumbnail_image_variants,
+            "short_description": self.short_description,
+            "members": self.members(),
         }
 
 
@@ -50,6 +107,14 @@ class ProjectInvite(models.Model):
 
     created_at = models.DateTimeField()
 
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["project", "inviter", "invitee"],
+                name="project_inviter_invitee_unique",
+            ),
+        ]
+
 
 class ProjectMember(models.Model):
     id = models.AutoField(primary_key=True)
@@ -73,6 +138,16 @@ class ProjectMember(models.Model):
             ),
         ]
 
+    def user_info(self):
+        return {
+            "id": self.user.id,
+            "name": self.user.name,
+            "email": self.user.email,
+            "profile_image_link": self.user.profile_image_link,
+            "profile_image_updated_at": self.user.profile_image_updated_at,
+            "profile_image_variants": self.user.profile_image_variants,
+        }
+
 
 class ProjectJoinRequest(models.Model):
     id = models.AutoField(primary_key=True)
@@ -86,3 +161,73 @@ class ProjectJoinRequest(models.Model):
     )
     message = models.CharField(max_length=200)
     created_at = models.DateTimeField()
+
+
+class ProjectStackProfileManager(models.Manager):
+    def refresh(self, project_ids):
+        # 주어진 프로젝트들의 멤버 수, stack 합계를 다시 계산한다. (쿼리 수 고정)
+        from external_histories.models import UserStack
+
+        project_ids = list(
+            Project.objects.filter(id__in=project_ids).values_list("id", flat=True)
+        )
+        if not project_ids:
+            return
+
+        member_counts = dict(
+            ProjectMember.objects.filter(project_id__in=project_ids)
+            .values("project_id")
+            .annotate(count=Count("id"))
+            .values_list("project_id", "count")
+        )
+        stacks_sums = dict(
+            UserStack.objects.filter(user__projectmember__project_id__in=project_ids)
+            .values("user__projectmember__project_id")
+            .annotate(total=Sum("code_amount"))
+            .values_list("user__projectmember__project_id", "total")
+        )
+
+        profiles = []
+        for project_id in project_ids:
+            member_count = member_counts.get(project_id, 0)
+            stacks_sum = stacks_sums.get(project_id) or 0
+            profiles.append(
+                ProjectStackProfile(
+                    project_id=project_id,
+                    member_count=member_count,
+                    stacks_sum=stacks_sum,
+                    stacks_avg=stacks_sum / member_count if member_count else 0,
+                )
+            )
+
+        self.bulk_create(
+            profiles,
+            update_conflicts=True,
+            unique_fields=["project"],
+            update_fields=["member_count", "stacks_sum", "stacks_avg"],
+        )
+
+    def refresh_for_user(self, user_id):
+        self.refresh(
+            ProjectMember.objects.filter(user_id=user_id).values_list(
+                "project_id", flat=True
+            )
+        )
+
+
+class ProjectStackProfile(models.Model):
+    """
+    프로젝트 추천용 프로젝트 멤버 stack 요약.
+    멤버 변경(signal)과 github history 갱신 시 해당 프로젝트만 다시 계산한다.
+    """
+
+    objects = ProjectStackProfileManager()
+
+    project = models.OneToOneField(
+        Project,
+        on_delete=models.CASCADE,
+        primary_key=True,
+    )
+    member_count = models.IntegerField(default=0)
+    stacks_sum = models.BigIntegerField(default=0)
+    stacks_avg = models.FloatField(default=0, db_index=True)
@@ -0,0 +1,158 @@
+import time
+from functools import wraps
+
+from common.http_model import SimpleFailResponse
+from django.conf import settings
+from django.core.cache import cache
+from django.http import JsonResponse
+from milestones.models import Milestone
+from projects.models import Project, ProjectMember
+from task_groups.models import TaskGroup
+from tasks.models import Task
+
+MANAGER_ROLES = ("OWNER", "MANAGER")
+
+# 대상 종류 -> (model, 상위 프로젝트 id를 가리키는 field)
+PROJECT_ID_LOOKUPS = {
+    "project": (Project, "id"),
+    "milestone": (Milestone, "project_id"),
+    "task_group": (TaskGroup, "milestone__project_id"),
+    "task": (Task, "task_group__milestone__project_id"),
+}
+
+# 프로젝트 멤버가 아닌 경우를 캐시에 남기기 위한 값 (None은 캐시 miss와 구분되지 않는다.)
+NOT_MEMBER = ""
+
+
+def _role_version_key(project_id, user_id):
+    return f"project:{project_id}:role_version:{user_id}"
+
+
+def _role_cache_key(project_id, user_id, version):
+    return f"project:{project_id}:role:{user_id}:{version}"
+
+
+def _role_version(project_id, user_id):
+    # 역할과 같은 TTL로 두면 방문자마다 key가 영구히 남지 않는다.
+    # (만료되면 새 version으로 역할을 다시 읽을 뿐이다.)
+    key = _role_version_key(project_id, user_id)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, time.time_ns(), settings.PROJECT_ROLE_CACHE_TTL)
+        version = cache.get(key)
+    return version
+
+
+def invalidate_project_role(project_id, user_id):
+    # 삭제 대신 version을 바꾸어, 무효화 전에 DB를 읽은 요청이 뒤늦게 저장한 역할은 읽히지 않게 한다.
+    cache.set(
+        _role_version_key(project_id, user_id),
+        time.time_ns(),
+        settings.PROJECT_ROLE_CACHE_TTL,
+    )
+
+
+class ProjectPermissionResolver:
+    """
+    요청한 사용자의 프로젝트 역할을 구한다.
+    요청 안에서는 결과를 기억하고, 요청 간에는 PROJECT_ROLE_CACHE_TTL 동안 공유 cache에 둔다.
+    (ProjectMember가 바뀌면 commit 이후 signal로 version을 바꾼다.)
+    """
+
+    def __init__(self, user):
+        self.user_id = user.id if user.is_authenticated else None
+        self.project_ids = {}
+        self.roles = {}
+
+    def project_id(self, kind, object_id):
+        """
+        프로젝트, milestone, task group, task의 상위 프로젝트 id. (join 쿼리 1개)
+        대상이 없으면 None.
+        """
+        if (kind, object_id) not in self.project_ids:
+            model, field = PROJECT_ID_LOOKUPS[kind]
+            self.project_ids[(kind, object_id)] = (
+                model.objects.filter(id=object_id).values_list(field, flat=True).first()
+            )
+        return self.project_ids[(kind, object_id)]
+
+    def role(self, project_id):
+        """
+        OWNER, MANAGER, MEMBER 중 하나. 프로젝트 멤버가 아니면 None.
+        """
+        if self.user_id is None or project_id is None:
+            return None
+        if project_id not in self.roles:
+            # DB보다 version을 먼저 읽어야, 읽는 사이 바뀐 역할이 새 version으로 저장되지 않는다.
+            version = _role_version(project_id, self.user_id)
+            key = _role_cache_key(project_id, self.user_id, version)
+            role = cache.get(key)
+            if role is None:
+                role = (
+                    ProjectMember.objects.filter(
+                        project_id=project_id, user_id=self.user_id
+                    )
+                    .values_list("role", flat=True)
+                    .first()
+                ) or NOT_MEMBER
+                cache.set(key, role, settings.PROJECT_ROLE_CACHE_TTL)
+            self.roles[project_id] = role
+        return self.roles[project_id] or None
+
+
+def get_permission_resolver(request):
+    resolver = getattr(request, "_project_permission_resolver", None)
+    if resolver is None:
+        resolver = ProjectPermissionResolver(request.user)
+        request._project_permission_resolver = resolver
+    return resolver
+
+
+def project_role(request, project_id):
+    return get_permission_resolver(request).role(project_id)
+
+
+def project_role_required(kind, not_found_reason, roles=None):
+    """
+    request_id가 가리키는 대상의 상위 프로젝트 멤버만 호출할 수 있는 view method로 만든다.
+    - 대상이 없으면 404 (not_found_reason)
+    - 프로젝트 멤버가 아니면 403 (Permission error)
+    - roles가 주어졌는데 역할이 roles에 없으면 403 (User must OWNER or MANAGER)
+    통과하면 request.project_role에 역할을 둔다.
+    """
+
+    def decorator(method):
+        @wraps(method)
+        def wrapper(self, request, request_id, *args, **kwargs):
+            resolver = get_permission_resolver(request)
+            project_id = resolver.project_id(kind, request_id)
+            if project_id is None:
+                return JsonResponse(
+                    SimpleFailResponse(
+                        success=False, reason=not_found_reason
+                    ).model_dump(),
+                    status=404,
+                )
+
+            role = resolver.role(project_id)
+            if role is None:
+                return JsonResponse(
+                    SimpleFailResponse(
+                        success=False, reason="Permission error"
+                    ).model_dump(),
+                    status=403,
+                )
+            if roles is not None and role not in roles:
+                return JsonResponse(
+                    SimpleFailResponse(
+                        success=False, reason="User must OWNER or MANAGER"
+                    ).model_dump(),
+                    status=403,
+                )
+
+            request.project_role = role
+            return method(self, request, request_id, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
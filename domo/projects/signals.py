@@ -0,0 +1,76 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from milestones.models import Milestone
+from projects.cache import invalidate_projects
+from projects.models import Project, ProjectMember, ProjectStackProfile
+from projects.permissions import invalidate_project_role
+from task_groups.models import TaskGroup
+from users.models import User
+
+# 프로젝트 상세 정보에 포함되는 사용자 field
+PUBLIC_USER_FIELDS = {
+    "name",
+    "email",
+    "profile_image_link",
+    "profile_image_updated_at",
+    "profile_image_variants",
+}
+
+
+@receiver([post_save, post_delete], sender=ProjectMember)
+def refresh_project_stack_profile(sender, instance, **kwargs):
+    # 프로젝트 삭제로 인한 cascade 중일 수 있으므로 commit 이후에 갱신한다.
+    project_id = instance.project_id
+    transaction.on_commit(lambda: ProjectStackProfile.objects.refresh([project_id]))
+
+
+def invalidate_on_commit(project_ids):
+    # commit 전에 무효화하면 다른 요청이 이전 내용을 새 version으로 캐시할 수 있다.
+    transaction.on_commit(lambda: invalidate_projects(project_ids))
+
+
+@receiver([post_save, post_delete], sender=ProjectMember)
+def invalidate_member_role(sender, instance, **kwargs):
+    project_id, user_id = instance.project_id, instance.user_id
+    transaction.on_commit(lambda: invalidate_project_role(project_id, user_id))
+
+
+@receiver([post_save, post_delete], sender=Project)
+def invalidate_project(sender, instance, **kwargs):
+    invalidate_on_commit([instance.id])
+
+
+@receiver([post_save, post_delete], sender=Milestone)
+@receiver([post_save, post_delete], sender=ProjectMember)
+def invalidate_project_of(sender, instance, **kwargs):
+    invalidate_on_commit([instance.project_id])
+
+
+@receiver([post_save, post_delete], sender=TaskGroup)
+def invalidate_task_group_project(sender, instance, **kwargs):
+    # milestone 삭제로 인한 cascade 중이라면 milestone signal이 무효화한다.
+    invalidate_on_commit(
+        list(
+            Milestone.objects.filter(id=instance.milestone_id).values_list(
+                "project_id", flat=True
+            )
+        )
+    )
+
+
+@receiver([post_save, post_delete], sender=User)
+def invalidate_user_projects(sender, instance, update_fields=None, **kwargs):
+    # 로그인 시각 갱신처럼 상세 정보와 무관한 저장은 건너뛴다.
+    if update_fields and not PUBLIC_USER_FIELDS & set(update_fields):
+        return
+    invalidate_on_commit(
+        list(
+            ProjectMember.objects.filter(user_id=instance.id).values_list(
+                "project_id", flat=True
+            )
+        )
+        + list(
+            Project.objects.filter(owner_id=instance.id).values_list("id", flat=True)
+        )
+    )
@@ -0,0 +1,150 @@
+from datetime import datetime, timedelta, timezone
+from unittest import TestCase
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from projects.models import Project, ProjectMember
+from rest_framework.test import APIClient
+from users.models import User
+
+
+class AllInfoQueryCountTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.created_at = datetime.now(tz=timezone.utc)
+        self.url_all_info = reverse("project_all_info")
+
+        self.owner = User.objects.create(
+            email="owner@email.com",
+            password="testpassword",
+            name="owner",
+            created_at=self.created_at,
+        )
+        self.members = [
+            User.objects.create(
+                email=f"member{i}@email.com",
+                password="testpassword",
+                name=f"member{i}",
+                created_at=self.created_at,
+            )
+            for i in range(3)
+        ]
+
+    def tearDown(self):
+        User.objects.all().delete()
+
+    def create_projects(self, count):
+        for i in range(count):
+            project = Project.objects.create(
+                owner=self.owner,
+                title=f"Test Project {i}",
+                created_at=self.created_at,
+            )
+            ProjectMember.objects.create(
+                project=project,
+                user=self.owner,
+                role="OWNER",
+                created_at=self.created_at,
+            )
+            for member in self.members:
+                ProjectMember.objects.create(
+                    project=project,
+                    user=member,
+                    role="MEMBER",
+                    created_at=self.created_at,
+                )
+
+    def count_queries(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.url_all_info, {"page_size": 100})
+        self.assertEqual(response.status_code, 200)
+        return len(context.captured_queries), response.json()
+
+    def test_query_count_does_not_grow(self):
+        # Given: 멤버가 4명인 프로젝트 2개
+        self.create_projects(2)
+        # When: 모든 프로젝트 정보를 요청할 때
+        small_query_count, small_response = self.count_queries()
+
+        # Given: 멤버가 4명인 프로젝트 20개
+        self.create_projects(18)
+        # When: 모든 프로젝트 정보를 요청할 때
+        large_query_count, large_response = self.count_queries()
+
+        # Then: 프로젝트 수와 관계없이 쿼리 수는 일정하다.
+        self.assertEqual(small_response["count"], 2)
+        self.assertEqual(large_response["count"], 20)
+        self.assertEqual(small_query_count, large_query_count)
+        for project in large_response["projects"]:
+            self.assertEqual(len(project["members"]), 4)
+
+
+class AllInfoPaginationTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.created_at = datetime.now(tz=timezone.utc)
+        self.url_all_info = reverse("project_all_info")
+
+        self.owner = User.objects.create(
+            email="owner@email.com",
+            password="testpassword",
+            name="owner",
+            created_at=self.created_at,
+        )
+        # 생성 시각이 같은 프로젝트가 섞여 있어도 id로 순서가 정해진다.
+        self.projects = [
+            Project.objects.create(
+                owner=self.owner,
+                title=f"Test Project {i}",
+                created_at=self.created_at - timedelta(days=i // 2),
+            )
+            for i in range(5)
+        ]
+
+    def tearDown(self):
+        User.objects.all().delete()
+
+    def test_success_follow_cursor(self):
+        # Given: 프로젝트 5개
+        # When: 페이지 크기 2로 다음 커서를 따라가며 요청할 때
+        project_ids = []
+        cursor = None
+        page_count = 0
+        while True:
+            params = {"page_size": 2}
+            if cursor:
+                params["cursor"] = cursor
+            response = self.client.get(self.url_all_info, params)
+            self.assertEqual(response.status_code, 200)
+            page_count += 1
+            project_ids += [project["id"] for project in response.json()["projects"]]
+            cursor = response.json()["next_cursor"]
+            if not cursor:
+                break
+
+        # Then: 모든 프로젝트를 최신순으로 중복 없이 3페이지에 걸쳐 반환한다.
+        expected_ids = [
+            project.id
+            for project in sorted(
+                self.projects, key=lambda p: (p.created_at, p.id), reverse=True
+            )
+        ]
+        self.assertEqual(page_count, 3)
+        self.assertEqual(project_ids, expected_ids)
+
+    def test_fail_invalid_cursor(self):
+        # Given: 프로젝트
+        # When: 잘못된 커서로 요청할 때
+        response = self.client.get(self.url_all_info, {"cursor": "invalid"})
+
+        # Then: 응답 코드는 400이다.
+        self.assertEqual(response.status_code, 400)
+
+    def test_fail_invalid_page_size(self):
+        # Given: 프로젝트
+        # When: 잘못된 페이지 크기로 요청할 때
+        response = self.client.get(self.url_all_info, {"page_size": 0})
+
+        # Then: 응답 코드는 400이다.
+        self.assertEqual(response.status_code, 400)
@@ -3,10 +3,14 @@ from unittest import TestCase
 from unittest.mock import patch
 
 from common.s3.handler import GeneralHandler
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from milestones.models import Milestone
 from projects.models import ProjectMember
 from rest_framework.authtoken.models import Token
 from rest_framework.test import APIClient
+from task_groups.models import TaskGroup
 from users.models import User
 
 
@@ -61,8 +65,9 @@ class CreateProjectTest(TestCase):
     def tearDown(self):
         User.objects.all().delete()
 
+    @patch("common.tasks.generate_image_variants.delay")
     @patch.object(GeneralHandler, "check_resource_links")
-    def test_success(self, mock_s3_handler):
+    def test_success(self, mock_s3_handler, mock_image_variants_delay):
         # Given: 사용자
         # When: 사용자가 프로젝트를 생성할 때
         mock_s3_handler.return_value = True
@@ -77,6 +82,9 @@ class CreateProjectTest(TestCase):
         self.assertEqual(response.json(), self.expected_response)
         self.assertEqual(self.user.project_set.count(), 1)
         self.assertEqual(self.user.projectmember_set.count(), 1)
+        mock_image_variants_delay.assert_called_once_with(
+            "thumbnail", self.user.project_set.get().id, "thumbnail image link"
+        )
 
 
 class ModifyProjectTest(TestCase):
@@ -205,6 +213,7 @@ class GetProjectTest(TestCase):
                 "name": self.user.name,
                 "profile_image_link": None,
                 "profile_image_updated_at": None,
+                "profile_image_variants": None,
             },
             "id": self.project.id,
             "status": "IN_PROGRESS",
@@ -215,6 +224,7 @@ class GetProjectTest(TestCase):
             "created_at": self.time_check_v,
             "due_date": self.time_check_v,
             "thumbnail_image": "thumbnail image link",
+            "thumbnail_image_variants": None,
             "milestones": [],
             "members": [
                 {
@@ -223,6 +233,7 @@ class GetProjectTest(TestCase):
                     "name": self.user.name,
                     "profile_image_link": None,
                     "profile_image_updated_at": None,
+                    "profile_image_variants": None,
                 }
             ],
             "permission": "OWNER",
@@ -246,6 +257,103 @@ class GetProjectTest(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.json(), self.expected_response)
 
+    def test_success_cached(self):
+        # Given: 한 번 조회된 프로젝트
+        url = self.url_get_project
+        self.client.get(url)
+
+        # When: 다시 프로젝트 정보를 요청할 때
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+
+        # Then: 쿼리하지 않는다. (인증과 permission도 캐시된다.)
+        self.assertEqual(response.json(), self.expected_response)
+        self.assertEqual(len(context.captured_queries), 0)
+
+    def test_success_invalidate_on_change(self):
+        # Given: 한 번 조회된 프로젝트
+        url = self.url_get_project
+        self.client.get(url)
+
+        # When: milestone, task group, 사용자 정보가 바뀐 후 다시 요청할 때
+        milestone = Milestone.objects.create(
+            project=self.project,
+            created_by=self.user,
+            subject="Test Milestone",
+            created_at=self.created_at,
+        )
+        response = self.client.get(url)
+        self.assertEqual(response.json()["milestones"][0]["task_groups"], [])
+
+        TaskGroup.objects.create(
+            milestone=milestone,
+            created_by=self.user,
+            title="Test Task Group",
+            created_at=self.created_at,
+        )
+        self.user.name = "modified"
+        self.user.save()
+        response = self.client.get(url)
+
+        # Then: 바뀐 내용을 반환한다.
+        self.assertEqual(
+            response.json()["milestones"][0]["task_groups"], [{"status": "READY"}]
+        )
+        self.assertEqual(response.json()["owner"]["name"], "modified")
+        self.assertEqual(response.json()["members"][0]["name"], "modified")
+
+    def test_success_query_count_does_not_grow(self):
+        # Given: task group이 있는 milestone 수가 다른 프로젝트
+        def count_queries(milestone_count):
+            for _ in range(milestone_count):
+                milestone = Milestone.objects.create(
+                    project=self.project,
+                    created_by=self.user,
+                    subject="Test Milestone",
+                    created_at=self.created_at,
+                )
+                for status in ["READY", "COMPLETED", "COMPLETED"]:
+                    TaskGroup.objects.create(
+                        milestone=milestone,
+                        created_by=self.user,
+                        title="Test Task Group",
+                        status=status,
+                        created_at=self.created_at,
+                    )
+            # When: 캐시되지 않은 프로젝트 정보를 요청할 때
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.get(self.url_get_project)
+            self.assertEqual(
+                response.json()["milestones"][-1]["task_groups"],
+                [{"status": "READY"}, {"status": "COMPLETED"}, {"status": "COMPLETED"}],
+            )
+            return len(context.captured_queries)
+
+        # Then: 쿼리 수는 milestone 수와 관계없이 일정하다. (permission은 미리 캐시해 둔다.)
+        self.client.get(self.url_get_project)
+        self.assertEqual(count_queries(1), count_queries(5))
+
+    def test_success_permission_per_user(self):
+        # Given: 멤버가 조회한 프로젝트
+        url = self.url_get_project
+        self.client.get(url)
+        other_user = User.objects.create(
+            email="other@email.com",
+            password="testpassword",
+            name="other",
+            created_at=self.created_at,
+        )
+        other_token = Token.objects.create(user=other_user)
+
+        # When: 멤버가 아닌 사용자가 요청할 때
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {other_token.key}")
+        response = self.client.get(url)
+
+        # Then: permission만 다르게 반환한다.
+        self.assertEqual(
+            response.json(), {**self.expected_response, "permission": "NOTHING"}
+        )
+
     def test_all_info_success(self):
         # Given: 프로젝트
         # When: 사용자가 모든 프로젝트 정보를 요청할 때
@@ -263,6 +371,7 @@ class GetProjectTest(TestCase):
                     "created_at": self.time_check_v,
                     "due_date": self.time_check_v,
                     "thumbnail_image": "thumbnail image link",
+                    "thumbnail_image_variants": None,
                     "short_description": "Test short description",
                     "members": [
                         {
@@ -271,10 +380,12 @@ class GetProjectTest(TestCase):
                             "name": self.user.name,
                             "profile_image_link": None,
                             "profile_image_updated_at": None,
+                            "profile_image_variants": None,
                         }
                     ],
                 }
             ],
+            "next_cursor": None,
         }
 
         # Then: 응답 코드는 200이고 모든 프로젝트의 정보를 반환한다.
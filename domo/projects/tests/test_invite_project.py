@@ -1,8 +1,11 @@
+import json
 from datetime import datetime, timezone
 from unittest import TestCase
 
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
-from projects.models import ProjectMember
+from projects.models import ProjectInvite, ProjectMember
 from rest_framework.authtoken.models import Token
 from rest_framework.test import APIClient
 from users.models import User
@@ -80,3 +83,58 @@ class InviteProjectTest(TestCase):
         # Then: 응답 코드는 200이고 각 사용자에 대한 초대 성공 여부를 반환한다.
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.json(), self.expected_response)
+
+    def test_success_mixed(self):
+        # Given: 없는 사용자, 이미 멤버인 사용자, 이미 초대한 사용자, 처음 초대하는 사용자들
+        ProjectInvite.objects.create(
+            project=self.project,
+            inviter=self.user_inviter,
+            invitee=self.user_invitee,
+            created_at=self.created_at,
+        )
+        new_invitees = [
+            User.objects.create(
+                email=f"new{i}@email.com",
+                password="testpassword",
+                name="test",
+                created_at=self.created_at,
+            )
+            for i in range(20)
+        ]
+        emails = (
+            ["nobody@email.com", self.user_inviter.email, self.user_invitee.email]
+            + [user.email for user in new_invitees]
+            + [new_invitees[0].email]
+        )
+
+        # When: 한 번에 초대할 때
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.post(
+                self.url_invite_project,
+                {"project_id": self.project.id, "invitee_emails": json.dumps(emails)},
+            )
+
+        # Then: 요청 순서대로 각 사용자의 결과를 반환하고, 초대는 중복 없이 한 번씩 저장된다.
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json()["result"],
+            [
+                {
+                    "invitee_email": "nobody@email.com",
+                    "success": False,
+                    "reason": "User does not exist.",
+                },
+                {
+                    "invitee_email": self.user_inviter.email,
+                    "success": False,
+                    "reason": "User already in project.",
+                },
+            ]
+            + [
+                {"invitee_email": email, "success": True, "reason": None}
+                for email in emails[2:]
+            ],
+        )
+        self.assertEqual(ProjectInvite.objects.filter(project=self.project).count(), 21)
+        # 초대하는 사용자 수와 관계없이 쿼리 수가 일정하다.
+        self.assertLessEqual(len(context.captured_queries), 12)
@@ -0,0 +1,139 @@
+from datetime import datetime, timezone
+from unittest import TestCase
+
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from milestones.models import Milestone
+from projects.models import ProjectMember
+from projects.permissions import (
+    ProjectPermissionResolver,
+    _role_cache_key,
+    _role_version,
+    _role_version_key,
+)
+from task_groups.models import TaskGroup
+from tasks.models import Task
+from users.models import User
+
+
+class ProjectPermissionResolverTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.created_at = datetime.now(tz=timezone.utc)
+        self.user = User.objects.create(
+            email="test@email.com",
+            password="testpassword",
+            name="test",
+            created_at=self.created_at,
+        )
+        self.project = self.user.project_set.create(
+            title="Test Project", created_at=self.created_at
+        )
+        self.member = ProjectMember.objects.create(
+            project=self.project,
+            user=self.user,
+            role="MANAGER",
+            created_at=self.created_at,
+        )
+        milestone = Milestone.objects.create(
+            project=self.project,
+            created_by=self.user,
+            subject="Test Milestone",
+            created_at=self.created_at,
+        )
+        task_group = TaskGroup.objects.create(
+            milestone=milestone,
+            created_by=self.user,
+            title="Test Task Group",
+            created_at=self.created_at,
+        )
+        self.task = Task.objects.create(
+            task_group=task_group,
+            owner=self.user,
+            title="Test Task",
+            created_at=self.created_at,
+        )
+
+    def tearDown(self):
+        User.objects.all().delete()
+        cache.clear()
+
+    def test_success_resolve_project(self):
+        # Given: 프로젝트에 속한 태스크
+        resolver = ProjectPermissionResolver(self.user)
+
+        # When: 태스크의 상위 프로젝트를 구할 때
+        with CaptureQueriesContext(connection) as context:
+            project_id = resolver.project_id("task", self.task.id)
+            resolver.project_id("task", self.task.id)
+
+        # Then: join 쿼리 1개로 구하고, 같은 요청에서는 다시 쿼리하지 않는다.
+        self.assertEqual(project_id, self.project.id)
+        self.assertEqual(len(context.captured_queries), 1)
+        self.assertIsNone(resolver.project_id("task", self.task.id + 1))
+
+    def test_success_role_cached(self):
+        # Given: 역할을 한 번 확인한 사용자
+        ProjectPermissionResolver(self.user).role(self.project.id)
+
+        # When: 다른 요청에서 다시 역할을 확인할 때
+        with CaptureQueriesContext(connection) as context:
+            role = ProjectPermissionResolver(self.user).role(self.project.id)
+
+        # Then: 캐시된 역할을 사용한다.
+        self.assertEqual(role, "MANAGER")
+        self.assertEqual(len(context.captured_queries), 0)
+
+    def test_success_invalidate_on_member_change(self):
+        # Given: 역할이 캐시된 사용자
+        ProjectPermissionResolver(self.user).role(self.project.id)
+
+        # When: 역할이 바뀌거나 프로젝트에서 나갈 때
+        self.member.role = "MEMBER"
+        self.member.save()
+        changed_role = ProjectPermissionResolver(self.user).role(self.project.id)
+        self.member.delete()
+        removed_role = ProjectPermissionResolver(self.user).role(self.project.id)
+
+        # Then: 바뀐 역할을 반환한다.
+        self.assertEqual(changed_role, "MEMBER")
+        self.assertIsNone(removed_role)
+
+    def test_success_ignore_stale_role(self):
+        # Given: 역할이 바뀌기 전에 DB를 읽은 요청
+        version = _role_version(self.project.id, self.user.id)
+        self.member.role = "MEMBER"
+        self.member.save()
+
+        # When: 그 요청이 무효화 이후에 이전 역할을 캐시에 저장할 때
+        cache.set(_role_cache_key(self.project.id, self.user.id, version), "MANAGER")
+        role = ProjectPermissionResolver(self.user).role(self.project.id)
+
+        # Then: 이전 version의 역할은 읽지 않는다.
+        self.assertEqual(role, "MEMBER")
+
+    def test_success_version_expired(self):
+        # Given: 역할이 캐시된 사용자
+        ProjectPermissionResolver(self.user).role(self.project.id)
+
+        # When: version key가 만료된 뒤 역할이 바뀌었을 때
+        cache.delete(_role_version_key(self.project.id, self.user.id))
+        ProjectMember.objects.filter(id=self.member.id).update(role="MEMBER")
+        role = ProjectPermissionResolver(self.user).role(self.project.id)
+
+        # Then: 새 version으로 역할을 다시 읽는다.
+        self.assertEqual(role, "MEMBER")
+
+    def test_anonymous_user(self):
+        # Given: 로그인하지 않은 사용자
+        resolver = ProjectPermissionResolver(AnonymousUser())
+
+        # When: 역할을 확인할 때
+        with CaptureQueriesContext(connection) as context:
+            role = resolver.role(self.project.id)
+
+        # Then: 쿼리 없이 멤버가 아니다.
+        self.assertIsNone(role)
+        self.assertEqual(len(context.captured_queries), 0)
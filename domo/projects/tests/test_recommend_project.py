@@ -2,7 +2,8 @@ from datetime import datetime, timezone
 from unittest import TestCase
 
 from django.urls import reverse
-from projects.models import ProjectMember
+from external_histories.models import UserStack
+from projects.models import ProjectMember, ProjectStackProfile
 from rest_framework.authtoken.models import Token
 from rest_framework.test import APIClient
 from users.models import User
@@ -57,6 +58,7 @@ class RecommendProjectTest(TestCase):
                     "created_at": self.time_check_v,
                     "due_date": self.time_check_v,
                     "thumbnail_image": self.project.thumbnail_image,
+                    "thumbnail_image_variants": None,
                     "short_description": self.project.short_description,
                     "members": [
                         {
@@ -65,6 +67,7 @@ class RecommendProjectTest(TestCase):
                             "name": self.user_owner.name,
                             "profile_image_link": None,
                             "profile_image_updated_at": None,
+                            "profile_image_variants": None,
                         }
                     ],
                 }
@@ -99,3 +102,102 @@ class RecommendProjectTest(TestCase):
         # Then: 응답 코드는 200이고 요청한 프로젝트의 정보를 반환한다.
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.json(), self.expected_response)
+
+
+class RecommendProjectRankingTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.created_at = datetime.now(tz=timezone.utc)
+
+        self.user = self.create_user("user", {"Python": 1000})
+        self.token = Token.objects.create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.token.key}")
+
+        self.url_recommend_project = reverse("project_recommend")
+
+    def create_user(self, name, stacks):
+        user = User.objects.create(
+            email=f"{name}@email.com",
+            password="testpassword",
+            name=name,
+            created_at=self.created_at,
+        )
+        for language, code_amount in stacks.items():
+            UserStack.objects.create(
+                user=user, language=language, code_amount=code_amount
+            )
+        return user
+
+    def create_project(self, title, members):
+        project = members[0].project_set.create(
+            title=title,
+            created_at=self.created_at,
+        )
+        for member in members:
+            ProjectMember.objects.create(
+                project=project,
+                user=member,
+                role="OWNER" if member == members[0] else "MEMBER",
+                created_at=self.created_at,
+            )
+        return project
+
+    def tearDown(self):
+        User.objects.all().delete()
+
+    def test_success_ranking(self):
+        # Given: 멤버 stack 평균이 서로 다른 프로젝트들과 사용자가 속한 프로젝트
+        small = self.create_user("small", {"Python": 100})
+        large = self.create_user("large", {"Python": 1900})
+        huge = self.create_user("huge", {"Python": 9000})
+        far = self.create_project("far", [huge])
+        nearest = self.create_project("nearest", [small, large])  # 평균 1000
+        near = self.create_project("near", [large])
+        self.create_project("mine", [self.user])
+
+        # When: 사용자가 프로젝트 추천을 요청할 때
+        response = self.client.get(self.url_recommend_project)
+
+        # Then: 사용자가 속하지 않은 프로젝트를 평균이 가까운 순서로 반환한다.
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [project["id"] for project in response.json()["projects"]],
+            [nearest.id, near.id, far.id],
+        )
+
+    def test_success_profile_refresh(self):
+        # Given: 멤버가 한 명인 프로젝트
+        member = self.create_user("member", {"Python": 100, "Go": 300})
+        other = self.create_user("other", {"Python": 200})
+        project = self.create_project("project", [member])
+        self.create_project("other project", [member, other])
+
+        # When: 멤버가 추가되고 삭제될 때
+        profile = ProjectStackProfile.objects.get(project=project)
+        self.assertEqual((profile.member_count, profile.stacks_sum), (1, 400))
+
+        joined = ProjectMember.objects.create(
+            project=project, user=other, role="MEMBER", created_at=self.created_at
+        )
+        profile.refresh_from_db()
+        self.assertEqual((profile.member_count, profile.stacks_sum), (2, 600))
+        self.assertEqual(profile.stacks_avg, 300)
+
+        joined.delete()
+
+        # Then: 프로젝트의 멤버 stack 요약이 갱신된다.
+        profile.refresh_from_db()
+        self.assertEqual((profile.member_count, profile.stacks_sum), (1, 400))
+
+    def test_success_profile_removed_with_project(self):
+        # Given: 프로젝트
+        member = self.create_user("member", {"Python": 100})
+        project = self.create_project("project", [member])
+
+        # When: 프로젝트가 삭제될 때
+        project.delete()
+
+        # Then: 프로젝트의 stack 요약도 삭제된다.
+        self.assertFalse(
+            ProjectStackProfile.objects.filter(project_id=project.id).exists()
+        )
@@ -1,7 +1,10 @@
 from datetime import datetime, timezone
 from unittest import TestCase
 
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from external_histories.models import UserStack
 from projects.models import ProjectMember
 from rest_framework.authtoken.models import Token
 from rest_framework.test import APIClient
@@ -81,3 +84,88 @@ class UserRecommendForProjectTest(TestCase):
         # Then: 응답 코드는 200이고 요청한 프로젝트의 정보를 반환한다.
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.json(), self.expected_response)
+
+
+class UserRecommendForProjectRankingTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.created_at = datetime.now(tz=timezone.utc)
+
+        self.user_owner = self.create_user("owner", {"Python": 600, "Go": 400})
+        self.project = self.user_owner.project_set.create(
+            title="Test Project",
+            created_at=self.created_at,
+        )
+        ProjectMember.objects.create(
+            project=self.project,
+            user=self.user_owner,
+            role="OWNER",
+            created_at=self.created_at,
+        )
+
+        self.url_user_recommend = reverse(
+            "user_recommend_for_project", args=[self.project.id]
+        )
+
+    def create_user(self, name, stacks):
+        user = User.objects.create(
+            email=f"{name}@email.com",
+            password="testpassword",
+            name=name,
+            created_at=self.created_at,
+        )
+        for language, code_amount in stacks.items():
+            UserStack.objects.create(
+                user=user, language=language, code_amount=code_amount
+            )
+        return user
+
+    def tearDown(self):
+        User.objects.all().delete()
+
+    def test_success_ranking(self):
+        # Given: 프로젝트 멤버의 stack 평균이 1000이고, stack 합계가 다른 사용자들
+        far = self.create_user("far", {"Python": 5000})
+        near = self.create_user("near", {"Python": 900, "Go": 50})
+        nearest = self.create_user("nearest", {"Go": 1000})
+        nothing = self.create_user("nothing", {})
+
+        # When: 프로젝트에 사용자 추천을 요청할 때
+        response = self.client.get(self.url_user_recommend)
+
+        # Then: stack 합계가 평균과 가까운 순서로 반환한다.
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [user["id"] for user in response.json()["users"]],
+            [nearest.id, near.id, nothing.id, far.id],
+        )
+
+    def test_success_top_six(self):
+        # Given: 추천 후보가 10명
+        for i in range(10):
+            self.create_user(f"user{i}", {"Python": i * 100})
+
+        # When: 프로젝트에 사용자 추천을 요청할 때
+        response = self.client.get(self.url_user_recommend)
+
+        # Then: 최대 6명만 반환한다.
+        self.assertEqual(response.json()["count"], 6)
+
+    def test_query_count_does_not_grow(self):
+        # Given: 추천 후보가 2명
+        for i in range(2):
+            self.create_user(f"small{i}", {"Python": i * 100})
+        with CaptureQueriesContext(connection) as small_context:
+            self.client.get(self.url_user_recommend)
+
+        # Given: 추천 후보가 20명
+        for i in range(18):
+            self.create_user(f"large{i}", {"Python": i * 100, "Go": i})
+        # When: 프로젝트에 사용자 추천을 요청할 때
+        with CaptureQueriesContext(connection) as large_context:
+            self.client.get(self.url_user_recommend)
+
+        # Then: 후보 수와 관계없이 쿼리 수는 일정하다.
+        self.assertEqual(
+            len(small_context.captured_queries), len(large_context.captured_queries)
+        )
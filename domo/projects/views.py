@@ -1,22 +1,31 @@
+import heapq
 import json
 import logging
-import random
 from datetime import datetime, timezone
-from operator import itemgetter
+from itertools import chain
 
+from common.auth import CachedTokenAuthentication
 from common.gpt import MilestoneGPT
 from common.http_model import SimpleFailResponse, SimpleSuccessResponse
+from common.pagination import InvalidPageRequest, get_page_size, paginate
 from common.s3.handler import GeneralHandler
+from common.s3.images import image_variant_links
+from common.sampling import pooled_sample
+from common.tasks import enqueue_image_variants
+from django.db.models import FloatField, Sum, Value, prefetch_related_objects
+from django.db.models.functions import Abs, Cast, Coalesce
 from django.db.transaction import atomic
 from django.http import JsonResponse
 from external_histories.models import UserStack
 from milestones.models import Milestone
+from projects.cache import get_public_info
 from projects.http_model import (
     ChangeRoleRequest,
     CreateProjectRequest,
     CreateProjectResponse,
     GetJoinResponse,
     GetProjectAllResponse,
+    GetProjectPageResponse,
     GetProjectResponse,
     KickMemberRequest,
     MakeProjectInviteDetailResponse,
@@ -26,10 +35,17 @@ from projects.http_model import (
     ModifyProjectRequest,
     ReplyJoinRequestModel,
 )
-from projects.models import Project, ProjectInvite, ProjectJoinRequest, ProjectMember
+from projects.models import (
+    Project,
+    ProjectInvite,
+    ProjectJoinRequest,
+    ProjectMember,
+    ProjectStackProfile,
+    members_prefetch,
+)
+from projects.permissions import MANAGER_ROLES, project_role
 from pydantic import ValidationError
 from resources.models import S3ResourceReferenceCheck
-from rest_framework.authentication import TokenAuthentication
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.views import APIView
 from task_groups.models import TaskGroup
@@ -63,7 +79,7 @@ def create_new_project(request_user, request_data):
 
 
 class Info(APIView):
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [IsAuthenticated]
 
     def post(self, request):
@@ -112,14 +128,9 @@ class Info(APIView):
                     ).model_dump(),
                     status=400,
                 )
-            for resource_link in request_data.description_resource_links:
-                try:
-                    S3ResourceReferenceCheck.objects.get(resource_link=resource_link)
-                except S3ResourceReferenceCheck.DoesNotExist:
-                    S3ResourceReferenceCheck.objects.create(
-                        resource_link=resource_link,
-                        owner=request.user,
-                    )
+            S3ResourceReferenceCheck.objects.register(
+                request_data.description_resource_links, request.user
+            )
 
         if thumbnail_image:
             s3_handler = GeneralHandler("resource")
@@ -142,6 +153,10 @@ class Info(APIView):
                 ).model_dump(),
                 status=500,
             )
+        if new_project.thumbnail_image:
+            enqueue_image_variants(
+                "thumbnail", new_project.id, new_project.thumbnail_image
+            )
 
         return JsonResponse(
             CreateProjectResponse(
@@ -170,11 +185,8 @@ class Info(APIView):
                 status=404,
             )
 
-        try:
-            member_role = ProjectMember.objects.get(
-                project=project, user=request.user
-            ).role
-        except ProjectMember.DoesNotExist:
+        member_role = project_role(request, project.id)
+        if member_role is None:
             return JsonResponse(
                 SimpleFailResponse(success=False, reason="Not found").model_dump(),
                 status=404,
@@ -251,28 +263,13 @@ class Info(APIView):
                     ).model_dump(),
                     status=400,
                 )
-            for resource_link in request_data.description_resource_links:
-                try:
-                    S3ResourceReferenceCheck.objects.get(resource_link=resource_link)
-                except S3ResourceReferenceCheck.DoesNotExist:
-                    S3ResourceReferenceCheck.objects.create(
-                        resource_link=resource_link,
-                        owner=request.user,
-                    )
-
-            project_description_resource_links = project.description_resource_links
-            if project_description_resource_links:
-                for resource_link in project_description_resource_links:
-                    ref_check_obj = S3ResourceReferenceCheck.objects.get(
-                        resource_link=resource_link
-                    )
-                    if (
-                        ref_check_obj.resource_link
-                        not in request_data.description_resource_links
-                        and ref_check_obj.owner == request.user
-                    ):
-                        ref_check_obj.delete()
-                        s3_handler.remove_resource(resource_link)
+            released_resource_links = S3ResourceReferenceCheck.objects.reconcile(
+                project.description_resource_links,
+                request_data.description_resource_links,
+                request.user,
+            )
+            for resource_link in released_resource_links:
+                s3_handler.remove_resource(resource_link)
 
         try:
             project.title = request_data.title or project.title
@@ -285,11 +282,18 @@ class Info(APIView):
                 request_data.description_resource_links
                 or project.description_resource_links
             )
-            project.thumbnail_image = (
-                request_data.thumbnail_image or project.thumbnail_image
-            )
+            if request_data.thumbnail_image:
+                s3_handler = GeneralHandler("resource")
+                for variant_link in image_variant_links(
+                    project.thumbnail_image_variants
+                ):
+                    s3_handler.remove_resource(variant_link)
+                project.thumbnail_image = request_data.thumbnail_image
+                project.thumbnail_image_variants = None
             project.due_date = request_data.due_date or project.due_date
             project.save()
+            if request_data.thumbnail_image:
+                enqueue_image_variants("thumbnail", project.id, project.thumbnail_image)
 
         except Exception as e:
             logging.error(e)
@@ -327,11 +331,8 @@ class Info(APIView):
                 status=404,
             )
 
-        try:
-            member_role = ProjectMember.objects.get(
-                project=project, user=request.user
-            ).role
-        except ProjectMember.DoesNotExist:
+        member_role = project_role(request, project.id)
+        if member_role is None:
             return JsonResponse(
                 SimpleFailResponse(success=False, reason="Not found").model_dump(),
                 status=404,
@@ -370,20 +371,16 @@ class Info(APIView):
 
         try:
             s3_handler = GeneralHandler("resource")
-            project_description_resource_links = project.description_resource_links
-            if project_description_resource_links:
-                for resource_link in project_description_resource_links:
-                    ref_check_obj = S3ResourceReferenceCheck.objects.get(
-                        resource_link=resource_link
-                    )
-                    ref_check_obj.delete()
-                    s3_handler.remove_resource(resource_link)
+            released_resource_links = S3ResourceReferenceCheck.objects.release(
+                project.description_resource_links
+            )
+            for resource_link in released_resource_links:
+                s3_handler.remove_resource(resource_link)
             if project.thumbnail_image:
-                ref_check_obj = S3ResourceReferenceCheck.objects.get(
-                    resource_link=project.thumbnail_image
-                )
-                ref_check_obj.delete()
+                S3ResourceReferenceCheck.objects.release([project.thumbnail_image])
                 s3_handler.remove_resource(project.thumbnail_image)
+            for variant_link in image_variant_links(project.thumbnail_image_variants):
+                s3_handler.remove_resource(variant_link)
 
             project.delete()
 
@@ -405,12 +402,11 @@ class Info(APIView):
 
 
 class PublicInfo(APIView):
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
 
     def get(self, request, project_id):
-        try:
-            project = Project.objects.get(id=project_id)
-        except Project.DoesNotExist:
+        public_info = get_public_info(project_id)
+        if public_info is None:
             return JsonResponse(
                 SimpleFailResponse(
                     success=False, reason="Can't find project."
@@ -418,64 +414,21 @@ class PublicInfo(APIView):
                 status=404,
             )
 
-        try:
-            member_role = ProjectMember.objects.get(
-                project=project, user=request.user
-            ).role
-        except:
-            member_role = "NOTHING"
-
-        owner_data = {
-            "id": project.owner.id,
-            "email": project.owner.email,
-            "name": project.owner.name,
-            "profile_image_link": project.owner.profile_image_link,
-            "profile_image_updated_at": project.owner.profile_image_updated_at,
-        }
-
-        milestones = Milestone.objects.filter(project_id=project.id)
-        milestones_data = []
-        for milestone in milestones:
-            milestones_data.append(milestone.simple_info())
-
-        project_members = ProjectMember.objects.filter(project=project)
-
-        project_member_datas = []
-
-        for member in project_members:
-            project_member_data = {
-                "id": member.user.id,
-                "name": member.user.name,
-                "email": member.user.email,
-                "profile_image_link": member.user.profile_image_link,
-                "profile_image_updated_at": member.user.profile_image_updated_at,
-            }
-
-            project_member_datas.append(project_member_data)
+        # 사용자마다 다른 permission만 매 요청마다 확인한다.
+        member_role = project_role(request, project_id)
 
         return JsonResponse(
             GetProjectResponse(
                 success=True,
-                owner=owner_data,
-                id=project.id,
-                status=project.status,
-                title=project.title,
-                short_description=project.short_description,
-                description=project.description,
-                description_resource_links=project.description_resource_links,
-                created_at=project.created_at,
-                due_date=project.due_date,
-                thumbnail_image=project.thumbnail_image,
-                milestones=milestones_data,
-                members=project_member_datas,
-                permission=member_role,
+                **public_info,
+                permission=member_role or "NOTHING",
             ).model_dump(),
             status=200,
         )
 
 
 class Invite(APIView):
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [IsAuthenticated]
 
     @atomic
@@ -505,9 +458,7 @@ class Invite(APIView):
                 status=404,
             )
 
-        if not ProjectMember.objects.filter(
-            project_id=project_id, user_id=request.user.id
-        ).exists():
+        if project_role(request, request_data.project_id) is None:
             return JsonResponse(
                 SimpleFailResponse(
                     success=False, reason="You are not in requested project."
@@ -515,48 +466,68 @@ class Invite(APIView):
                 status=403,
             )
 
+        # 초대받을 사용자, 이미 멤버인 사용자, 이미 보낸 초대를 각각 쿼리 1개로 구한다.
+        invitee_ids = dict(
+            User.objects.filter(email__in=request_data.invitee_emails).values_list(
+                "email", "id"
+            )
+        )
+        member_ids = set(
+            ProjectMember.objects.filter(
+                project_id=request_data.project_id,
+                user_id__in=invitee_ids.values(),
+            ).values_list("user_id", flat=True)
+        )
+        invited_ids = set(
+            ProjectInvite.objects.filter(
+                project_id=request_data.project_id,
+                inviter_id=request.user.id,
+                invitee_id__in=invitee_ids.values(),
+            ).values_list("invitee_id", flat=True)
+        )
+
         result = []
+        new_invites = {}
         for invitee_email in request_data.invitee_emails:
-            if not User.objects.filter(email=invitee_email).exists():
+            invitee_id = invitee_ids.get(invitee_email)
+            if invitee_id is None:
                 result.append(
                     MakeProjectInviteDetailResponse.create(
                         invitee_email, False, "User does not exist."
                     )
                 )
-            elif ProjectMember.objects.filter(
-                project__id=project_id, user__email=invitee_email
-            ).exists():
+            elif invitee_id in member_ids:
                 result.append(
                     MakeProjectInviteDetailResponse.create(
                         invitee_email, False, "User already in project."
                     )
                 )
             else:
-                try:
-                    invitee_id = User.objects.get(email=invitee_email).id
-                    if not ProjectInvite.objects.filter(
-                        project_id=project_id,
+                if invitee_id not in invited_ids:
+                    new_invites[invitee_id] = ProjectInvite(
+                        project_id=request_data.project_id,
                         inviter_id=request.user.id,
                         invitee_id=invitee_id,
-                    ).exists():
-                        ProjectInvite(
-                            project_id=project_id,
-                            inviter_id=request.user.id,
-                            invitee_id=invitee_id,
-                            created_at=datetime.now(tz=timezone.utc),
-                        ).save()
-                except Exception as e:
-                    logging.error(e)
-                    return JsonResponse(
-                        SimpleFailResponse(
-                            success=False, reason="Error inviting user."
-                        ).model_dump(),
-                        status=500,
+                        created_at=datetime.now(tz=timezone.utc),
                     )
                 result.append(
                     MakeProjectInviteDetailResponse.create(invitee_email, True)
                 )
 
+        try:
+            # 동시에 같은 초대를 보내도 unique constraint로 한 번만 저장된다.
+            ProjectInvite.objects.bulk_create(
+                new_invites.values(), ignore_conflicts=True
+            )
+        except Exception as e:
+            logging.error(e)
+            return JsonResponse(
+                SimpleFailResponse(
+                    success=False, reason="Error inviting user."
+                ).model_dump(),
+                status=500,
+            )
+
         return JsonResponse(
             MakeProjectInviteResponse(result=result).model_dump(),
             status=200,
@@ -564,7 +535,7 @@ class Invite(APIView):
 
 
 class Role(APIView):
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [IsAuthenticated]
 
     def put(self, request, project_id):
@@ -592,11 +563,8 @@ class Role(APIView):
                 status=404,
             )
 
-        try:
-            member_role = ProjectMember.objects.get(
-                project=project, user=request.user
-            ).role
-        except ProjectMember.DoesNotExist:
+        member_role = project_role(request, project.id)
+        if member_role is None:
             return JsonResponse(
                 SimpleFailResponse(
                     success=False, reason="You are not in requested project."
@@ -663,42 +631,29 @@ class Role(APIView):
 
 class AllInfo(APIView):
     def get(self, request):
-        projects = Project.objects.filter().order_by("-created_at")
-
-        project_datas = []
-
-        for project in projects:
-            project_members = ProjectMember.objects.filter(project=project)
-
-            project_member_datas = []
-
-            for member in project_members:
-                project_member_data = {
-                    "id": member.user.id,
-                    "name": member.user.name,
-                    "email": member.user.email,
-                    "profile_image_link": member.user.profile_image_link,
-                    "profile_image_updated_at": member.user.profile_image_updated_at,
-                }
-
-                project_member_datas.append(project_member_data)
-
-            project_data = {
-                "id": project.id,
-                "title": project.title,
-                "status": project.status,
-                "created_at": project.created_at,
-                "due_date": project.due_date,
-                "thumbnail_image": project.thumbnail_image,
-                "short_description": project.short_description,
-                "members": project_member_datas,
-            }
+        try:
+            projects, next_cursor = paginate(
+                Project.objects.with_members(),
+                ordering=("-created_at", "-id"),
+                cursor=request.GET.get("cursor"),
+                page_size=get_page_size(request),
+            )
+        except InvalidPageRequest:
+            return JsonResponse(
+                SimpleFailResponse(
+                    success=False, reason="Invalid request."
+                ).model_dump(),
+                status=400,
+            )
 
-            project_datas.append(project_data)
+        project_datas = [project.summary() for project in projects]
 
         return JsonResponse(
-            GetProjectAllResponse(
-                success=True, count=len(project_datas), projects=project_datas
+            GetProjectPageResponse(
+                success=True,
+                count=len(project_datas),
+                projects=project_datas,
+                next_cursor=next_cursor,
             ).model_dump(),
             status=200,
         )
@@ -706,45 +661,26 @@ class AllInfo(APIView):
 
 class RecommendUserForProject(APIView):
     def recommend_user(self, users, request_project):
-        all_user = []
-
-        for user in users:
-            all_user.append(user)
-
-        project_members = ProjectMember.objects.filter(project=request_project)
-
-        stacks_avg = 0
+        member_count = ProjectMember.objects.filter(project=request_project).count()
+        stacks_sum = UserStack.objects.filter(
+            user__projectmember__project=request_project
+        ).aggregate(total=Sum("code_amount"))["total"]
 
-        for member in project_members:
-            stacks = UserStack.objects.filter(user=member.user)
+        stacks_avg = (stacks_sum or 0) / member_count if member_count else 0
 
-            for stack in stacks:
-                stacks_avg += stack.code_amount
-
-        stacks_avg /= project_members.count()
-
-        similarity = []
-
-        for user in all_user:
-            stacks = UserStack.objects.filter(user=user)
-
-            user_stacks_sum = 0
-            for stack in stacks:
-                user_stacks_sum += stack.code_amount
-
-            ratio = abs(user_stacks_sum - stacks_avg)
-            similarity.append({"user": user, "ratio": ratio})
-
-        sorted_data = sorted(similarity, key=itemgetter("ratio"))
-
-        recommended_user = []
-
-        for data in sorted_data:
-            if len(recommended_user) >= 6:
-                break
-            recommended_user.append(data["user"])
-
-        return recommended_user
+        # 사용자별 stack 합계와 거리를 DB에서 계산하고 가까운 6명만 가져온다.
+        return list(
+            users.annotate(
+                stacks_sum=Coalesce(Sum("userstack__code_amount"), 0),
+            )
+            .annotate(
+                ratio=Abs(
+                    Cast("stacks_sum", FloatField())
+                    - Value(stacks_avg, output_field=FloatField())
+                ),
+            )
+            .order_by("ratio", "id")[:6]
+        )
 
     def get(self, request, project_id):
         try:
@@ -787,57 +723,42 @@ class RecommendUserForProject(APIView):
 
 
 class RecommendProject(APIView):
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
 
     def recommend_project_public(self, projects):
-        all_project = []
-
-        for project in projects:
-            all_project.append(project)
-
-        count = 6
-
-        if len(all_project) < 6:
-            count = len(all_project)
-
-        recommended_project = random.sample(all_project, count)
-
-        return recommended_project
+        return pooled_sample("projects", projects, 6)
 
     def recommend_project(self, projects, request_user):
-        stacks = UserStack.objects.filter(user=request_user)
-
-        user_stacks_sum = 0
-        for stack in stacks:
-            user_stacks_sum += stack.code_amount
-
-        similarity = []
-
-        for project in projects:
-            project_members = ProjectMember.objects.filter(project=project)
-
-            stacks_avg = 0
-
-            for member in project_members:
-                stacks = UserStack.objects.filter(user=member.user)
-
-                for stack in stacks:
-                    stacks_avg += stack.code_amount
-
-            stacks_avg /= project_members.count()
-            ratio = abs(user_stacks_sum - stacks_avg)
-            similarity.append({"project": project, "ratio": ratio})
-
-        sorted_data = sorted(similarity, key=itemgetter("ratio"))
+        user_stacks_sum = (
+            UserStack.objects.filter(user=request_user).aggregate(
+                total=Sum("code_amount")
+            )["total"]
+            or 0
+        )
 
-        recommended_project = []
+        profiles = ProjectStackProfile.objects.select_related("project").filter(
+            project__in=projects, member_count__gt=0
+        )
 
-        for data in sorted_data:
-            if len(recommended_project) >= 6:
-                break
-            recommended_project.append(data["project"])
+        # stacks_avg 인덱스를 따라 사용자 합계의 위/아래로 6개씩만 읽고,
+        # 그 중 가장 가까운 6개를 고른다. (프로젝트 수와 무관)
+        above = profiles.filter(stacks_avg__gte=user_stacks_sum).order_by("stacks_avg")[
+            :6
+        ]
+        below = profiles.filter(stacks_avg__lt=user_stacks_sum).order_by("-stacks_avg")[
+            :6
+        ]
+
+        nearest = heapq.nsmallest(
+            6,
+            chain(above, below),
+            key=lambda profile: (
+                abs(profile.stacks_avg - user_stacks_sum),
+                profile.project_id,
+            ),
+        )
 
-        return recommended_project
+        return [profile.project for profile in nearest]
 
     def get(self, request):
         try:
@@ -847,36 +768,9 @@ class RecommendProject(APIView):
             projects = Project.objects.all()
             recommended_project = self.recommend_project_public(projects)
 
-        project_datas = []
-
-        for project in recommended_project:
-            project_members = ProjectMember.objects.filter(project=project)
-
-            project_member_datas = []
-
-            for member in project_members:
-                project_member_data = {
-                    "id": member.user.id,
-                    "name": member.user.name,
-                    "email": member.user.email,
-                    "profile_image_link": member.user.profile_image_link,
-                    "profile_image_updated_at": member.user.profile_image_updated_at,
-                }
-
-                project_member_datas.append(project_member_data)
-
-            project_data = {
-                "id": project.id,
-                "title": project.title,
-                "status": project.status,
-                "created_at": project.created_at,
-                "due_date": project.due_date,
-                "thumbnail_image": project.thumbnail_image,
-                "short_description": project.short_description,
-                "members": project_member_datas,
-            }
+        prefetch_related_objects(recommended_project, members_prefetch())
 
-            project_datas.append(project_data)
+        project_datas = [project.summary() for project in recommended_project]
 
         return JsonResponse(
             GetProjectAllResponse(
@@ -887,7 +781,7 @@ class RecommendProject(APIView):
 
 
 class Kick(APIView):
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [IsAuthenticated]
 
     def delete(self, request, project_id):
@@ -903,20 +797,17 @@ class Kick(APIView):
                 status=400,
             )
 
-        try:
-            requester = ProjectMember.objects.get(
-                project_id=project_id, user=request.user
-            )
-            will_kick_member = ProjectMember.objects.get(
-                project_id=project_id, user__email=request_data.user_email
-            )
-        except ProjectMember.DoesNotExist:
+        requester_role = project_role(request, project_id)
+        will_kick_member = ProjectMember.objects.filter(
+            project_id=project_id, user__email=request_data.user_email
+        ).first()
+        if requester_role is None or will_kick_member is None:
             return JsonResponse(
                 SimpleFailResponse(success=False, reason="Not Found.").model_dump(),
                 status=404,
             )
 
-        if requester.role == "MEMBER":
+        if requester_role == "MEMBER":
             return JsonResponse(
                 SimpleFailResponse(
                     success=False, reason="You must OWNER or MANAGER."
@@ -950,15 +841,11 @@ class Kick(APIView):
 
 
 class MakeJoinRequest(APIView):
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [IsAuthenticated]
 
     def get(self, request, project_id):
-        try:
-            user = ProjectMember.objects.get(project_id=project_id, user=request.user)
-            if user.role == "MEMBER":
-                raise ProjectMember.DoesNotExist
-        except ProjectMember.DoesNotExist:
+        if project_role(request, project_id) not in MANAGER_ROLES:
             return JsonResponse(
                 SimpleFailResponse(
                     success=False, reason="Invalid request."
@@ -966,7 +853,9 @@ class MakeJoinRequest(APIView):
                 status=403,
             )
 
-        join_requests = ProjectJoinRequest.objects.filter(project_id=project_id)
+        join_requests = ProjectJoinRequest.objects.filter(
+            project_id=project_id
+        ).select_related("user")
         join_request_datas = []
 
         for join_request in join_requests:
@@ -1001,9 +890,7 @@ class MakeJoinRequest(APIView):
                 status=404,
             )
 
-        if ProjectMember.objects.filter(
-            project_id=project_id, user_id=request.user.id
-        ).exists():
+        if project_role(request, project.id) is not None:
             return JsonResponse(
                 SimpleFailResponse(
                     success=False, reason="You are already in project."
@@ -1036,7 +923,7 @@ class MakeJoinRequest(APIView):
 
 
 class ReplyJoinRequest(APIView):
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [IsAuthenticated]
 
     def post(self, request):
@@ -1058,16 +945,13 @@ class ReplyJoinRequest(APIView):
                 status=400,
             )
 
-        try:
-            join_request_obj = ProjectJoinRequest.objects.get(
-                id=request_data.join_request_id
-            )
-            user = ProjectMember.objects.get(
-                project=join_request_obj.project, user=request.user
-            )
-            if user.role == "MEMBER":
-                raise ProjectMember.DoesNotExist
-        except (ProjectJoinRequest.DoesNotExist, ProjectMember.DoesNotExist):
+        join_request_obj = ProjectJoinRequest.objects.filter(
+            id=request_data.join_request_id
+        ).first()
+        if (
+            join_request_obj is None
+            or project_role(request, join_request_obj.project_id) not in MANAGER_ROLES
+        ):
             return JsonResponse(
                 SimpleFailResponse(
                     success=False, reason="Invalid request."
@@ -1099,7 +983,7 @@ class ReplyJoinRequest(APIView):
 
 
 class MakeMilestoneByGPT(APIView):
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [IsAuthenticated]
 
     def get(self, request, project_id):
@@ -1113,11 +997,7 @@ class MakeMilestoneByGPT(APIView):
                 status=404,
             )
 
-        try:
-            member = ProjectMember.objects.get(project=project, user=request.user)
-            if member.role == "MEMBER":
-                raise ProjectMember.DoesNotExist
-        except ProjectMember.DoesNotExist:
+        if project_role(request, project.id) not in MANAGER_ROLES:
             raise PermissionError
 
         gpt_query = {"project_description": project.description}
@@ -1,14 +1,13 @@
 import logging
 from datetime import datetime, timezone
 
-from common.auth import IsStaff
+from common.auth import CachedTokenAuthentication, IsStaff
 from common.http_model import SimpleFailResponse, SimpleSuccessResponse
 from django.db.transaction import atomic
 from django.http import JsonResponse
 from pydantic import ValidationError
 from reports.http_model import CreateReportRequest, GetAllReportResponse
 from reports.models import Report
-from rest_framework.authentication import TokenAuthentication
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.views import APIView
 from tasks.models import Task
@@ -31,7 +30,7 @@ def create_new_report(request_user, request_task, request_data):
 
 
 class Info(APIView):
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [IsAuthenticated]
 
     def post(self, request, request_id):
@@ -82,7 +81,7 @@ class Info(APIView):
 
 
 class Manage(APIView):
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [IsAuthenticated, IsStaff]
 
     def get(self, request):
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from resources.models import S3ResourceReferenceCheck
+from resources.models import S3DeletionOutbox, S3ResourceReferenceCheck
 
 
 # Register your models here.
@@ -18,3 +18,10 @@ class S3ResourceReferenceCheckAdmin(admin.ModelAdmin):
             },
         ),
     )
+
+
+@admin.register(S3DeletionOutbox)
+class S3DeletionOutboxAdmin(admin.ModelAdmin):
+    list_display = ("id", "key", "attempts", "created_at")
+    search_fields = ("key",)
+    ordering = ("id",)
@@ -0,0 +1,33 @@
+# Generated by Django 4.2.7 on 2026-10-18 13:57
+
+from django.db import migrations, models
+from django.db.models import Count, Min
+
+
+def remove_duplicate_references(apps, schema_editor):
+    # 같은 link의 참조는 가장 먼저 등록된 하나만 남긴다.
+    S3ResourceReferenceCheck = apps.get_model("resources", "S3ResourceReferenceCheck")
+    duplicates = (
+        S3ResourceReferenceCheck.objects.values("resource_link")
+        .annotate(min_id=Min("id"), rows=Count("id"))
+        .filter(rows__gt=1)
+    )
+    for duplicate in duplicates.iterator():
+        S3ResourceReferenceCheck.objects.filter(
+            resource_link=duplicate["resource_link"]
+        ).exclude(id=duplicate["min_id"]).delete()
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("resources", "0002_initial"),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_references, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="s3resourcereferencecheck",
+            name="resource_link",
+            field=models.CharField(max_length=100, unique=True),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.7 on 2026-10-18 13:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("resources", "0003_resource_link_unique"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="S3DeletionOutbox",
+            fields=[
+                ("id", models.AutoField(primary_key=True, serialize=False)),
+                ("key", models.CharField(max_length=255)),
+                ("attempts", models.IntegerField(default=0)),
+                ("created_at", models.DateTimeField()),
+            ],
+        ),
+    ]
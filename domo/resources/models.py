@@ -2,8 +2,62 @@ from django.db import models
 from users.models import User
 
 
+class S3ResourceReferenceCheckManager(models.Manager):
+    def register(self, resource_links, owner):
+        """
+        참조가 없는 link만 owner의 참조로 등록한다.
+        """
+        resource_links = set(resource_links or [])
+        existing = set(
+            self.filter(resource_link__in=resource_links).values_list(
+                "resource_link", flat=True
+            )
+        )
+        self.bulk_create(
+            [
+                self.model(resource_link=resource_link, owner=owner)
+                for resource_link in resource_links - existing
+            ],
+            ignore_conflicts=True,
+        )
+
+    def release(self, resource_links, owner=None):
+        """
+        link의 참조를 삭제하고, 실제로 삭제된 link 목록을 반환한다.
+        owner가 주어지면 owner의 참조만 삭제한다.
+        """
+        references = self.filter(resource_link__in=set(resource_links or []))
+        if owner is not None:
+            references = references.filter(owner=owner)
+        released = list(references.values_list("resource_link", flat=True))
+        if released:
+            self.filter(resource_link__in=released).delete()
+        return released
+
+    def reconcile(self, old_resource_links, new_resource_links, owner):
+        """
+        새 link는 등록하고, 더 이상 쓰이지 않는 owner의 link는 참조를 삭제한다.
+        참조가 삭제된 link 목록을 반환한다.
+        """
+        new_resource_links = set(new_resource_links or [])
+        self.register(new_resource_links, owner)
+        return self.release(
+            set(old_resource_links or []) - new_resource_links, owner=owner
+        )
+
+
 # Create your models here.
 class S3ResourceReferenceCheck(models.Model):
     id = models.AutoField(primary_key=True)
-    resource_link = models.CharField(max_length=100)
+    resource_link = models.CharField(max_length=100, unique=True)
     owner = models.ForeignKey(User, on_delete=models.CASCADE)
+
+    objects = S3ResourceReferenceCheckManager()
+
+
+class S3DeletionOutbox(models.Model):
+    # 삭제할 S3 object. common.tasks.drain_s3_deletion_outbox가 모아서 삭제한다.
+    id = models.AutoField(primary_key=True)
+    key = models.CharField(max_length=255)
+    attempts = models.IntegerField(default=0)
+    created_at = models.DateTimeField()
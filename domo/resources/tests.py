@@ -4,7 +4,10 @@ from unittest.mock import patch
 from urllib.parse import urlencode
 
 from common.s3.handler import GeneralHandler
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from resources.models import S3ResourceReferenceCheck
 from rest_framework.authtoken.models import Token
 from rest_framework.test import APIClient
 from users.models import User
@@ -67,3 +70,76 @@ class PreSignedUrlTest(TestCase):
         # Then: 응답 코드는 200이고 AWS의 응답과 함께 추후 필요한 정보를 반환한다.
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.json(), expected_response)
+
+
+class S3ResourceReferenceCheckTest(TestCase):
+    def setUp(self):
+        self.created_at = datetime.now(tz=timezone.utc)
+        self.user = User.objects.create(
+            email="test@email.com",
+            password="testpassword",
+            name="test",
+            created_at=self.created_at,
+        )
+        self.other_user = User.objects.create(
+            email="other@email.com",
+            password="testpassword",
+            name="other",
+            created_at=self.created_at,
+        )
+
+    def tearDown(self):
+        User.objects.all().delete()
+
+    def links(self, *names):
+        return [f"https://bucket/resources/{name}.png" for name in names]
+
+    def owned_links(self, owner):
+        return set(
+            S3ResourceReferenceCheck.objects.filter(owner=owner).values_list(
+                "resource_link", flat=True
+            )
+        )
+
+    def test_success_register(self):
+        # Given: 다른 사용자가 이미 등록한 link
+        S3ResourceReferenceCheck.objects.register(self.links("a"), self.other_user)
+
+        # When: 중복된 link를 포함해 등록할 때
+        S3ResourceReferenceCheck.objects.register(self.links("a", "b", "b"), self.user)
+
+        # Then: 등록되지 않은 link만 사용자의 참조로 등록한다.
+        self.assertEqual(self.owned_links(self.user), set(self.links("b")))
+        self.assertEqual(self.owned_links(self.other_user), set(self.links("a")))
+
+    def test_success_reconcile(self):
+        # Given: 사용자와 다른 사용자의 link가 섞인 기존 link
+        S3ResourceReferenceCheck.objects.register(self.links("a", "b"), self.user)
+        S3ResourceReferenceCheck.objects.register(self.links("c"), self.other_user)
+
+        # When: 새 link로 바꿀 때
+        released = S3ResourceReferenceCheck.objects.reconcile(
+            self.links("a", "b", "c"), self.links("b", "d"), self.user
+        )
+
+        # Then: 사용자의 더 이상 쓰이지 않는 link만 참조를 삭제한다.
+        self.assertEqual(released, self.links("a"))
+        self.assertEqual(self.owned_links(self.user), set(self.links("b", "d")))
+        self.assertEqual(self.owned_links(self.other_user), set(self.links("c")))
+
+    def test_query_count_does_not_grow(self):
+        # Given: 기존 link
+        def count_queries(count):
+            old_links = self.links(*(f"old{count}-{i}" for i in range(count)))
+            new_links = self.links(*(f"new{count}-{i}" for i in range(count)))
+            S3ResourceReferenceCheck.objects.register(old_links, self.user)
+
+            # When: 모두 새 link로 바꿀 때
+            with CaptureQueriesContext(connection) as context:
+                S3ResourceReferenceCheck.objects.reconcile(
+                    old_links, new_links, self.user
+                )
+            return len(context.captured_queries)
+
+        # Then: 쿼리 수는 link 수와 관계없이 일정하다.
+        self.assertEqual(count_queries(2), count_queries(20))
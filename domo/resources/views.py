@@ -1,17 +1,17 @@
 import logging
 
+from common.auth import CachedTokenAuthentication
 from common.const import ReturnCode
 from common.http_model import SimpleFailResponse
 from common.s3.handler import GeneralHandler
 from django.http import JsonResponse
 from resources.http_model import GetPreSignedUrlResponse
-from rest_framework.authentication import TokenAuthentication
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.views import APIView
 
 
 class PreSignedUrl(APIView):
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [IsAuthenticated]
 
     def __init__(self, **kwargs):
@@ -1,12 +1,15 @@
 from datetime import datetime, timezone
 from unittest import TestCase
 
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from milestones.models import Milestone
 from projects.models import ProjectMember
 from rest_framework.authtoken.models import Token
 from rest_framework.test import APIClient
 from task_groups.models import TaskGroup
+from tasks.models import Task
 from users.models import User
 
 
@@ -100,6 +103,26 @@ class GetTaskGroupTest(TestCase):
         self.assertTrue(response.json()["success"])
         self.assertEqual(response.json(), self.expected_response)
 
+    def test_success_query_count(self):
+        # Given: 태스크가 100개인 태스크 그룹
+        Task.objects.bulk_create(
+            Task(
+                task_group=self.task_group,
+                title=f"Task {i}",
+                owner=self.user,
+                created_at=self.created_at,
+            )
+            for i in range(100)
+        )
+
+        # When: 사용자가 태스크 그룹을 조회할 때
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.url_task_group)
+
+        # Then: 인증, 태스크 그룹(상위 마일스톤, 프로젝트 포함), 태스크, 권한을 한 번씩 조회한다.
+        self.assertEqual(len(response.json()["tasks"]), 100)
+        self.assertEqual(len(context.captured_queries), 4)
+
     def test_not_found(self):
         # Given: 태스크 그룹
         # When: 사용자가 없는 태스크 그룹을 조회할 때
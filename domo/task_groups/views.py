@@ -1,14 +1,14 @@
 import logging
 from datetime import datetime, timezone
 
+from common.auth import CachedTokenAuthentication
 from common.http_model import SimpleFailResponse, SimpleSuccessResponse
 from django.db.models import Q
 from django.db.transaction import atomic
 from django.http import JsonResponse
 from milestones.models import Milestone
-from projects.models import Project, ProjectMember
+from projects.permissions import MANAGER_ROLES, project_role, project_role_required
 from pydantic import ValidationError
-from rest_framework.authentication import TokenAuthentication
 from rest_framework.views import APIView
 from task_groups.http_model import (
     CreateTaskGroupRequest,
@@ -35,8 +35,9 @@ def create_new_task_group(request_user, request_milestone, request_data):
 
 
 class Info(APIView):
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
 
+    @project_role_required("milestone", "Milestone not found", roles=MANAGER_ROLES)
     def post(self, request, request_id):
         milestone_id = request_id
         title = request.data.get("title")
@@ -52,27 +53,6 @@ class Info(APIView):
                 status=404,
             )
 
-        try:
-            project = Project.objects.get(milestone=milestone)
-            member_role = ProjectMember.objects.get(
-                project=project, user=request.user
-            ).role
-        except:
-            return JsonResponse(
-                SimpleFailResponse(
-                    success=False, reason="Permission error"
-                ).model_dump(),
-                status=403,
-            )
-
-        if member_role == "MEMBER":
-            return JsonResponse(
-                SimpleFailResponse(
-                    success=False, reason="User must OWNER or MANAGER"
-                ).model_dump(),
-                status=403,
-            )
-
         try:
             request_data = CreateTaskGroupRequest(
                 title=title,
@@ -115,9 +95,9 @@ class Info(APIView):
             status=201,
         )
 
+    @project_role_required("task_group", "Task group not found", roles=MANAGER_ROLES)
     def put(self, request, request_id):
         task_group_id = request_id
-
         try:
             task_group = TaskGroup.objects.get(id=task_group_id)
         except TaskGroup.DoesNotExist:
@@ -128,29 +108,6 @@ class Info(APIView):
                 status=404,
             )
 
-        milestone = task_group.milestone
-        project = milestone.project
-
-        try:
-            member_role = ProjectMember.objects.get(
-                project=project, user=request.user
-            ).role
-        except:
-            return JsonResponse(
-                SimpleFailResponse(
-                    success=False, reason="Permission error"
-                ).model_dump(),
-                status=403,
-            )
-
-        if member_role == "MEMBER":
-            return JsonResponse(
-                SimpleFailResponse(
-                    success=False, reason="User must OWNER or MANAGER"
-                ).model_dump(),
-                status=403,
-            )
-
         title = request.data.get("title")
         status = request.data.get("status")
         due_date = request.data.get("due_date")
@@ -206,7 +163,9 @@ class Info(APIView):
         task_group_id = request_id
 
         try:
-            task_group = TaskGroup.objects.get(id=task_group_id)
+            task_group = TaskGroup.objects.select_related(
+                "milestone__project", "created_by"
+            ).get(id=task_group_id)
         except TaskGroup.DoesNotExist:
             return JsonResponse(
                 SimpleFailResponse(
@@ -222,27 +181,13 @@ class Info(APIView):
         except TypeError:
             tasks = Task.objects.filter(task_group=task_group, is_public=True)
 
-        task_datas = []
-
-        for task in tasks:
-            task_data = {
-                "id": task.id,
-                "title": task.title,
-                "tags": task.tags,
-                "created_at": task.created_at,
-            }
-
-            task_datas.append(task_data)
+        task_datas = list(
+            tasks.order_by("id").values("id", "title", "tags", "created_at")
+        )
 
         milestone = task_group.milestone
         project = milestone.project
-
-        try:
-            member_role = ProjectMember.objects.get(
-                project=project, user=request.user
-            ).role
-        except:
-            member_role = "NOTHING"
+        member_role = project_role(request, project.id) or "NOTHING"
 
         created_data = {
             "id": task_group.created_by.id,
@@ -273,9 +218,9 @@ class Info(APIView):
             status=200,
         )
 
+    @project_role_required("task_group", "Task group not found", roles=MANAGER_ROLES)
     def delete(self, request, request_id):
         task_group_id = request_id
-
         try:
             task_group = TaskGroup.objects.get(id=task_group_id)
         except TaskGroup.DoesNotExist:
@@ -286,29 +231,6 @@ class Info(APIView):
                 status=404,
             )
 
-        milestone = task_group.milestone
-        project = milestone.project
-
-        try:
-            member_role = ProjectMember.objects.get(
-                project=project, user=request.user
-            ).role
-        except:
-            return JsonResponse(
-                SimpleFailResponse(
-                    success=False, reason="Permission error"
-                ).model_dump(),
-                status=403,
-            )
-
-        if member_role == "MEMBER":
-            return JsonResponse(
-                SimpleFailResponse(
-                    success=False, reason="User must OWNER or MANAGER"
-                ).model_dump(),
-                status=403,
-            )
-
         try:
             tasks_cnt = Task.objects.filter(task_group=task_group).count()
             if tasks_cnt > 0:
@@ -52,3 +52,10 @@ class GetTaskAllResponse(BaseModel):
     success: bool
     total_count: int
     tasks: list
+
+
+class GetTaskFeedResponse(BaseModel):
+    success: bool
+    total_count: int
+    tasks: list
+    next_cursor: Optional[str] = None
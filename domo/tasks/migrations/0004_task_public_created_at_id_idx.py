@@ -0,0 +1,19 @@
+# Generated by Django 4.2.7 on 2026-10-18 13:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("tasks", "0003_alter_task_task_group_delete_taskgroup"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                fields=["is_public", "-created_at", "-id"],
+                name="task_public_created_at_id_idx",
+            ),
+        ),
+    ]
@@ -1,9 +1,31 @@
+from django.core.cache import cache
 from django.db import models
 from task_groups.models import TaskGroup
 from users.models import User
 
+PUBLIC_TASK_COUNT_CACHE_KEY = "tasks:public_count"
+PUBLIC_TASK_COUNT_CACHE_TIMEOUT = 60
+
+
+def public_task_count():
+    # 피드마다 COUNT(*)를 하지 않도록 캐시한다. (Task 변경 시 signal로 무효화)
+    return cache.get_or_set(
+        PUBLIC_TASK_COUNT_CACHE_KEY,
+        lambda: Task.objects.filter(is_public=True).count(),
+        timeout=PUBLIC_TASK_COUNT_CACHE_TIMEOUT,
+    )
+
+
+class TaskQuerySet(models.QuerySet):
+    def public_feed(self):
+        return self.filter(is_public=True).select_related(
+            "owner", "task_group__milestone__project"
+        )
+
 
 class Task(models.Model):
+    objects = TaskQuerySet.as_manager()
+
     id = models.AutoField(primary_key=True)
     owner = models.ForeignKey(User, on_delete=models.CASCADE)
     task_group = models.ForeignKey(
@@ -21,6 +43,14 @@ class Task(models.Model):
 
     is_public = models.BooleanField(default=True)
 
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["is_public", "-created_at", "-id"],
+                name="task_public_created_at_id_idx",
+            ),
+        ]
+
     def detail(self):
         return {
             "id": self.id,
@@ -30,3 +60,27 @@ class Task(models.Model):
             "created_at": self.created_at,
             "is_public": self.is_public,
         }
+
+    def feed_info(self):
+        task_group = self.task_group
+        milestone = task_group.milestone
+        project = milestone.project
+
+        return {
+            "id": self.id,
+            "project": {"id": project.id, "title": project.title},
+            "milestone": {"id": milestone.id, "subject": milestone.subject},
+            "task_group": {"id": task_group.id, "title": task_group.title},
+            "owner": {
+                "id": self.owner.id,
+                "name": self.owner.name,
+                "email": self.owner.email,
+                "profile_image_link": self.owner.profile_image_link,
+                "profile_image_updated_at": self.owner.profile_image_updated_at,
+            },
+            "title": self.title,
+            "description": self.description,
+            "description_resource_links": self.description_resource_links,
+            "created_at": self.created_at,
+            "tags": self.tags,
+        }
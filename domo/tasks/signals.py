@@ -0,0 +1,9 @@
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from tasks.models import PUBLIC_TASK_COUNT_CACHE_KEY, Task
+
+
+@receiver([post_save, post_delete], sender=Task)
+def invalidate_public_task_count(sender, **kwargs):
+    cache.delete(PUBLIC_TASK_COUNT_CACHE_KEY)
@@ -0,0 +1,140 @@
+from datetime import datetime, timedelta, timezone
+from unittest import TestCase
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from milestones.models import Milestone
+from rest_framework.test import APIClient
+from task_groups.models import TaskGroup
+from tasks.models import Task
+from users.models import User
+
+
+class GetTaskFeedTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.created_at = datetime.now(tz=timezone.utc)
+
+        self.user = User.objects.create(
+            email="test@email.com",
+            password="testpassword",
+            name="test",
+            created_at=self.created_at,
+        )
+        self.project = self.user.project_set.create(
+            title="Test Project",
+            created_at=self.created_at,
+        )
+        self.milestone = Milestone.objects.create(
+            project=self.project,
+            created_by=self.user,
+            subject="Test Subject",
+            created_at=self.created_at,
+        )
+        self.task_group = TaskGroup.objects.create(
+            milestone=self.milestone,
+            created_by=self.user,
+            title="Test Task Group",
+            created_at=self.created_at,
+        )
+
+        self.public_tasks = [
+            self.create_task(f"Public Task {i}", True, i // 2) for i in range(7)
+        ]
+        self.private_task = self.create_task("Private Task", False, 0)
+
+        self.url_task_feed = reverse("task_feed")
+
+    def create_task(self, title, is_public, days_ago):
+        return Task.objects.create(
+            task_group=self.task_group,
+            owner=self.user,
+            title=title,
+            created_at=self.created_at - timedelta(days=days_ago),
+            is_public=is_public,
+        )
+
+    def tearDown(self):
+        User.objects.all().delete()
+
+    def test_success_follow_cursor(self):
+        # Given: 공개 태스크 7개와 비공개 태스크 1개
+        # When: 페이지 크기 3으로 다음 커서를 따라가며 피드를 요청할 때
+        task_ids = []
+        cursor = None
+        while True:
+            params = {"page_size": 3}
+            if cursor:
+                params["cursor"] = cursor
+            response = self.client.get(self.url_task_feed, params)
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.json()["total_count"], 7)
+            task_ids += [task["id"] for task in response.json()["tasks"]]
+            cursor = response.json()["next_cursor"]
+            if not cursor:
+                break
+
+        # Then: 공개 태스크만 최신순으로 중복 없이 반환한다.
+        expected_ids = [
+            task.id
+            for task in sorted(
+                self.public_tasks, key=lambda t: (t.created_at, t.id), reverse=True
+            )
+        ]
+        self.assertEqual(task_ids, expected_ids)
+
+    def test_success_task_data(self):
+        # Given: 공개 태스크
+        # When: 피드를 요청할 때
+        response = self.client.get(self.url_task_feed, {"page_size": 1})
+
+        # Then: 태스크와 상위 프로젝트/마일스톤/태스크 그룹 정보를 함께 반환한다.
+        task = response.json()["tasks"][0]
+        self.assertEqual(task["project"]["id"], self.project.id)
+        self.assertEqual(task["milestone"]["id"], self.milestone.id)
+        self.assertEqual(task["task_group"]["id"], self.task_group.id)
+        self.assertEqual(task["owner"]["id"], self.user.id)
+
+    def test_query_count_does_not_grow(self):
+        # Given: 공개 태스크 수가 캐시된 상태
+        self.client.get(self.url_task_feed)
+        # When: 페이지 크기를 달리하여 피드를 요청할 때
+        with CaptureQueriesContext(connection) as small_context:
+            self.client.get(self.url_task_feed, {"page_size": 1})
+        with CaptureQueriesContext(connection) as large_context:
+            self.client.get(self.url_task_feed, {"page_size": 7})
+
+        # Then: 쿼리 수는 페이지 크기와 관계없이 일정하다.
+        self.assertEqual(
+            len(small_context.captured_queries), len(large_context.captured_queries)
+        )
+
+    def test_success_count_invalidated(self):
+        # Given: 공개 태스크 수가 캐시된 상태
+        self.client.get(self.url_task_feed)
+
+        # When: 공개 태스크가 추가된 후 피드를 요청할 때
+        self.create_task("New Public Task", True, 0)
+        response = self.client.get(self.url_task_feed)
+
+        # Then: 변경된 공개 태스크 수를 반환한다.
+        self.assertEqual(response.json()["total_count"], 8)
+
+    def test_success_page(self):
+        # Given: 공개 태스크 7개
+        # When: 두 번째 페이지를 요청할 때
+        response = self.client.get(reverse("task_info_all", args=[2]))
+
+        # Then: 남은 공개 태스크 2개를 반환한다.
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["total_count"], 7)
+        self.assertEqual(len(response.json()["tasks"]), 2)
+
+    def test_fail_invalid_cursor(self):
+        # Given: 공개 태스크
+        # When: 잘못된 커서로 요청할 때
+        response = self.client.get(self.url_task_feed, {"cursor": "invalid"})
+
+        # Then: 응답 코드는 400이다.
+        self.assertEqual(response.status_code, 400)
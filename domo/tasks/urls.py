@@ -12,4 +12,9 @@ urlpatterns = [
         task.Page.as_view(),
         name="task_info_all",
     ),
+    path(
+        "v1/feed",
+        task.Feed.as_view(),
+        name="task_feed",
+    ),
 ]
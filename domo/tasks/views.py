@@ -2,24 +2,27 @@ import json
 import logging
 from datetime import datetime, timezone
 
+from common.auth import CachedTokenAuthentication
 from common.http_model import SimpleFailResponse, SimpleSuccessResponse
+from common.pagination import InvalidPageRequest, get_page_size, paginate
 from common.s3.handler import GeneralHandler
 from django.db.transaction import atomic
 from django.http import JsonResponse
 from projects.models import ProjectMember
+from projects.permissions import project_role, project_role_required
 from pydantic import ValidationError
 from resources.models import S3ResourceReferenceCheck
-from rest_framework.authentication import TokenAuthentication
 from rest_framework.views import APIView
 from task_groups.models import TaskGroup
 from tasks.http_model import (
     CreateTaskRequest,
     CreateTaskResponse,
     GetTaskAllResponse,
+    GetTaskFeedResponse,
     GetTaskResponse,
     ModifyTaskRequest,
 )
-from tasks.models import Task
+from tasks.models import Task, public_task_count
 
 
 @atomic
@@ -40,8 +43,9 @@ def create_new_task(request_user, request_task_group, request_data):
 
 
 class Info(APIView):
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
 
+    @project_role_required("task_group", "Task group not found.")
     def post(self, request, request_id):
         task_group_id = request_id
         title = request.data.get("title")
@@ -68,19 +72,6 @@ class Info(APIView):
                 status=404,
             )
 
-        milestone = task_group.milestone
-        project = milestone.project
-
-        try:
-            ProjectMember.objects.get(project=project, user=request.user)
-        except:
-            return JsonResponse(
-                SimpleFailResponse(
-                    success=False, reason="Permission error"
-                ).model_dump(),
-                status=403,
-            )
-
         try:
             request_data = CreateTaskRequest(
                 task_group=task_group,
@@ -110,14 +101,9 @@ class Info(APIView):
                     ).model_dump(),
                     status=400,
                 )
-            for resource_link in request_data.description_resource_links:
-                try:
-                    S3ResourceReferenceCheck.objects.get(resource_link=resource_link)
-                except S3ResourceReferenceCheck.DoesNotExist:
-                    S3ResourceReferenceCheck.objects.create(
-                        resource_link=resource_link,
-                        owner=request.user,
-                    )
+            S3ResourceReferenceCheck.objects.register(
+                request_data.description_resource_links, request.user
+            )
 
         try:
             new_task = create_new_task(request.user, task_group, request_data)
@@ -211,28 +197,13 @@ class Info(APIView):
                     ).model_dump(),
                     status=400,
                 )
-            for resource_link in request_data.description_resource_links:
-                try:
-                    S3ResourceReferenceCheck.objects.get(resource_link=resource_link)
-                except S3ResourceReferenceCheck.DoesNotExist:
-                    S3ResourceReferenceCheck.objects.create(
-                        resource_link=resource_link,
-                        owner=request.user,
-                    )
-
-            task_description_resource_links = task.description_resource_links
-            if task_description_resource_links:
-                for resource_link in task_description_resource_links:
-                    ref_check_obj = S3ResourceReferenceCheck.objects.get(
-                        resource_link=resource_link
-                    )
-                    if (
-                        ref_check_obj.resource_link
-                        not in request_data.description_resource_links
-                        and ref_check_obj.owner == request.user
-                    ):
-                        ref_check_obj.delete()
-                        s3_handler.remove_resource(resource_link)
+            released_resource_links = S3ResourceReferenceCheck.objects.reconcile(
+                task.description_resource_links,
+                request_data.description_resource_links,
+                request.user,
+            )
+            for resource_link in released_resource_links:
+                s3_handler.remove_resource(resource_link)
 
         try:
             task.title = request_data.title or task.title
@@ -272,7 +243,9 @@ class Info(APIView):
     def get(self, request, request_id):
         task_id = request_id
         try:
-            task = Task.objects.get(id=task_id)
+            task = Task.objects.select_related(
+                "owner", "task_group__milestone__project"
+            ).get(id=task_id)
         except Task.DoesNotExist:
             return JsonResponse(
                 SimpleFailResponse(
@@ -285,11 +258,8 @@ class Info(APIView):
         milestone = task_group.milestone
         project = milestone.project
 
-        try:
-            member_role = ProjectMember.objects.get(
-                project=project, user=request.user
-            ).role
-        except:
+        member_role = project_role(request, project.id)
+        if member_role is None:
             if not task.is_public:
                 return JsonResponse(
                     SimpleFailResponse(
@@ -315,7 +285,9 @@ class Info(APIView):
 
         task_group_data = {"id": task_group.id, "title": task_group.title}
 
-        project_members = ProjectMember.objects.filter(project=project)
+        project_members = ProjectMember.objects.filter(project=project).select_related(
+            "user"
+        )
 
         project_member_datas = []
 
@@ -374,14 +346,12 @@ class Info(APIView):
                 status=403,
             )
 
-        task_description_resource_links = task.description_resource_links
-        if task_description_resource_links:
+        if task.description_resource_links:
             s3_handler = GeneralHandler("resource")
-            for resource_link in task_description_resource_links:
-                ref_check_obj = S3ResourceReferenceCheck.objects.get(
-                    resource_link=resource_link
-                )
-                ref_check_obj.delete()
+            released_resource_links = S3ResourceReferenceCheck.objects.release(
+                task.description_resource_links
+            )
+            for resource_link in released_resource_links:
                 s3_handler.remove_resource(resource_link)
 
         try:
@@ -405,46 +375,50 @@ class Info(APIView):
 
 class Page(APIView):
     def get(self, request, page_idx):
-        all_task = Task.objects.filter(is_public=True).order_by("-created_at")
-        tasks_response = []
-
-        for i in range((page_idx - 1) * 5, page_idx * 5):
-            if i >= len(all_task):
-                break
-            task = all_task[i]
-            task_group = task.task_group
-            milestone = task_group.milestone
-            project = milestone.project
-
-            created_data = {
-                "id": task.owner.id,
-                "name": task.owner.name,
-                "email": task.owner.email,
-                "profile_image_link": task.owner.profile_image_link,
-                "profile_image_updated_at": task.owner.profile_image_updated_at,
-            }
-
-            project_data = {"id": project.id, "title": project.title}
-            milestone_data = {"id": milestone.id, "subject": milestone.subject}
-            task_group_data = {"id": task_group.id, "title": task_group.title}
-
-            tasks_response.append(
-                {
-                    "id": task.id,
-                    "project": project_data,
-                    "milestone": milestone_data,
-                    "task_group": task_group_data,
-                    "owner": created_data,
-                    "title": task.title,
-                    "description": task.description,
-                    "description_resource_links": task.description_resource_links,
-                    "created_at": task.created_at,
-                    "tags": task.tags,
-                }
+        if page_idx < 1:
+            return JsonResponse(
+                SimpleFailResponse(
+                    success=False, reason="Invalid request."
+                ).model_dump(),
+                status=400,
             )
+
+        tasks = Task.objects.public_feed().order_by("-created_at", "-id")[
+            (page_idx - 1) * 5 : page_idx * 5
+        ]
+        tasks_response = [task.feed_info() for task in tasks]
+
         return JsonResponse(
             GetTaskAllResponse(
-                success=True, total_count=len(all_task), tasks=tasks_response
+                success=True, total_count=public_task_count(), tasks=tasks_response
+            ).model_dump(),
+            status=200,
+        )
+
+
+class Feed(APIView):
+    def get(self, request):
+        try:
+            tasks, next_cursor = paginate(
+                Task.objects.public_feed(),
+                ordering=("-created_at", "-id"),
+                cursor=request.GET.get("cursor"),
+                page_size=get_page_size(request),
+            )
+        except InvalidPageRequest:
+            return JsonResponse(
+                SimpleFailResponse(
+                    success=False, reason="Invalid request."
+                ).model_dump(),
+                status=400,
+            )
+
+        return JsonResponse(
+            GetTaskFeedResponse(
+                success=True,
+                total_count=public_task_count(),
+                tasks=[task.feed_info() for task in tasks],
+                next_cursor=next_cursor,
             ).model_dump(),
             status=200,
         )
@@ -24,6 +24,7 @@ class GetUserInfoResponse(BaseModel):
     name: str
     profile_image_link: Optional[str] = None
     profile_image_updated_at: Optional[datetime] = None
+    profile_image_variants: Optional[dict] = None
     provider: str
 
 
@@ -63,6 +64,7 @@ class GetUserTaskInfoResponse(BaseModel):
 class GetSearchResponse(BaseModel):
     success: bool
     result: list[dict]
+    next_cursor: Optional[str] = None
 
 
 class GetProjectInviteResponse(BaseModel):
@@ -70,6 +72,19 @@ class GetProjectInviteResponse(BaseModel):
     result: list[dict]
 
 
+class GetInboxResponse(BaseModel):
+    success: bool
+    count: int
+    result: list[dict]
+    next_cursor: Optional[str] = None
+
+
+class GetInboxCountResponse(BaseModel):
+    success: bool
+    received: int
+    join_requests: int
+
+
 class ReplyProjectInviteRequest(BaseModel):
     project_id: int
     inviter_email: EmailStr
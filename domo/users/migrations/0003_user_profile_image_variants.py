@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-18 14:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("users", "0002_user_profile_image_updated_at"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="user",
+            name="profile_image_variants",
+            field=models.JSONField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,34 @@
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+SEARCH_INDEXES = {
+    "users_user_email_trgm": "email",
+    "users_user_name_trgm": "name",
+}
+
+
+def create_search_indexes(apps, schema_editor):
+    for name, column in SEARCH_INDEXES.items():
+        schema_editor.execute(
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+            f"ON users_user USING gin (lower({column}) gin_trgm_ops)"
+        )
+
+
+def drop_search_indexes(apps, schema_editor):
+    for name in SEARCH_INDEXES:
+        schema_editor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+
+class Migration(migrations.Migration):
+    # 사용자 테이블을 잠그지 않도록 index를 CONCURRENTLY로 만든다.
+    atomic = False
+
+    dependencies = [
+        ("users", "0003_user_profile_image_variants"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+    ]
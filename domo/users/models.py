@@ -2,7 +2,10 @@ from datetime import datetime, timezone
 
 from django.contrib.auth.base_user import AbstractBaseUser, BaseUserManager
 from django.contrib.auth.models import PermissionsMixin
+from django.contrib.postgres.search import TrigramSimilarity
 from django.db import models
+from django.db.models import Case, FloatField, IntegerField, Q, When
+from django.db.models.functions import Cast, Greatest, Lower
 
 
 # Create your models here.
@@ -53,6 +56,41 @@ class UserManager(BaseUserManager):
         user.save(using=self._db)
         return user
 
+    def search(self, query):
+        """
+        email, 이름으로 사용자를 찾는다. (일치, 접두, pg_trgm 유사)
+        관련도 순으로 정렬할 수 있도록 rank(일치 0, 접두 1, 유사 2)와 유사도(similarity)를 붙인다.
+        lower(email), lower(name)의 trigram GIN index를 사용한다. (users 0004 migration)
+        """
+        query = query.lower()
+        exact = Q(email_lower=query) | Q(name_lower=query)
+        prefix = Q(email_lower__startswith=query) | Q(name_lower__startswith=query)
+        similar = Q(email_lower__trigram_similar=query) | Q(
+            name_lower__trigram_similar=query
+        )
+
+        return (
+            self.get_queryset()
+            .annotate(email_lower=Lower("email"), name_lower=Lower("name"))
+            .filter(prefix | similar)
+            .annotate(
+                rank=Case(
+                    When(exact, then=0),
+                    When(prefix, then=1),
+                    default=2,
+                    output_field=IntegerField(),
+                ),
+                # real은 문자열로 받을 때 반올림되어 cursor 비교가 어긋나므로 double로 바꾼다.
+                similarity=Cast(
+                    Greatest(
+                        TrigramSimilarity("email_lower", query),
+                        TrigramSimilarity("name_lower", query),
+                    ),
+                    FloatField(),
+                ),
+            )
+        )
+
 
 class User(AbstractBaseUser, PermissionsMixin):
     objects = UserManager()
@@ -64,6 +102,8 @@ class User(AbstractBaseUser, PermissionsMixin):
     github_link = models.TextField(null=True, blank=True)
     profile_image_link = models.TextField(null=True, blank=True)
     profile_image_updated_at = models.DateTimeField(null=True, blank=True)
+    # {"small": {"webp": link, "jpeg": link}, ...} (비동기로 생성된다.)
+    profile_image_variants = models.JSONField(null=True, blank=True)
     short_description = models.CharField(max_length=50, null=True, blank=True)
     description = models.TextField(null=True, blank=True)
     description_resource_links = models.JSONField(null=True, blank=True)
@@ -56,6 +56,7 @@ class GetProjectInfoTest(TestCase):
                             "email": self.user.email,
                             "profile_image_link": self.user.profile_image_link,
                             "profile_image_updated_at": self.user.profile_image_updated_at,
+                            "profile_image_variants": None,
                         },
                         "status": self.project.status,
                         "title": self.project.title,
@@ -65,6 +66,7 @@ class GetProjectInfoTest(TestCase):
                         "created_at": self.time_check_v,
                         "due_date": self.time_check_v,
                         "thumbnail_image": self.project.thumbnail_image,
+                        "thumbnail_image_variants": None,
                         "members": [
                             {
                                 "id": self.user.id,
@@ -72,6 +74,7 @@ class GetProjectInfoTest(TestCase):
                                 "email": self.user.email,
                                 "profile_image_link": self.user.profile_image_link,
                                 "profile_image_updated_at": self.user.profile_image_updated_at,
+                                "profile_image_variants": None,
                             }
                         ],
                     },
@@ -47,6 +47,7 @@ class GetUserInfoTest(TestCase):
             "name": self.user.name,
             "profile_image_link": self.user.profile_image_link,
             "profile_image_updated_at": self.user.profile_image_updated_at,
+            "profile_image_variants": None,
             "provider": self.user.provider,
         }
 
@@ -0,0 +1,182 @@
+from datetime import datetime, timedelta, timezone
+from unittest import TestCase
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from projects.models import ProjectInvite, ProjectJoinRequest, ProjectMember
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+from users.models import User
+
+
+class InboxTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.created_at = datetime.now(tz=timezone.utc)
+
+        self.manager = self.create_user("manager@email.com")
+        self.invitee = self.create_user("invitee@email.com")
+        self.project = self.manager.project_set.create(
+            title="test",
+            created_at=self.created_at,
+        )
+        ProjectMember.objects.create(
+            project=self.project,
+            user=self.manager,
+            role="OWNER",
+            created_at=self.created_at,
+        )
+
+        self.invites = []
+        self.join_requests = []
+        for i in range(5):
+            user = self.create_user(f"user{i}@email.com")
+            self.invites.append(
+                ProjectInvite.objects.create(
+                    project=self.project,
+                    inviter=self.manager,
+                    invitee=user,
+                    created_at=self.created_at + timedelta(minutes=i),
+                )
+            )
+            self.join_requests.append(
+                ProjectJoinRequest.objects.create(
+                    project=self.project,
+                    user=user,
+                    message=f"message{i}",
+                    created_at=self.created_at + timedelta(minutes=i),
+                )
+            )
+        self.received = ProjectInvite.objects.create(
+            project=self.project,
+            inviter=self.manager,
+            invitee=self.invitee,
+            created_at=self.created_at,
+        )
+
+        self.url_inbox = reverse("user_inbox")
+        self.url_inbox_count = reverse("user_inbox_count")
+
+    def create_user(self, email):
+        return User.objects.create(
+            email=email,
+            password="testpassword",
+            name="test",
+            created_at=self.created_at,
+        )
+
+    def authenticate(self, user):
+        token, _ = Token.objects.get_or_create(user=user)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+
+    def tearDown(self):
+        User.objects.all().delete()
+
+    def test_success_received(self):
+        # Given: 초대를 받은 사용자
+        self.authenticate(self.invitee)
+
+        # When: 받은 초대를 조회할 때
+        response = self.client.get(self.url_inbox, {"box": "received"})
+
+        # Then: 프로젝트와 초대한 사용자 정보를 함께 반환한다.
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json(),
+            {
+                "success": True,
+                "count": 1,
+                "result": [
+                    {
+                        "id": self.received.id,
+                        "project": {
+                            "id": self.project.id,
+                            "title": "test",
+                            "thumbnail_image": None,
+                        },
+                        "inviter": {
+                            "id": self.manager.id,
+                            "name": "test",
+                            "email": "manager@email.com",
+                            "profile_image_link": None,
+                            "profile_image_updated_at": None,
+                        },
+                        "created_at": response.json()["result"][0]["created_at"],
+                    }
+                ],
+                "next_cursor": None,
+            },
+        )
+
+    def test_success_sent_paginated(self):
+        # Given: 초대를 여러 번 보낸 관리자
+        self.authenticate(self.manager)
+
+        # When: 보낸 초대를 나누어 조회할 때
+        first = self.client.get(self.url_inbox, {"box": "sent", "page_size": 4}).json()
+        second = self.client.get(
+            self.url_inbox,
+            {"box": "sent", "page_size": 4, "cursor": first["next_cursor"]},
+        ).json()
+
+        # Then: 최신순으로 빠짐없이 반환한다.
+        # (같은 시각이면 나중에 만든 초대가 먼저 나온다.)
+        self.assertEqual(
+            [item["id"] for item in first["result"] + second["result"]],
+            [invite.id for invite in reversed(self.invites[1:])]
+            + [self.received.id, self.invites[0].id],
+        )
+        self.assertIsNone(second["next_cursor"])
+
+    def test_success_join_requests(self):
+        # Given: 참여 요청을 받은 프로젝트 관리자
+        self.authenticate(self.manager)
+
+        # When: 참여 요청을 조회할 때
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.url_inbox, {"box": "join_requests"})
+
+        # Then: 요청 수와 관계없이 적은 쿼리로 사용자 정보와 함께 반환한다.
+        result = response.json()["result"]
+        self.assertEqual(
+            [item["id"] for item in result],
+            [join_request.id for join_request in reversed(self.join_requests)],
+        )
+        self.assertEqual(result[0]["user"]["email"], "user4@email.com")
+        self.assertEqual(result[0]["message"], "message4")
+        self.assertLessEqual(len(context.captured_queries), 3)
+
+    def test_success_count(self):
+        # Given: 초대를 받은 사용자와 참여 요청을 받은 관리자
+        # When: 처리하지 않은 항목 수를 조회할 때
+        self.authenticate(self.invitee)
+        invitee_count = self.client.get(self.url_inbox_count).json()
+        self.authenticate(self.manager)
+        manager_count = self.client.get(self.url_inbox_count).json()
+
+        # Then: 관리하는 프로젝트의 참여 요청만 센다.
+        self.assertEqual(
+            invitee_count, {"success": True, "received": 1, "join_requests": 0}
+        )
+        self.assertEqual(
+            manager_count, {"success": True, "received": 0, "join_requests": 5}
+        )
+
+    def test_fail_invalid_box(self):
+        # Given: 로그인한 사용자
+        self.authenticate(self.invitee)
+
+        # When: 없는 box를 조회할 때
+        response = self.client.get(self.url_inbox, {"box": "unknown"})
+
+        # Then: 400을 반환한다.
+        self.assertEqual(response.status_code, 400)
+
+    def test_fail_unauthenticated(self):
+        # Given: 로그인하지 않은 사용자
+        # When: inbox를 조회할 때
+        response = self.client.get(self.url_inbox_count)
+
+        # Then: 401을 반환한다.
+        self.assertEqual(response.status_code, 401)
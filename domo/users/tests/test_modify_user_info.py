@@ -41,9 +41,12 @@ class ModifyUserInfoTest(TestCase):
     def tearDown(self):
         User.objects.all().delete()
 
+    @patch("common.tasks.generate_image_variants.delay")
     @patch.object(GeneralHandler, "remove_resource")
     @patch.object(GeneralHandler, "check_resource_links")
-    def test_success_modify_info(self, mock_check_resource_links, _):
+    def test_success_modify_info(
+        self, mock_check_resource_links, _, mock_image_variants_delay
+    ):
         # Given: 사용자
         # When: 사용자 자신의 상세 정보를 수정할 때
         mock_check_resource_links.return_value = True
@@ -58,3 +61,6 @@ class ModifyUserInfoTest(TestCase):
         # Then: 응답 코드는 200이다.
         self.assertEqual(response.status_code, 200)
         self.assertTrue(response.json()["success"])
+        mock_image_variants_delay.assert_called_once_with(
+            "profile", self.user.id, "Link"
+        )
@@ -0,0 +1,115 @@
+from datetime import datetime, timezone
+from unittest import TestCase
+
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+from users.models import User
+
+
+class SearchUserTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.url_user_search = reverse("user_search")
+        created_at = datetime.now(tz=timezone.utc)
+
+        def create_user(email, name, is_staff=False):
+            return User.objects.create(
+                email=email,
+                password="testpassword",
+                name=name,
+                created_at=created_at,
+                is_staff=is_staff,
+            )
+
+        self.prefix_email = create_user("chunsik@email.com", "test")
+        self.exact_name = create_user("other@email.com", "Chun")
+        self.prefix_name = create_user("another@email.com", "chunbae")
+        self.staff = create_user("chunstaff@email.com", "staff", is_staff=True)
+        create_user("unrelated@email.com", "unrelated")
+        self.create_user = create_user
+
+    def tearDown(self):
+        User.objects.all().delete()
+
+    def search(self, **params):
+        return self.client.get(self.url_user_search, params).json()
+
+    def test_success_ordered_by_relevance(self):
+        # Given: 검색어와 이름이 같은 사용자, 검색어로 시작하는 사용자, staff, 무관한 사용자
+        # When: 대소문자가 다른 검색어로 검색할 때
+        response = self.search(**{"request-data": "CHUN"})
+
+        # Then: 일치하는 사용자가 먼저, 같은 단계에서는 더 유사한 사용자가 먼저 나오고,
+        # staff와 무관한 사용자는 제외된다.
+        self.assertTrue(response["success"])
+        self.assertEqual(
+            [user["id"] for user in response["result"]],
+            [self.exact_name.id, self.prefix_name.id, self.prefix_email.id],
+        )
+        self.assertEqual(
+            response["result"][0],
+            {
+                "id": self.exact_name.id,
+                "email": "other@email.com",
+                "name": "Chun",
+                "profile_image_link": None,
+                "profile_image_updated_at": None,
+            },
+        )
+        self.assertIsNone(response["next_cursor"])
+
+    @override_settings(USER_SEARCH_MAX_PAGE_SIZE=2)
+    def test_success_paginated(self):
+        # Given: 검색 결과가 최대 개수보다 많을 때
+        # When: 더 큰 page size로 검색하고 다음 페이지를 요청할 때
+        first = self.search(**{"request-data": "chun", "page_size": 10})
+        second = self.search(**{"request-data": "chun", "cursor": first["next_cursor"]})
+
+        # Then: 최대 개수씩 관련도 순으로 나누어 반환한다.
+        self.assertEqual(
+            [user["id"] for user in first["result"]],
+            [self.exact_name.id, self.prefix_name.id],
+        )
+        self.assertEqual(
+            [user["id"] for user in second["result"]], [self.prefix_email.id]
+        )
+        self.assertIsNone(second["next_cursor"])
+
+    @override_settings(USER_SEARCH_MAX_PAGE_SIZE=2)
+    def test_success_similar_ordered_by_similarity(self):
+        # Given: 검색어로 시작하지 않지만 이름이 비슷한 사용자들
+        less_similar = self.create_user("similar1@email.com", "omobest")
+        most_similar = self.create_user("similar2@email.com", "domobes")
+        similar = self.create_user("similar3@email.com", "xdomobest")
+
+        # When: 검색하고 다음 페이지를 요청할 때
+        first = self.search(**{"request-data": "domobest"})
+        second = self.search(
+            **{"request-data": "domobest", "cursor": first["next_cursor"]}
+        )
+
+        # Then: 유사도가 높은 순으로 나누어 반환한다.
+        self.assertEqual(
+            [user["id"] for user in first["result"] + second["result"]],
+            [most_similar.id, similar.id, less_similar.id],
+        )
+        self.assertIsNone(second["next_cursor"])
+
+    def test_short_query(self):
+        # Given: 최소 길이보다 짧은 검색어
+        # When: 검색할 때
+        response = self.search(**{"request-data": "c"})
+
+        # Then: 검색하지 않고 빈 결과를 반환한다.
+        self.assertEqual(response, {"success": True, "result": [], "next_cursor": None})
+
+    def test_fail_invalid_cursor(self):
+        # Given: 잘못된 cursor
+        # When: 검색할 때
+        response = self.client.get(
+            self.url_user_search, {"request-data": "chun", "cursor": "invalid"}
+        )
+
+        # Then: 400을 반환한다.
+        self.assertEqual(response.status_code, 400)
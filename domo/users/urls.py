@@ -32,6 +32,16 @@ urlpatterns = [
         user.Invitee.as_view(),
         name="user_invitee",
     ),
+    path(
+        "v1/inbox",
+        user.Inbox.as_view(),
+        name="user_inbox",
+    ),
+    path(
+        "v1/inbox/count",
+        user.InboxCount.as_view(),
+        name="user_inbox_count",
+    ),
     path(
         "v1/projects/<int:user_id>",
         user.ProjectInfo.as_view(),
@@ -1,23 +1,34 @@
 import json
-import random
 from datetime import datetime, timezone
 
+from common.auth import CachedTokenAuthentication
 from common.const import ReturnCode
 from common.http_model import SimpleFailResponse, SimpleSuccessResponse
+from common.pagination import InvalidPageRequest, get_page_size, paginate
 from common.s3.handler import GeneralHandler
-from common.tasks import update_github_history
-from django.db.models import Q
+from common.s3.images import image_variant_links
+from common.sampling import pooled_sample
+from common.tasks import enqueue_image_variants, update_github_history
+from django.conf import settings
 from django.db.transaction import atomic
 from django.http import JsonResponse
 from external_histories.models import GithubStatus
 from projects.http_model import GetAllProjectResponse
-from projects.models import Project, ProjectInvite, ProjectMember, User
+from projects.models import (
+    Project,
+    ProjectInvite,
+    ProjectJoinRequest,
+    ProjectMember,
+    User,
+)
+from projects.permissions import MANAGER_ROLES
 from pydantic import ValidationError
 from resources.models import S3ResourceReferenceCheck
-from rest_framework.authentication import TokenAuthentication
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.views import APIView
 from users.http_model import (
+    GetInboxCountResponse,
+    GetInboxResponse,
     GetProjectInviteResponse,
     GetSearchResponse,
     GetUserDetailInfoResponse,
@@ -31,7 +42,7 @@ from users.http_model import (
 
 
 class Info(APIView):
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
@@ -42,6 +53,7 @@ class Info(APIView):
             name=request.user.name,
             profile_image_link=request.user.profile_image_link,
             profile_image_updated_at=request.user.profile_image_updated_at,
+            profile_image_variants=request.user.profile_image_variants,
             provider=request.user.provider,
         )
         return JsonResponse(response.model_dump(), status=200)
@@ -56,7 +68,7 @@ class Info(APIView):
 
 
 class DetailInfo(APIView):
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
@@ -120,28 +132,13 @@ class DetailInfo(APIView):
                     ).model_dump(),
                     status=400,
                 )
-            for resource_link in request_data.description_resource_links:
-                try:
-                    S3ResourceReferenceCheck.objects.get(resource_link=resource_link)
-                except S3ResourceReferenceCheck.DoesNotExist:
-                    S3ResourceReferenceCheck.objects.create(
-                        resource_link=resource_link,
-                        owner=request.user,
-                    )
-
-            user_description_resource_links = request.user.description_resource_links
-            if user_description_resource_links:
-                for resource_link in user_description_resource_links:
-                    ref_check_obj = S3ResourceReferenceCheck.objects.get(
-                        resource_link=resource_link
-                    )
-                    if (
-                        ref_check_obj.resource_link
-                        not in request_data.description_resource_links
-                        and ref_check_obj.owner == request.user
-                    ):
-                        ref_check_obj.delete()
-                        s3_handler.remove_resource(resource_link)
+            released_resource_links = S3ResourceReferenceCheck.objects.reconcile(
+                request.user.description_resource_links,
+                request_data.description_resource_links,
+                request.user,
+            )
+            for resource_link in released_resource_links:
+                s3_handler.remove_resource(resource_link)
 
         # 위와 마찬가지로 profile image가 있을경우, validation check가 필요하다.
         profile_image_modifier = GeneralHandler("profile")
@@ -150,6 +147,10 @@ class DetailInfo(APIView):
             pass
         elif request_data.profile_image_link == "" and request.user.profile_image_link:
             profile_image_modifier.remove_resource(request.user.profile_image_link)
+            for variant_link in image_variant_links(
+                request.user.profile_image_variants
+            ):
+                profile_image_modifier.remove_resource(variant_link)
         else:
             if not profile_image_modifier.check_resource_links(
                 request_data.profile_image_link
@@ -166,6 +167,14 @@ class DetailInfo(APIView):
                 and request_data.profile_image_link != request.user.profile_image_link
             ):
                 profile_image_modifier.remove_resource(request.user.profile_image_link)
+            # 같은 link라도 이미지가 바뀌었을 수 있으므로 작은 이미지를 다시 만든다.
+            for variant_link in image_variant_links(
+                request.user.profile_image_variants
+            ):
+                profile_image_modifier.remove_resource(variant_link)
+            enqueue_image_variants(
+                "profile", request.user.id, request_data.profile_image_link
+            )
 
         if (
             request_data.github_link
@@ -189,7 +198,10 @@ class DetailInfo(APIView):
         if request_data.profile_image_link == "":
             request.user.profile_image_link = None
             request.user.profile_image_updated_at = None
+            request.user.profile_image_variants = None
         else:
+            if request_data.profile_image_link:
+                request.user.profile_image_variants = None
             request.user.profile_image_link = (
                 request_data.profile_image_link or request.user.profile_image_link
             )
@@ -287,27 +299,17 @@ class ProjectInfo(APIView):
                 status=404,
             )
 
-        project_list = Project.objects.filter(
-            projectmember__user=user,
-        ).order_by("created_at")
+        project_list = (
+            Project.objects.with_members()
+            .select_related("owner")
+            .filter(projectmember__user=user)
+            .order_by("created_at")
+        )
 
         projects = []
         for project in project_list:
             project_dict = {"project": project.detail()}
-
-            project_members = ProjectMember.objects.filter(project=project)
-            project_member_datas = []
-
-            for member in project_members:
-                project_member_data = {
-                    "id": member.user.id,
-                    "name": member.user.name,
-                    "email": member.user.email,
-                    "profile_image_link": member.user.profile_image_link,
-                    "profile_image_updated_at": member.user.profile_image_updated_at,
-                }
-                project_member_datas.append(project_member_data)
-            project_dict["project"]["members"] = project_member_datas
+            project_dict["project"]["members"] = project.members()
             projects.append(project_dict)
 
         response = GetAllProjectResponse(
@@ -317,19 +319,23 @@ class ProjectInfo(APIView):
 
 
 class Inviter(APIView):
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
-        invited_project_list = ProjectInvite.objects.filter(
-            inviter=request.user,
-        ).order_by("-created_at")
+        invited_project_list = (
+            ProjectInvite.objects.filter(
+                inviter=request.user,
+            )
+            .select_related("invitee")
+            .order_by("-created_at")
+        )
 
         response_list = []
         for invite_project in invited_project_list:
             response_list.append(
                 {
-                    "project_id": invite_project.project.id,
+                    "project_id": invite_project.project_id,
                     "invitee_email": invite_project.invitee.email,
                     "created_at": invite_project.created_at,
                 }
@@ -340,7 +346,7 @@ class Inviter(APIView):
 
 
 class Invitee(APIView):
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [IsAuthenticated]
 
     def post(self, request):
@@ -399,15 +405,19 @@ class Invitee(APIView):
         )
 
     def get(self, request):
-        invited_project_list = ProjectInvite.objects.filter(
-            invitee=request.user,
-        ).order_by("-created_at")
+        invited_project_list = (
+            ProjectInvite.objects.filter(
+                invitee=request.user,
+            )
+            .select_related("inviter")
+            .order_by("-created_at")
+        )
 
         response_list = []
         for invite_project in invited_project_list:
             response_list.append(
                 {
-                    "project_id": invite_project.project.id,
+                    "project_id": invite_project.project_id,
                     "inviter_email": invite_project.inviter.email,
                     "created_at": invite_project.created_at,
                 }
@@ -416,51 +426,184 @@ class Invitee(APIView):
         return JsonResponse(response.model_dump(), status=200)
 
 
-class Search(APIView):
+def _inbox_user(user):
+    return {
+        "id": user.id,
+        "name": user.name,
+        "email": user.email,
+        "profile_image_link": user.profile_image_link,
+        "profile_image_updated_at": user.profile_image_updated_at,
+    }
+
+
+def _inbox_project(project):
+    return {
+        "id": project.id,
+        "title": project.title,
+        "thumbnail_image": project.thumbnail_image,
+    }
+
+
+def managed_join_requests(user):
+    return ProjectJoinRequest.objects.filter(
+        project_id__in=ProjectMember.objects.filter(
+            user=user, role__in=MANAGER_ROLES
+        ).values("project_id")
+    )
+
+
+# box -> (queryset, 항목 변환)
+INBOXES = {
+    "received": (
+        lambda user: ProjectInvite.objects.filter(invitee=user).select_related(
+            "project", "inviter"
+        ),
+        lambda invite: {
+            "id": invite.id,
+            "project": _inbox_project(invite.project),
+            "inviter": _inbox_user(invite.inviter),
+            "created_at": invite.created_at,
+        },
+    ),
+    "sent": (
+        lambda user: ProjectInvite.objects.filter(inviter=user).select_related(
+            "project", "invitee"
+        ),
+        lambda invite: {
+            "id": invite.id,
+            "project": _inbox_project(invite.project),
+            "invitee": _inbox_user(invite.invitee),
+            "created_at": invite.created_at,
+        },
+    ),
+    "join_requests": (
+        lambda user: managed_join_requests(user).select_related("project", "user"),
+        lambda join_request: {
+            "id": join_request.id,
+            "project": _inbox_project(join_request.project),
+            "user": _inbox_user(join_request.user),
+            "message": join_request.message,
+            "created_at": join_request.created_at,
+        },
+    ),
+}
+
+
+class Inbox(APIView):
+    authentication_classes = [CachedTokenAuthentication]
+    permission_classes = [IsAuthenticated]
+
     def get(self, request):
-        request_data = request.GET.get("request-data")
-        users = (
-            User.objects.filter(
-                Q(email__istartswith=request_data) | Q(name__istartswith=request_data)
+        """
+        받은 초대(received), 보낸 초대(sent), 내가 관리하는 프로젝트의 참여 요청(join_requests)을
+        최신순으로 반환한다.
+        """
+        box = request.GET.get("box", "received")
+        if box not in INBOXES:
+            return JsonResponse(
+                SimpleFailResponse(
+                    success=False, reason="Invalid request."
+                ).model_dump(),
+                status=400,
             )
-            .exclude(is_staff=True)
-            .distinct()
-        )
+        queryset, to_data = INBOXES[box]
 
-        result = []
-        for user in users:
-            result.append(
-                {
-                    "id": user.id,
-                    "email": user.email,
-                    "name": user.name,
-                    "profile_image_link": user.profile_image_link,
-                    "profile_image_updated_at": user.profile_image_updated_at,
-                }
+        try:
+            items, next_cursor = paginate(
+                queryset(request.user),
+                ordering=("-created_at", "-id"),
+                cursor=request.GET.get("cursor"),
+                page_size=get_page_size(request),
+            )
+        except InvalidPageRequest:
+            return JsonResponse(
+                SimpleFailResponse(
+                    success=False, reason="Invalid request."
+                ).model_dump(),
+                status=400,
             )
 
-        result = GetSearchResponse(success=True, result=result)
+        result = [to_data(item) for item in items]
         return JsonResponse(
-            result.model_dump(),
+            GetInboxResponse(
+                success=True,
+                count=len(result),
+                result=result,
+                next_cursor=next_cursor,
+            ).model_dump(),
             status=200,
         )
 
 
-class Recommend(APIView):
-    def recommend_user(self, users):
-        all_user = []
+class InboxCount(APIView):
+    authentication_classes = [CachedTokenAuthentication]
+    permission_classes = [IsAuthenticated]
 
-        for user in users:
-            all_user.append(user)
+    def get(self, request):
+        """
+        처리하지 않은 받은 초대와 참여 요청 수. 행을 읽지 않으므로 자주 polling해도 된다.
+        """
+        return JsonResponse(
+            GetInboxCountResponse(
+                success=True,
+                received=ProjectInvite.objects.filter(invitee=request.user).count(),
+                join_requests=managed_join_requests(request.user).count(),
+            ).model_dump(),
+            status=200,
+        )
 
-        count = 6
 
-        if len(all_user) < 6:
-            count = len(all_user)
+class Search(APIView):
+    def get(self, request):
+        request_data = (request.GET.get("request-data") or "").strip()
+        # 너무 짧은 검색어는 대부분의 사용자와 일치하므로 검색하지 않는다.
+        if len(request_data) < settings.USER_SEARCH_MIN_LENGTH:
+            return JsonResponse(
+                GetSearchResponse(success=True, result=[]).model_dump(),
+                status=200,
+            )
 
-        recommended_user = random.sample(all_user, count)
+        try:
+            users, next_cursor = paginate(
+                User.objects.search(request_data)
+                .exclude(is_staff=True)
+                .values(
+                    "id",
+                    "email",
+                    "name",
+                    "profile_image_link",
+                    "profile_image_updated_at",
+                    "rank",
+                    "similarity",
+                ),
+                ordering=("rank", "-similarity", "id"),
+                cursor=request.GET.get("cursor"),
+                page_size=min(
+                    get_page_size(request), settings.USER_SEARCH_MAX_PAGE_SIZE
+                ),
+            )
+        except InvalidPageRequest:
+            return JsonResponse(
+                SimpleFailResponse(
+                    success=False, reason="Invalid request."
+                ).model_dump(),
+                status=400,
+            )
+
+        for user in users:
+            user.pop("rank")
+            user.pop("similarity")
 
-        return recommended_user
+        result = GetSearchResponse(success=True, result=users, next_cursor=next_cursor)
+        return JsonResponse(
+            result.model_dump(),
+            status=200,
+        )
+
+
+class Recommend(APIView):
+    def recommend_user(self, users):
+        return pooled_sample("users", users, 6)
 
     def get(self, request):
         try: